@@ -68,7 +68,7 @@ from .monitoring import (
     IMetricsCollector, IAlertManager, ILogHandler,
     InMemoryMetricsCollector, ConsoleAlertManager, StructuredLogHandler,
     get_monitoring_system, log_info, log_warning, log_error,
-    record_counter, record_gauge, send_alert
+    record_counter, record_gauge, record_metrics_batch, send_alert
 )
 
 # Configuration Management
@@ -193,6 +193,7 @@ __all__ = [
     "log_warning",
     "log_error",
     "record_metric",
+    "record_metrics_batch",
     "send_alert",
     
     # Configuration Management
@@ -766,25 +766,44 @@ class JusticeCampfire(Campfire, IJusticeCampfire):
         detection_result = await self.detector.process(temp_torch)
         return detection_result.get('violations', [])
     
+    async def detect_violations_batch(self, payloads: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Detect policy violations in many payloads with one call; results follow input order"""
+        now = datetime.utcnow()
+        temp_torches = [
+            Torch(
+                id=f"temp_detect_{i}",
+                sender_valley="system",
+                target_address="detector",
+                payload=content,
+                attachments=[],
+                signature="",
+                timestamp=now
+            )
+            for i, content in enumerate(payloads)
+        ]
+        
+        detection_results = await asyncio.gather(*(self.detector.process(t) for t in temp_torches))
+        return [result.get('violations', []) for result in detection_results]
+    
     async def enforce_policies(self, violations: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Enforce policies based on detected violations"""
-        enforcement_results = []
-        
-        for violation_data in violations:
-            # Convert dict back to Violation object for processing
-            # This is simplified - in production, you'd have proper serialization
-            temp_torch = Torch(
+        # Convert dicts back to torches for processing and enforce them concurrently
+        # This is simplified - in production, you'd have proper serialization
+        now = datetime.utcnow()
+        temp_torches = [
+            Torch(
                 id="temp_enforce",
                 sender_valley=violation_data.get('sender_valley', 'unknown'),
                 target_address="enforcer",
                 payload={},
                 attachments=[],
                 signature="",
-                timestamp=datetime.utcnow()
+                timestamp=now
             )
-            
-            enforcement_result = await self.enforcer.process(temp_torch)
-            enforcement_results.append(enforcement_result)
+            for violation_data in violations
+        ]
+        
+        enforcement_results = list(await asyncio.gather(*(self.enforcer.process(t) for t in temp_torches)))
         
         return {
             'violations_processed': len(violations),
@@ -906,5 +925,14 @@ class JusticeCampfire(Campfire, IJusticeCampfire):
             'active': sanction.active
         }
     
+    async def apply_sanctions_batch(
+        self, sanctions: List[Tuple[Dict[str, Any], SanctionType, Optional[timedelta]]]
+    ) -> List[Dict[str, Any]]:
+        """Apply a sanction for each (violation_data, sanction_type, duration) tuple in one call"""
+        return list(await asyncio.gather(*(
+            self.apply_sanction(violation_data, sanction_type, duration)
+            for violation_data, sanction_type, duration in sanctions
+        )))
+    
     def __repr__(self) -> str:
         return f"JusticeCampfire(running={self._running}, campers={len(self._campers)})"
\ No newline at end of file
@@ -8,6 +8,9 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 from .models import ValleyConfig, CampfireConfig
 
+# libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ConfigManager:
     """Manages configuration loading and validation for valleys and campfires"""
@@ -35,7 +38,7 @@ class ConfigManager:
         
         try:
             with open(manifest_file, 'r', encoding='utf-8') as f:
-                config_data = yaml.safe_load(f)
+                config_data = yaml.load(f, Loader=_YAML_LOADER)
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f"Failed to parse YAML file {manifest_path}: {e}")
         
@@ -71,7 +74,7 @@ class ConfigManager:
         
         try:
             with open(config_file, 'r', encoding='utf-8') as f:
-                config_data = yaml.safe_load(f)
+                config_data = yaml.load(f, Loader=_YAML_LOADER)
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f"Failed to parse YAML file {config_path}: {e}")
         
@@ -209,7 +212,7 @@ class ConfigManager:
         """
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
-                yaml.safe_load(f)
+                yaml.load(f, Loader=_YAML_LOADER)
             return True, None
         except FileNotFoundError:
             return False, f"File not found: {config_path}"
@@ -25,6 +25,9 @@ from datetime import datetime
 import threading
 from contextlib import contextmanager
 
+# libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Configuration Enums
 class ConfigFormat(Enum):
     JSON = "json"
@@ -162,7 +165,7 @@ class FileConfigProvider(IConfigProvider):
                 if src.format == ConfigFormat.JSON:
                     return json.load(f)
                 elif src.format == ConfigFormat.YAML:
-                    return yaml.safe_load(f) or {}
+                    return yaml.load(f, Loader=_YAML_LOADER) or {}
                 elif src.format == ConfigFormat.ENV:
                     return self._parse_env_file(f.read())
                 else:
@@ -702,7 +705,7 @@ async def load_config_from_file(file_path: str, format: ConfigFormat = ConfigFor
         if format == ConfigFormat.JSON:
             return json.load(f)
         if format == ConfigFormat.YAML:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=_YAML_LOADER) or {}
         if format == ConfigFormat.ENV:
             return FileConfigProvider()._parse_env_file(f.read())
     return {}
@@ -5,7 +5,7 @@ Dock gateway implementation for inter-valley communication.
 import asyncio
 import logging
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 import time
 import random
 import uuid
@@ -175,8 +175,11 @@ class Dock(IDock):
             await self._handle_communication_error(e, f"handle_incoming_torch {torch.id}", sender_valley)
             return False
     
-    async def send_torch(self, target_address: str, torch: Torch) -> bool:
-        """Send a torch to the specified target address using federation-aware routing with retry logic"""
+    async def send_torch(self, target_address: str, torch: Torch, confirm: bool = True) -> bool:
+        """Send a torch to the specified target address using federation-aware routing with retry logic
+        
+        With confirm=False, direct MCP sends do not wait for the broker's reply.
+        """
         if not self._running:
             raise RuntimeError("Dock gateway must be started before sending torches")
         
@@ -218,7 +221,10 @@ class Dock(IDock):
                 # Use direct MCP broker communication
                 channel = f"valley:{valley_name}/dock/incoming"
                 message = packaged_torch.dict()
-                success = await self.mcp_broker.publish(channel, message)
+                if confirm:
+                    success = await self.mcp_broker.publish(channel, message)
+                else:
+                    success = await self.mcp_broker.publish(channel, message, confirm=False)
                 if not success:
                     raise RuntimeError(f"Direct MCP routing failed for valley {valley_name}")
             
@@ -241,6 +247,17 @@ class Dock(IDock):
             await self._handle_communication_error(e, f"send_torch to {valley_name}", valley_name)
             return False
     
+    async def send_torches_batch(self, sends: List[Tuple[str, Torch]], confirm: bool = True) -> List[bool]:
+        """Send several (target_address, torch) pairs concurrently; results follow input order.
+        
+        Each torch keeps its own routing and retry handling. With a pipelined MCP
+        broker, the direct publishes issued together share a single round trip.
+        """
+        return list(await asyncio.gather(*(
+            self.send_torch(target_address, torch, confirm=confirm)
+            for target_address, torch in sends
+        )))
+    
     async def broadcast_discovery(self) -> None:
         """Broadcast discovery information to the community with federation capabilities"""
         valley_config = self.valley.get_config()
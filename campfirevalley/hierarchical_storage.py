@@ -718,6 +718,10 @@ class HierarchicalStorageManager:
         """Get metadata for an object"""
         return await self._get_metadata(object_id)
     
+    async def get_objects_metadata(self, object_ids: List[str]) -> Dict[str, StorageMetadata]:
+        """Get metadata for several objects in one lookup; unknown IDs are omitted"""
+        return await self._get_metadata_many(object_ids)
+    
     async def migrate_object(self, object_id: str, target_tier: StorageTier) -> bool:
         """Migrate an object to a different storage tier"""
         
@@ -872,15 +876,41 @@ class HierarchicalStorageManager:
         # Default to archive tier
         return StorageTier.ARCHIVE
     
+    # Columns selected when loading StorageMetadata, in _row_to_metadata order
+    _METADATA_COLUMNS = """
+                    object_id, original_size, compressed_size, compression_type,
+                    checksum, tier, created_at, last_accessed, access_count,
+                    is_deduplicated, dedup_refs, tags, policy_name
+    """
+    
+    # Stay below SQLite's default bound-parameter limit for IN (...) lookups
+    _METADATA_LOOKUP_CHUNK = 500
+    
+    @staticmethod
+    def _row_to_metadata(row) -> StorageMetadata:
+        """Build StorageMetadata from an object_metadata row"""
+        return StorageMetadata(
+            object_id=row[0],
+            original_size=row[1],
+            compressed_size=row[2],
+            compression_type=CompressionType(row[3]),
+            checksum=row[4],
+            tier=StorageTier(row[5]),
+            created_at=datetime.fromisoformat(row[6]),
+            last_accessed=datetime.fromisoformat(row[7]),
+            access_count=row[8],
+            is_deduplicated=bool(row[9]),
+            dedup_refs=row[10],
+            tags=json.loads(row[11]),
+            policy_name=row[12]
+        )
+    
     async def _get_metadata(self, object_id: str) -> Optional[StorageMetadata]:
         """Get metadata for an object from database"""
         
         with sqlite3.connect(self.metadata_db_path) as conn:
-            cursor = conn.execute("""
-                SELECT 
-                    object_id, original_size, compressed_size, compression_type,
-                    checksum, tier, created_at, last_accessed, access_count,
-                    is_deduplicated, dedup_refs, tags, policy_name
+            cursor = conn.execute(f"""
+                SELECT {self._METADATA_COLUMNS}
                 FROM object_metadata 
                 WHERE object_id = ?
             """, (object_id,))
@@ -889,21 +919,26 @@ class HierarchicalStorageManager:
             if not row:
                 return None
             
-            return StorageMetadata(
-                object_id=row[0],
-                original_size=row[1],
-                compressed_size=row[2],
-                compression_type=CompressionType(row[3]),
-                checksum=row[4],
-                tier=StorageTier(row[5]),
-                created_at=datetime.fromisoformat(row[6]),
-                last_accessed=datetime.fromisoformat(row[7]),
-                access_count=row[8],
-                is_deduplicated=bool(row[9]),
-                dedup_refs=row[10],
-                tags=json.loads(row[11]),
-                policy_name=row[12]
-            )
+            return self._row_to_metadata(row)
+    
+    async def _get_metadata_many(self, object_ids: List[str]) -> Dict[str, StorageMetadata]:
+        """Get metadata for several objects over one database connection"""
+        
+        results: Dict[str, StorageMetadata] = {}
+        with sqlite3.connect(self.metadata_db_path) as conn:
+            for start in range(0, len(object_ids), self._METADATA_LOOKUP_CHUNK):
+                chunk = object_ids[start:start + self._METADATA_LOOKUP_CHUNK]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor = conn.execute(f"""
+                    SELECT {self._METADATA_COLUMNS}
+                    FROM object_metadata 
+                    WHERE object_id IN ({placeholders})
+                """, chunk)
+                
+                for row in cursor.fetchall():
+                    results[row[0]] = self._row_to_metadata(row)
+        
+        return results
     
     async def _store_metadata(self, metadata: StorageMetadata, storage_path: str):
         """Store metadata in database"""
@@ -1101,6 +1136,17 @@ class HierarchicalPartyBox(IPartyBox):
         logger.debug(f"Stored attachment {attachment_id} in {metadata.tier.value} tier")
         return attachment_id
     
+    async def store_attachments_batch(self, torch_id: str, attachments: List[Tuple[str, bytes]]) -> List[str]:
+        """Store several (filename, content) attachments for one torch; IDs follow input order
+        
+        Stores run one after another so identical contents in the same batch are
+        still deduplicated against each other.
+        """
+        return [
+            await self.store_attachment_with_torch(torch_id, filename, content)
+            for filename, content in attachments
+        ]
+    
     async def retrieve_attachment(self, attachment_id: str) -> Optional[bytes]:
         """Retrieve an attachment from hierarchical storage"""
         
@@ -1160,9 +1206,10 @@ class HierarchicalPartyBox(IPartyBox):
             object_ids = await self.hsm.list_objects(tags=tags)
         
         # Convert object IDs to attachment info dictionaries
+        metadata_by_id = await self.hsm.get_objects_metadata(object_ids)
         attachments = []
         for object_id in object_ids:
-            metadata = await self.hsm.get_object_metadata(object_id)
+            metadata = metadata_by_id.get(object_id)
             if metadata and metadata.tags:
                 attachment_info = {
                     "attachment_id": object_id,
@@ -1238,6 +1285,14 @@ class HierarchicalPartyBox(IPartyBox):
             "access_patterns": {pattern.value: count for pattern, count in hsm_stats.access_patterns.items()}
         }
     
+    async def get_all_stats(self, torch_id_or_category: str = "all") -> Dict[str, Any]:
+        """List attachments and gather storage statistics in one call"""
+        
+        return {
+            "attachments": await self.list_attachments(torch_id_or_category),
+            "storage_stats": await self.get_storage_stats()
+        }
+    
     async def optimize_storage(self) -> Dict[str, Any]:
         """Optimize storage using HSM"""
         return await self.hsm.optimize_storage()
@@ -75,12 +75,26 @@ class PolicyEngine:
     def __init__(self):
         self.policies: Dict[str, PolicyRule] = {}
         self._request_times: Dict[str, List[float]] = {}
+        # rule id -> conditions pre-parsed by _compile_rule; re-add a rule after changing them
+        self._compiled: Dict[str, Any] = {}
 
     def add_policy(self, rule: PolicyRule) -> None:
         self.policies[rule.id] = rule
+        self._compiled[rule.id] = self._compile_rule(rule)
 
     def remove_policy(self, rule_id: str) -> None:
         self.policies.pop(rule_id, None)
+        self._compiled.pop(rule_id, None)
+
+    @staticmethod
+    def _compile_rule(rule: PolicyRule) -> Any:
+        """Pre-parse a rule's conditions so evaluation only does the comparisons."""
+        if rule.violation_type == ViolationType.RATE_LIMIT:
+            return (int(rule.conditions.get("max_requests", 10)), int(rule.conditions.get("time_window", 60)))
+        if rule.violation_type == ViolationType.CONTENT_VIOLATION:
+            patterns = rule.conditions.get("blocked_patterns") or []
+            return tuple(p.lower() for p in patterns if isinstance(p, str))
+        return None
 
     def get_policy(self, rule_id: str) -> Optional[PolicyRule]:
         return self.policies.get(rule_id)
@@ -100,13 +114,16 @@ class PolicyEngine:
         if isinstance(torch.data, dict):
             payload = torch.data
         message = str(payload.get("message") or payload.get("text") or "")
+        message_lower = message.lower()
 
         for rule in list(self.policies.values()):
             if not rule.enabled:
                 continue
+            if rule.id not in self._compiled:
+                self._compiled[rule.id] = self._compile_rule(rule)
+            compiled = self._compiled[rule.id]
             if rule.violation_type == ViolationType.RATE_LIMIT:
-                max_req = int(rule.conditions.get("max_requests", 10))
-                window = int(rule.conditions.get("time_window", 60))
+                max_req, window = compiled
                 if self._check_rate_limit(sender_id, max_req, window):
                     violations.append(
                         ViolationEvent(
@@ -121,9 +138,9 @@ class PolicyEngine:
                         )
                     )
             elif rule.violation_type == ViolationType.CONTENT_VIOLATION:
-                patterns = rule.conditions.get("blocked_patterns") or []
-                hit = any(p.lower() in message.lower() for p in patterns if isinstance(p, str))
+                hit = any(p in message_lower for p in compiled)
                 if hit:
+                    patterns = rule.conditions.get("blocked_patterns") or []
                     violations.append(
                         ViolationEvent(
                             id=f"viol_{int(time.time()*1000)}",
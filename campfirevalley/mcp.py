@@ -16,6 +16,17 @@ try:
 except ImportError:
     REDIS_AVAILABLE = False
 
+try:
+    import orjson
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,20 +41,45 @@ class RedisMCPBroker(IMCPBroker):
     - Connection pooling and failover
     """
     
-    def __init__(self, connection_string: str = 'redis://localhost:6379', valley_name: str = None):
+    # Upper bound on writes coalesced into one pipeline by the "pipelined" transport
+    MAX_PIPELINE_BATCH = 128
+    
+    # Seconds to wait for Redis to confirm a subscription when confirm=True
+    SUBSCRIBE_CONFIRM_TIMEOUT = 5.0
+    
+    # Seconds the listener waits for a pub/sub message; kept below socket_timeout
+    LISTENER_POLL_TIMEOUT = 1.0
+    
+    def __init__(self, connection_string: str = 'redis://localhost:6379', valley_name: str = None,
+                 transport: str = "direct", serializer: Optional[Callable[[Any], Any]] = None,
+                 connection_pool: Any = None):
         """
         Initialize Redis MCP broker.
         
         Args:
             connection_string: Redis connection string
             valley_name: Name of this valley for federation routing
+            transport: "direct" sends each write on its own round trip; "pipelined"
+                coalesces concurrently pending writes into a single pipeline
+            serializer: Encodes outgoing messages to str or bytes (default orjson when
+                installed, otherwise json.dumps)
+            connection_pool: Optional redis.asyncio connection pool to draw from instead of
+                building one from connection_string; it must set decode_responses=True and
+                its owner is responsible for disconnecting it
         """
+        if transport not in ("direct", "pipelined"):
+            raise ValueError(f"Unknown MCP broker transport: {transport}")
+        
         self.connection_string = connection_string
         self.valley_name = valley_name or "unknown_valley"
+        self.transport = transport
+        self.serializer = serializer or _json_dumps
+        self.connection_pool = connection_pool
         self._redis_client = None
         self._pubsub = None
         self._connected = False
         self._subscriptions: Dict[str, Callable] = {}
+        self._subscribe_waiters: Dict[str, asyncio.Future] = {}  # channel -> subscribe confirmation
         self._listener_task: Optional[asyncio.Task] = None
         
         # Federation-specific attributes
@@ -53,6 +89,13 @@ class RedisMCPBroker(IMCPBroker):
         self._last_heartbeat: Optional[datetime] = None
         self._heartbeat_task: Optional[asyncio.Task] = None
         
+        # Fire-and-forget publishes still in flight (confirm=False)
+        self._unconfirmed_writes: Set[asyncio.Task] = set()
+        
+        # Pending (command, key, payload, future) writes for the pipelined transport
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        
         logger.info(f"Redis MCP broker initialized for valley '{self.valley_name}' with connection: {connection_string}")
     
     async def connect(self) -> bool:
@@ -67,30 +110,36 @@ class RedisMCPBroker(IMCPBroker):
         
         try:
             # Initialize Redis client with connection pooling
-            self._redis_client = redis.from_url(
-                self.connection_string,
-                encoding="utf-8",
-                decode_responses=True,
-                socket_connect_timeout=5,
-                socket_timeout=5,
-                retry_on_timeout=True,
-                health_check_interval=30
-            )
+            if self.connection_pool is not None:
+                self._redis_client = redis.Redis(connection_pool=self.connection_pool)
+            else:
+                self._redis_client = redis.from_url(
+                    self.connection_string,
+                    encoding="utf-8",
+                    decode_responses=True,
+                    socket_connect_timeout=5,
+                    socket_timeout=5,
+                    retry_on_timeout=True,
+                    health_check_interval=30
+                )
             
             # Test connection
             await self._redis_client.ping()
             
-            # Initialize pub/sub
+            # Initialize pub/sub; it holds its own dedicated connection, separate from
+            # the one publishes use, and the listener starts on the first subscribe
             self._pubsub = self._redis_client.pubsub()
             
             self._connected = True
             
-            # Start message listener
-            self._listener_task = asyncio.create_task(self._message_listener())
-            
             # Start heartbeat for federation health monitoring
             self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
             
+            # Start the write coalescer when pipelining is requested
+            if self.transport == "pipelined":
+                self._write_queue = asyncio.Queue()
+                self._writer_task = asyncio.create_task(self._pipelined_writer())
+            
             # Initialize federation channels
             await self._setup_federation_channels()
             
@@ -109,11 +158,15 @@ class RedisMCPBroker(IMCPBroker):
             return True
         
         try:
+            # Let fire-and-forget publishes reach Redis before tearing down
+            if self._unconfirmed_writes:
+                await asyncio.gather(*self._unconfirmed_writes, return_exceptions=True)
+            
             # Mark as disconnected first to stop listener
             self._connected = False
             
             # Cancel background tasks
-            tasks_to_cancel = [self._listener_task, self._heartbeat_task]
+            tasks_to_cancel = [self._listener_task, self._heartbeat_task, self._writer_task]
             for task in tasks_to_cancel:
                 if task:
                     task.cancel()
@@ -124,6 +177,15 @@ class RedisMCPBroker(IMCPBroker):
             
             self._listener_task = None
             self._heartbeat_task = None
+            self._writer_task = None
+            
+            # Fail any writes that never reached Redis
+            if self._write_queue:
+                pending = []
+                while not self._write_queue.empty():
+                    pending.append(self._write_queue.get_nowait())
+                self._fail_writes(pending, ConnectionError("MCP broker disconnected"))
+                self._write_queue = None
             
             # Close Redis connections
             if self._pubsub:
@@ -146,24 +208,43 @@ class RedisMCPBroker(IMCPBroker):
             logger.error(f"Error disconnecting from Redis MCP broker: {e}")
             return False
     
-    async def subscribe(self, channel: str, callback: Callable) -> bool:
-        """Subscribe to a channel with a callback function"""
+    async def subscribe(self, channel: str, callback: Callable, confirm: bool = False) -> bool:
+        """Subscribe to a channel with a callback function
+        
+        With confirm=True, return only once Redis has acknowledged the subscription,
+        so messages published afterwards are guaranteed to be delivered.
+        """
         if not self._connected:
             raise RuntimeError("Must connect to broker before subscribing")
         
+        waiter = None
         try:
+            if confirm:
+                waiter = asyncio.get_running_loop().create_future()
+                self._subscribe_waiters[channel] = waiter
+            
             # Subscribe to Redis channel
             await self._pubsub.subscribe(channel)
             
             # Store callback for message dispatching
             self._subscriptions[channel] = callback
             
+            # Start the reader once the pub/sub connection exists
+            if self._listener_task is None or self._listener_task.done():
+                self._listener_task = asyncio.create_task(self._message_listener())
+            
+            if waiter is not None:
+                await asyncio.wait_for(waiter, timeout=self.SUBSCRIBE_CONFIRM_TIMEOUT)
+            
             logger.debug(f"Subscribed to channel: {channel}")
             return True
             
         except Exception as e:
             logger.error(f"Failed to subscribe to channel {channel}: {e}")
             return False
+        finally:
+            if waiter is not None and self._subscribe_waiters.get(channel) is waiter:
+                del self._subscribe_waiters[channel]
     
     async def unsubscribe(self, channel: str) -> bool:
         """Unsubscribe from a channel"""
@@ -186,7 +267,8 @@ class RedisMCPBroker(IMCPBroker):
             return False
     
     async def publish(self, channel: str, message: Any, priority: str = "normal", 
-                     target_valley: str = None) -> bool:
+                     target_valley: str = None, confirm: bool = True,
+                     raw: Optional[bytes] = None) -> bool:
         """
         Publish a message to a channel with federation support.
         
@@ -195,9 +277,12 @@ class RedisMCPBroker(IMCPBroker):
             message: Message to publish
             priority: Message priority ("high", "normal", "low")
             target_valley: Specific valley to route to (optional)
+            confirm: When False, return once the message is handed to the client
+                without waiting for the Redis reply; failures only show in the stats
+            raw: Pre-encoded message bytes to send as-is instead of serializing message
             
         Returns:
-            True if published successfully
+            True if published (or, with confirm=False, queued) successfully
         """
         if not self._connected or not self._redis_client:
             logger.error("Not connected to Redis")
@@ -205,18 +290,22 @@ class RedisMCPBroker(IMCPBroker):
             return False
             
         try:
-            serialized_message = json.dumps(message)
+            serialized_message = raw if raw is not None else self.serializer(message)
             
             # Handle priority routing
             if priority == "high" and channel in self._priority_queues:
                 # Use priority queue for high-priority messages
-                priority_queue = self._priority_queues[channel]
-                await self._redis_client.lpush(priority_queue, serialized_message)
-                logger.debug(f"Published high-priority message to queue '{priority_queue}'")
+                command, key = "lpush", self._priority_queues[channel]
             else:
                 # Standard pub/sub for normal messages
-                await self._redis_client.publish(channel, serialized_message)
-                logger.debug(f"Published message to channel '{channel}'")
+                command, key = "publish", channel
+            
+            if not confirm:
+                self._track_unconfirmed(self._write(command, key, serialized_message), 1)
+                return True
+            
+            await self._write(command, key, serialized_message)
+            logger.debug(f"Published message via {command} to '{key}'")
             
             # Update statistics
             self._message_stats["sent"] += 1
@@ -227,6 +316,118 @@ class RedisMCPBroker(IMCPBroker):
             self._message_stats["errors"] += 1
             return False
     
+    def _track_unconfirmed(self, write, count: int):
+        """Run a write in the background, counting its messages as sent unless it fails."""
+        task = asyncio.create_task(write)
+        self._unconfirmed_writes.add(task)
+        self._message_stats["sent"] += count
+        
+        def _done(t: asyncio.Task):
+            self._unconfirmed_writes.discard(t)
+            if not t.cancelled() and t.exception() is not None:
+                logger.error(f"Unconfirmed publish failed: {t.exception()}")
+                self._message_stats["sent"] -= count
+                self._message_stats["errors"] += count
+        
+        task.add_done_callback(_done)
+    
+    async def publish_many(self, channel: str, messages: List[Any], priority: str = "normal",
+                           confirm: bool = True, raw: bool = False) -> bool:
+        """
+        Publish several messages to one channel in a single pipelined round trip.
+        
+        Args:
+            channel: Channel name
+            messages: Messages to publish, in order
+            priority: Message priority ("high", "normal", "low")
+            confirm: When False, do not wait for the Redis replies
+            raw: When True, messages are pre-encoded bytes and are sent as-is
+            
+        Returns:
+            True if all messages were published
+        """
+        if not self._connected or not self._redis_client:
+            logger.error("Not connected to Redis")
+            self._message_stats["errors"] += len(messages)
+            return False
+        
+        try:
+            pipe = self._redis_client.pipeline(transaction=False)
+            priority_queue = self._priority_queues.get(channel) if priority == "high" else None
+            for message in messages:
+                serialized_message = message if raw else self.serializer(message)
+                if priority_queue:
+                    pipe.lpush(priority_queue, serialized_message)
+                else:
+                    pipe.publish(channel, serialized_message)
+            
+            if not confirm:
+                self._track_unconfirmed(pipe.execute(), len(messages))
+                return True
+            
+            await pipe.execute()
+            
+            logger.debug(f"Published {len(messages)} messages to channel '{channel}' in one pipeline")
+            self._message_stats["sent"] += len(messages)
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to publish messages to channel '{channel}': {e}")
+            self._message_stats["errors"] += len(messages)
+            return False
+    
+    async def _write(self, command: str, key: str, payload: Any):
+        """Run a single-key write, via the coalescing pipeline when enabled."""
+        if self._write_queue is None:
+            return await getattr(self._redis_client, command)(key, payload)
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._write_queue.put((command, key, payload, future))
+        return await future
+    
+    async def _pipelined_writer(self):
+        """Drain pending writes and send each burst to Redis as one pipeline.
+        
+        Each caller gets its own command's reply or error; a failing command
+        does not fail the other writes coalesced with it.
+        """
+        while self._connected:
+            batch = [await self._write_queue.get()]
+            try:
+                # Yield one loop iteration so every write issued in the same tick joins this batch
+                await asyncio.sleep(0)
+                while len(batch) < self.MAX_PIPELINE_BATCH and not self._write_queue.empty():
+                    batch.append(self._write_queue.get_nowait())
+                
+                pipe = self._redis_client.pipeline(transaction=False)
+                for command, key, payload, _ in batch:
+                    getattr(pipe, command)(key, payload)
+                
+                try:
+                    results = await pipe.execute(raise_on_error=False)
+                except Exception as e:
+                    self._fail_writes(batch, e)
+                    continue
+                
+                for (*_, future), result in zip(batch, results):
+                    if future.done():
+                        continue
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+            except asyncio.CancelledError:
+                # Writes already taken off the queue would otherwise never resolve
+                self._fail_writes(batch, ConnectionError("MCP broker disconnected"))
+                raise
+    
+    @staticmethod
+    def _fail_writes(batch: List[tuple], error: BaseException):
+        """Fail every still-pending (command, key, payload, future) write with error."""
+        for *_, future in batch:
+            if not future.done():
+                future.set_exception(error)
+    
     async def get_subscribers(self, channel: str) -> List[str]:
         """Get list of subscribers for a channel"""
         if not self._connected:
@@ -251,43 +452,21 @@ class RedisMCPBroker(IMCPBroker):
         return self._connected
     
     async def _message_listener(self):
-        """Background task to listen for messages and dispatch to callbacks"""
+        """Background task to listen for messages and dispatch to callbacks
+        
+        Polls the dedicated pub/sub connection with a bounded wait, so idle
+        channels never trip the client's socket_timeout or force a reconnect.
+        """
         logger.debug("Starting message listener")
         
         try:
             while self._connected:
                 try:
-                    message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
-                    if not message:
-                        await asyncio.sleep(0)
-                        continue
-                    if message.get("type") != "message":
-                        continue
-
-                    channel = message.get("channel")
-                    if isinstance(channel, bytes):
-                        channel = channel.decode("utf-8", errors="ignore")
-                    try:
-                        raw_data = message.get("data")
-                        if isinstance(raw_data, bytes):
-                            raw_data = raw_data.decode("utf-8", errors="ignore")
-                        data = json.loads(raw_data)
-                        if channel in self._subscriptions:
-                            callback = self._subscriptions[channel]
-                            asyncio.create_task(callback(channel, data))
-                        self._message_stats["received"] += 1
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to decode message from {channel}: {e}")
-                        self._message_stats["errors"] += 1
-                    except Exception as e:
-                        logger.error(f"Error in callback for {channel}: {e}")
-                        self._message_stats["errors"] += 1
-                                
+                    message = await self._pubsub.get_message(timeout=self.LISTENER_POLL_TIMEOUT)
+                    if message is not None:
+                        self._dispatch_pubsub_message(message)
                 except Exception as e:
                     if self._connected:  # Only log if we're still supposed to be connected
-                        if "pubsub connection not set" in str(e):
-                            await asyncio.sleep(0.5)
-                            continue
                         logger.error(f"Error in message listener: {e}")
                         self._message_stats["errors"] += 1
                         await asyncio.sleep(1)  # Brief pause before retrying
@@ -300,6 +479,33 @@ class RedisMCPBroker(IMCPBroker):
         finally:
             logger.debug("Message listener stopped")
     
+    def _dispatch_pubsub_message(self, message: Dict[str, Any]):
+        """Resolve subscribe confirmations and hand data messages to their callbacks."""
+        channel = message.get("channel")
+        if isinstance(channel, bytes):
+            channel = channel.decode("utf-8", errors="ignore")
+        
+        message_type = message.get("type")
+        if message_type == "subscribe":
+            waiter = self._subscribe_waiters.get(channel)
+            if waiter is not None and not waiter.done():
+                waiter.set_result(True)
+            return
+        if message_type != "message":
+            return
+        try:
+            data = _json_loads(message.get("data"))
+            if channel in self._subscriptions:
+                callback = self._subscriptions[channel]
+                asyncio.create_task(callback(channel, data))
+            self._message_stats["received"] += 1
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to decode message from {channel}: {e}")
+            self._message_stats["errors"] += 1
+        except Exception as e:
+            logger.error(f"Error in callback for {channel}: {e}")
+            self._message_stats["errors"] += 1
+    
     async def _setup_federation_channels(self):
         """Setup federation-specific channels and queues."""
         try:
@@ -383,22 +589,25 @@ class RedisMCPBroker(IMCPBroker):
             "priority_queues": len(self._priority_queues)
         }
     
-    async def subscribe_to_federation(self, federation_name: str, callback: Callable) -> bool:
+    async def subscribe_to_federation(self, federation_name: str, callback: Callable,
+                                      confirm: bool = False) -> bool:
         """
         Subscribe to federation-wide communications.
         
         Args:
             federation_name: Name of the federation
             callback: Function to call when messages are received
+            confirm: When True, wait until Redis acknowledges the subscription
             
         Returns:
             True if subscribed successfully
         """
         federation_channel = f"federation.{federation_name}"
-        return await self.subscribe(federation_channel, callback)
+        return await self.subscribe(federation_channel, callback, confirm=confirm)
     
     async def publish_to_federation(self, federation_name: str, message: Any, 
-                                  priority: str = "normal") -> bool:
+                                  priority: str = "normal", confirm: bool = True,
+                                  raw: Optional[bytes] = None) -> bool:
         """
         Publish a message to all valleys in a federation.
         
@@ -406,12 +615,34 @@ class RedisMCPBroker(IMCPBroker):
             federation_name: Name of the federation
             message: Message to publish
             priority: Message priority
+            confirm: When False, do not wait for the Redis reply
+            raw: Pre-encoded message bytes to send as-is instead of serializing message
             
         Returns:
             True if published successfully
         """
         federation_channel = f"federation.{federation_name}"
-        return await self.publish(federation_channel, message, priority=priority)
+        return await self.publish(federation_channel, message, priority=priority, confirm=confirm, raw=raw)
+    
+    async def publish_many_to_federation(self, federation_name: str, messages: List[Any],
+                                         priority: str = "normal", confirm: bool = True,
+                                         raw: bool = False) -> bool:
+        """
+        Publish several messages to all valleys in a federation in one round trip.
+        
+        Args:
+            federation_name: Name of the federation
+            messages: Messages to publish, in order
+            priority: Message priority
+            confirm: When False, do not wait for the Redis replies
+            raw: When True, messages are pre-encoded bytes and are sent as-is
+            
+        Returns:
+            True if all messages were published
+        """
+        federation_channel = f"federation.{federation_name}"
+        return await self.publish_many(federation_channel, messages, priority=priority,
+                                       confirm=confirm, raw=raw)
     
     def __repr__(self) -> str:
         return f"RedisMCPBroker(connected={self._connected}, subscriptions={len(self._subscriptions)})"
@@ -11,7 +11,7 @@ import logging
 import asyncio
 import math
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Callable, Union
+from typing import Dict, List, Any, Optional, Callable, Tuple, Union
 from enum import Enum
 from dataclasses import dataclass, field
 from collections import defaultdict, deque
@@ -90,6 +90,10 @@ class IMetricsCollector(ABC):
     async def record_metric(self, metric: Metric) -> None:
         pass
     
+    async def record_metrics(self, metrics: List[Metric]) -> None:
+        for metric in metrics:
+            await self.record_metric(metric)
+    
     @abstractmethod
     async def get_metrics(self, metric_name: Optional[str] = None, limit: Optional[int] = None) -> List[Metric]:
         pass
@@ -137,6 +141,12 @@ class InMemoryMetricsCollector(IMetricsCollector):
             if len(self.metrics) > self._max_metrics:
                 self.metrics = self.metrics[-self._max_metrics :]
 
+    async def record_metrics(self, metrics: List[Metric]) -> None:
+        with self._lock:
+            self.metrics.extend(metrics)
+            if len(self.metrics) > self._max_metrics:
+                self.metrics = self.metrics[-self._max_metrics :]
+
     async def get_metrics(self, metric_name: Optional[str] = None, limit: Optional[int] = None) -> List[Metric]:
         with self._lock:
             items = [m for m in self.metrics if (metric_name is None or m.name == metric_name)]
@@ -376,6 +386,13 @@ class MonitoringSystem:
         metric = Metric(name=name, value=value, metric_type=metric_type, tags=tags or {}, unit=unit)
         await self.metrics_collector.record_metric(metric)
     
+    async def record_metrics_batch(self, items: List[Tuple[str, Union[int, float], Optional[Dict[str, str]]]],
+                                   metric_type: MetricType = MetricType.GAUGE):
+        if not self.metrics_collector:
+            await self.initialize()
+        metrics = [Metric(name=name, value=value, metric_type=metric_type, tags=tags or {}) for name, value, tags in items]
+        await self.metrics_collector.record_metrics(metrics)
+    
     async def send_alert(self, title: str, message: str, severity: AlertSeverity, source: Optional[str] = None, tags: Optional[Dict[str, Any]] = None):
         if not self.alert_manager:
             await self.initialize()
@@ -429,6 +446,10 @@ async def record_metric(name: str, value: Union[int, float], metric_type: Metric
     monitoring = get_monitoring_system()
     await monitoring.record_metric(name, value, metric_type, tags=tags, unit=unit)
 
+async def record_metrics_batch(items: List[Tuple[str, Union[int, float], Optional[Dict[str, str]]]], metric_type: MetricType = MetricType.GAUGE):
+    monitoring = get_monitoring_system()
+    await monitoring.record_metrics_batch(items, metric_type)
+
 async def record_counter(name: str, value: int = 1, tags: Optional[Dict[str, str]] = None):
     monitoring = get_monitoring_system()
     await monitoring.record_metric(name, value, MetricType.COUNTER, tags)
@@ -12,7 +12,7 @@ import re
 import html
 import logging
 import hashlib
-from typing import Dict, List, Any, Optional, Set, Tuple, Callable
+from typing import Dict, List, Any, Optional, Pattern, Set, Tuple, Callable
 from datetime import datetime, timedelta
 from enum import Enum
 from dataclasses import dataclass, field
@@ -59,6 +59,13 @@ class SanitizationRule:
     description: str
     enabled: bool = True
     regex_flags: int = re.IGNORECASE
+    _compiled: Optional[Tuple[str, int, Pattern]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def compiled_pattern(self) -> Pattern:
+        """Return the compiled regex, recompiling only if pattern or flags changed"""
+        if self._compiled is None or self._compiled[:2] != (self.pattern, self.regex_flags):
+            self._compiled = (self.pattern, self.regex_flags, re.compile(self.pattern, self.regex_flags))
+        return self._compiled[2]
 
 
 @dataclass
@@ -262,10 +269,7 @@ class SanitizerCampfire(Campfire):
                 continue
             
             try:
-                if callable(rule.replacement):
-                    sanitized = re.sub(rule.pattern, rule.replacement, sanitized, flags=rule.regex_flags)
-                else:
-                    sanitized = re.sub(rule.pattern, rule.replacement, sanitized, flags=rule.regex_flags)
+                sanitized = rule.compiled_pattern().sub(rule.replacement, sanitized)
             except Exception as e:
                 self.logger.warning(f"Error applying sanitization rule {rule.name}: {e}")
         
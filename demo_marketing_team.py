@@ -13,34 +13,80 @@ The marketing team consists of:
 """
 
 import asyncio
+import copy
+import functools
+import io
 import json
 import logging
+import os
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+import aiofiles
 import aiohttp
 import requests
 import yaml
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from campfirevalley.valley import Valley
 from campfirevalley.config_manager import ConfigManager
-from campfirevalley.models import Torch
+from campfirevalley.models import CampfireConfig, Torch
+
+
+def _extract(resp: Torch) -> Tuple[str, int]:
+    """Return a campfire response's message text together with its length."""
+    text = resp.data.get('message', resp.payload if hasattr(resp, 'payload') else '')
+    return text, len(text)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_campfire_yaml(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a campfire YAML file, cached by path, mtime and size."""
+    with open(path_str, 'r') as f:
+        return yaml.safe_load(f)
+
+
+def _build_campfire_config(path_str: str, mtime_ns: int, size: int) -> CampfireConfig:
+    """Build a fresh CampfireConfig from the cached YAML.
+    
+    Valley.provision_campfire writes into the config, so every call gets its
+    own deep copy rather than sharing the cached dict.
+    """
+    config_data = copy.deepcopy(_load_campfire_yaml(path_str, mtime_ns, size))
+    
+    return CampfireConfig(
+        name=config_data['name'],
+        type=config_data.get('type', 'LLMCampfire'),
+        description=config_data.get('description', ''),
+        config=config_data
+    )
 
 
 class MarketingTeamDemo:
     """Demo for the local marketing team that generates website ideas."""
     
-    def __init__(self, config_path: str = "manifest.yaml", dev_team_url: str = "http://localhost:8080"):
+    def __init__(self, config_path: str = "manifest.yaml", dev_team_url: str = "http://localhost:8080",
+                 reports_dir: str = "."):
         """Initialize the marketing team demo."""
         self.config_path = config_path
         self.dev_team_url = dev_team_url
+        self.reports_dir = Path(reports_dir)
         self.valley = None
+        
+        # Bound parallel POSTs so the development team server is not overloaded
+        self.max_concurrency = int(os.environ.get("DEV_TEAM_CONCURRENCY", "8"))
+        self._sem = asyncio.Semaphore(self.max_concurrency)
+        
         self.demo_results = {
             "marketing_ideas": [],
             "team_collaboration": {},
-            "development_requests": [],
-            "development_responses": []
+            "development_requests": []
         }
         
         # Setup logging
@@ -74,10 +120,6 @@ class MarketingTeamDemo:
     
     async def _load_marketing_campfires(self):
         """Load the marketing team campfires from configuration files."""
-        import yaml
-        from pathlib import Path
-        from campfirevalley.models import CampfireConfig
-        
         campfire_names = ["marketing-strategist", "creative-director", "ux-researcher"]
         config_dir = Path("config/campfires")
         
@@ -88,17 +130,9 @@ class MarketingTeamDemo:
                     self.logger.error(f"Configuration file not found: {config_file}")
                     continue
                 
-                # Load YAML configuration
-                with open(config_file, 'r') as f:
-                    config_data = yaml.safe_load(f)
-                
-                # Create CampfireConfig
-                campfire_config = CampfireConfig(
-                    name=config_data['name'],
-                    type=config_data.get('type', 'LLMCampfire'),
-                    description=config_data.get('description', ''),
-                    config=config_data
-                )
+                # Reuse the parsed YAML while the file is unchanged
+                st = config_file.stat()
+                campfire_config = _build_campfire_config(str(config_file), st.st_mtime_ns, st.st_size)
                 
                 # Provision the campfire
                 success = await self.valley.provision_campfire(campfire_config)
@@ -167,6 +201,7 @@ class MarketingTeamDemo:
             )
             
             strategy_response = await self.valley.process_torch(strategy_request)
+            strategy_content, strategy_len = _extract(strategy_response)
             
             # Step 2: Creative Director develops visual and creative concepts
             creative_request = Torch(
@@ -181,7 +216,7 @@ class MarketingTeamDemo:
                 destination="creative-director",
                 data={
                     "message": f"""
-                    Based on this strategic foundation: {strategy_response.data.get('message', strategy_response.payload if hasattr(strategy_response, 'payload') else '')}
+                    Based on this strategic foundation: {strategy_content}
                     
                     Develop creative concepts for this website including:
                     - Visual identity and brand personality
@@ -194,16 +229,17 @@ class MarketingTeamDemo:
                     """,
                     "task_type": "creative_development",
                     "category": idea_prompt['category'],
-                    "strategy_input": strategy_response.data.get('message', strategy_response.payload if hasattr(strategy_response, 'payload') else '')
+                    "strategy_input": strategy_content
                 },
                 metadata={
                     "task_type": "creative_development", 
                     "category": idea_prompt['category'],
-                    "strategy_input": strategy_response.data.get('message', strategy_response.payload if hasattr(strategy_response, 'payload') else '')
+                    "strategy_input": strategy_content
                 }
             )
             
             creative_response = await self.valley.process_torch(creative_request)
+            creative_content, creative_len = _extract(creative_response)
             
             # Step 3: UX Researcher provides user experience analysis
             ux_request = Torch(
@@ -220,8 +256,8 @@ class MarketingTeamDemo:
                     "message": f"""
                     Analyze this website concept from a user research perspective:
                     
-                    Strategic Foundation: {strategy_response.data.get('message', strategy_response.payload if hasattr(strategy_response, 'payload') else '')}
-                    Creative Concept: {creative_response.data.get('message', creative_response.payload if hasattr(creative_response, 'payload') else '')}
+                    Strategic Foundation: {strategy_content}
+                    Creative Concept: {creative_content}
                     
                     Provide user experience analysis including:
                     - User needs and pain point analysis
@@ -234,18 +270,19 @@ class MarketingTeamDemo:
                     """,
                     "task_type": "user_research_analysis",
                     "category": idea_prompt['category'],
-                    "strategy_input": strategy_response.data.get('message', strategy_response.payload if hasattr(strategy_response, 'payload') else ''),
-                    "creative_input": creative_response.data.get('message', creative_response.payload if hasattr(creative_response, 'payload') else '')
+                    "strategy_input": strategy_content,
+                    "creative_input": creative_content
                 },
                 metadata={
                     "task_type": "user_research_analysis",
                     "category": idea_prompt['category'],
-                    "strategy_input": strategy_response.data.get('message', strategy_response.payload if hasattr(strategy_response, 'payload') else ''),
-                    "creative_input": creative_response.data.get('message', creative_response.payload if hasattr(creative_response, 'payload') else '')
+                    "strategy_input": strategy_content,
+                    "creative_input": creative_content
                 }
             )
             
             ux_response = await self.valley.process_torch(ux_request)
+            ux_content, ux_len = _extract(ux_response)
             
             # Compile the complete website idea
             website_idea = {
@@ -253,21 +290,21 @@ class MarketingTeamDemo:
                 "category": idea_prompt['category'],
                 "timestamp": datetime.now().isoformat(),
                 "strategic_analysis": {
-                    "content": strategy_response.data.get('message', strategy_response.payload if hasattr(strategy_response, 'payload') else ''),
+                    "content": strategy_content,
                     "metadata": strategy_response.metadata
                 },
                 "creative_concept": {
-                    "content": creative_response.data.get('message', creative_response.payload if hasattr(creative_response, 'payload') else ''),
+                    "content": creative_content,
                     "metadata": creative_response.metadata
                 },
                 "ux_analysis": {
-                    "content": ux_response.data.get('message', ux_response.payload if hasattr(ux_response, 'payload') else ''),
+                    "content": ux_content,
                     "metadata": ux_response.metadata
                 },
                 "collaboration_summary": {
                     "team_members": ["marketing-strategist", "creative-director", "ux-researcher"],
                     "process_duration": "collaborative_ideation",
-                    "quality_score": self._calculate_idea_quality_score(strategy_response, creative_response, ux_response)
+                    "quality_score": self._calculate_idea_quality_score(strategy_len, creative_len, ux_len)
                 }
             }
             
@@ -278,16 +315,12 @@ class MarketingTeamDemo:
         self.logger.info(f"Generated {len(website_ideas)} website ideas")
         return website_ideas
     
-    def _calculate_idea_quality_score(self, strategy_resp, creative_resp, ux_resp) -> float:
+    def _calculate_idea_quality_score(self, strategy_len: int, creative_len: int, ux_len: int) -> float:
         """Calculate a quality score for the generated idea based on response quality."""
         # Simple scoring based on response length and completeness
-        strategy_content = strategy_resp.data.get('message', strategy_resp.payload if hasattr(strategy_resp, 'payload') else '')
-        creative_content = creative_resp.data.get('message', creative_resp.payload if hasattr(creative_resp, 'payload') else '')
-        ux_content = ux_resp.data.get('message', ux_resp.payload if hasattr(ux_resp, 'payload') else '')
-        
-        strategy_score = min(len(strategy_content) / 1000, 1.0)
-        creative_score = min(len(creative_content) / 1000, 1.0)
-        ux_score = min(len(ux_content) / 1000, 1.0)
+        strategy_score = min(strategy_len / 1000, 1.0)
+        creative_score = min(creative_len / 1000, 1.0)
+        ux_score = min(ux_len / 1000, 1.0)
         
         return round((strategy_score + creative_score + ux_score) / 3 * 100, 1)
     
@@ -297,7 +330,7 @@ class MarketingTeamDemo:
             async with aiohttp.ClientSession() as session:
                 async with session.get(f"{self.dev_team_url}/health", timeout=5) as response:
                     if response.status == 200:
-                        health_data = await response.json()
+                        health_data = _json_loads(await response.read())
                         self.logger.info(f"Development team health check: {health_data}")
                         return True
                     else:
@@ -321,79 +354,93 @@ class MarketingTeamDemo:
                 "response_time": "failed"
             } for idea in website_ideas]
         
-        development_results = []
-        
-        for idea in website_ideas:
-            try:
-                # Prepare the idea for transmission to development team
-                development_request = {
-                    "idea_id": idea["id"],
-                    "category": idea["category"],
-                    "strategic_requirements": idea["strategic_analysis"]["content"],
-                    "creative_requirements": idea["creative_concept"]["content"],
-                    "ux_requirements": idea["ux_analysis"]["content"],
-                    "timestamp": datetime.now().isoformat(),
-                    "source_team": "marketing_team"
-                }
-                
-                # Send to dockerized development team via HTTP/MCP
-                async with aiohttp.ClientSession() as session:
-                    try:
-                        async with session.post(
-                            f"{self.dev_team_url}/api/develop_website",
-                            json=development_request,
-                            timeout=aiohttp.ClientTimeout(total=120)
-                        ) as response:
-                            if response.status == 200:
-                                result = await response.json()
-                                development_results.append({
-                                    "idea_id": idea["id"],
-                                    "status": "success",
-                                    "development_result": result,
-                                    "response_time": result.get("processing_time", "unknown")
-                                })
-                                self.logger.info(f"Successfully sent idea {idea['id']} to development team")
-                            else:
-                                error_text = await response.text()
-                                development_results.append({
-                                    "idea_id": idea["id"],
-                                    "status": "error",
-                                    "error": f"HTTP {response.status}: {error_text}",
-                                    "response_time": "failed"
-                                })
-                                self.logger.error(f"Failed to send idea {idea['id']}: HTTP {response.status}")
-                    
-                    except asyncio.TimeoutError:
-                        development_results.append({
-                            "idea_id": idea["id"],
-                            "status": "timeout",
-                            "error": "Request timed out after 120 seconds",
-                            "response_time": "timeout"
-                        })
-                        self.logger.error(f"Timeout sending idea {idea['id']} to development team")
-                    
-                    except aiohttp.ClientError as e:
-                        development_results.append({
-                            "idea_id": idea["id"],
-                            "status": "connection_error",
-                            "error": f"Connection error: {str(e)}",
-                            "response_time": "failed"
-                        })
-                        self.logger.error(f"Connection error sending idea {idea['id']}: {e}")
-            
-            except Exception as e:
-                development_results.append({
-                    "idea_id": idea["id"],
-                    "status": "error",
-                    "error": f"Unexpected error: {str(e)}",
-                    "response_time": "failed"
-                })
-                self.logger.error(f"Unexpected error processing idea {idea['id']}: {e}")
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            development_results = await asyncio.gather(
+                *(self._post_one(session, idea) for idea in website_ideas)
+            )
+        development_results = list(development_results)
         
         self.demo_results["development_requests"] = development_results
-        self.demo_results["development_responses"] = [r for r in development_results if r["status"] == "success"]
         return development_results
     
+    async def _post_one(self, session: aiohttp.ClientSession, idea: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a single website idea to the development team, bounded by the concurrency limit."""
+        try:
+            # Prepare the idea for transmission to development team
+            development_request = {
+                "idea_id": idea["id"],
+                "category": idea["category"],
+                "strategic_requirements": idea["strategic_analysis"]["content"],
+                "creative_requirements": idea["creative_concept"]["content"],
+                "ux_requirements": idea["ux_analysis"]["content"],
+                "timestamp": datetime.now().isoformat(),
+                "source_team": "marketing_team"
+            }
+            
+            # Send to dockerized development team via HTTP/MCP
+            async with self._sem:
+                try:
+                    async with session.post(
+                        f"{self.dev_team_url}/api/develop_website",
+                        json=development_request,
+                        timeout=aiohttp.ClientTimeout(total=120)
+                    ) as response:
+                        if response.status == 200:
+                            result = _json_loads(await response.read())
+                            self.logger.info(f"Successfully sent idea {idea['id']} to development team")
+                            return {
+                                "idea_id": idea["id"],
+                                "status": "success",
+                                "development_result": result,
+                                "response_time": result.get("processing_time", "unknown")
+                            }
+                        else:
+                            error_text = await response.text()
+                            self.logger.error(f"Failed to send idea {idea['id']}: HTTP {response.status}")
+                            return {
+                                "idea_id": idea["id"],
+                                "status": "error",
+                                "error": f"HTTP {response.status}: {error_text}",
+                                "response_time": "failed"
+                            }
+                
+                except asyncio.TimeoutError:
+                    self.logger.error(f"Timeout sending idea {idea['id']} to development team")
+                    return {
+                        "idea_id": idea["id"],
+                        "status": "timeout",
+                        "error": "Request timed out after 120 seconds",
+                        "response_time": "timeout"
+                    }
+                
+                except aiohttp.ClientError as e:
+                    self.logger.error(f"Connection error sending idea {idea['id']}: {e}")
+                    return {
+                        "idea_id": idea["id"],
+                        "status": "connection_error",
+                        "error": f"Connection error: {str(e)}",
+                        "response_time": "failed"
+                    }
+        
+        except Exception as e:
+            self.logger.error(f"Unexpected error processing idea {idea['id']}: {e}")
+            return {
+                "idea_id": idea["id"],
+                "status": "error",
+                "error": f"Unexpected error: {str(e)}",
+                "response_time": "failed"
+            }
+    
+    def _report_results(self) -> Dict[str, Any]:
+        """Return demo_results with development_responses derived only when a report is built."""
+        return {
+            **self.demo_results,
+            "development_responses": [
+                r for r in self.demo_results["development_requests"] if r["status"] == "success"
+            ]
+        }
+    
     async def generate_marketing_report(self) -> str:
         """Generate an HTML report of the marketing team's work."""
         self.logger.info("Generating marketing team report...")
@@ -403,58 +450,26 @@ class MarketingTeamDemo:
             "team_composition": ["Marketing Strategist", "Creative Director", "UX Researcher"],
             "ideas_generated": len(self.demo_results.get("marketing_ideas", [])),
             "development_requests_sent": len(self.demo_results.get("development_requests", [])),
-            "demo_results": self.demo_results
+            "demo_results": self._report_results()
         }
         
-        html_content = self._generate_marketing_html_report(report_data)
+        html_bytes = self._generate_marketing_html_report(report_data)
         
         # Save the report
-        report_path = Path("marketing_team_report.html")
-        with open(report_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        report_path = self.reports_dir / "marketing_team_report.html"
+        async with aiofiles.open(report_path, 'wb') as f:
+            await f.write(html_bytes)
         
         self.logger.info(f"Marketing team report saved to: {report_path}")
         return str(report_path)
     
-    def _generate_marketing_html_report(self, report_data: Dict[str, Any]) -> str:
-        """Generate HTML content for the marketing team report."""
+    def _generate_marketing_html_report(self, report_data: Dict[str, Any]) -> bytes:
+        """Generate UTF-8 encoded HTML content for the marketing team report."""
         website_ideas = report_data["demo_results"].get("marketing_ideas", [])
         development_requests = report_data["demo_results"].get("development_requests", [])
         
-        ideas_html = ""
-        for idea in website_ideas:
-            ideas_html += f"""
-            <div class="idea-card">
-                <h3>{idea['category']} (ID: {idea['id']})</h3>
-                <div class="idea-section">
-                    <h4>Strategic Analysis</h4>
-                    <div class="content-box">{idea['strategic_analysis']['content'][:500]}...</div>
-                </div>
-                <div class="idea-section">
-                    <h4>Creative Concept</h4>
-                    <div class="content-box">{idea['creative_concept']['content'][:500]}...</div>
-                </div>
-                <div class="idea-section">
-                    <h4>UX Analysis</h4>
-                    <div class="content-box">{idea['ux_analysis']['content'][:500]}...</div>
-                </div>
-                <div class="quality-score">Quality Score: {idea['collaboration_summary']['quality_score']}%</div>
-            </div>
-            """
-        
-        requests_html = ""
-        for req in development_requests:
-            status_class = "success" if req["status"] == "success" else "error"
-            requests_html += f"""
-            <div class="request-card {status_class}">
-                <h4>Idea {req['idea_id']}</h4>
-                <p><strong>Status:</strong> {req['status']}</p>
-                <p><strong>Response Time:</strong> {req['response_time']}</p>
-                {f"<p><strong>Error:</strong> {req.get('error', '')}</p>" if req['status'] != 'success' else ''}
-            </div>
-            """
-        
-        return f"""
+        buf = io.BytesIO()
+        buf.write(f"""
         <!DOCTYPE html>
         <html lang="en">
         <head>
@@ -509,13 +524,46 @@ class MarketingTeamDemo:
                 
                 <div class="section">
                     <h2>Generated Website Ideas</h2>
-                    {ideas_html}
+""".encode("utf-8"))
+        
+        for idea in website_ideas:
+            buf.write(f"""
+            <div class="idea-card">
+                <h3>{idea['category']} (ID: {idea['id']})</h3>
+                <div class="idea-section">
+                    <h4>Strategic Analysis</h4>
+                    <div class="content-box">{idea['strategic_analysis']['content'][:500]}...</div>
                 </div>
+                <div class="idea-section">
+                    <h4>Creative Concept</h4>
+                    <div class="content-box">{idea['creative_concept']['content'][:500]}...</div>
+                </div>
+                <div class="idea-section">
+                    <h4>UX Analysis</h4>
+                    <div class="content-box">{idea['ux_analysis']['content'][:500]}...</div>
+                </div>
+                <div class="quality-score">Quality Score: {idea['collaboration_summary']['quality_score']}%</div>
+            </div>
+            """.encode("utf-8"))
+        
+        buf.write(b"""                </div>
                 
                 <div class="section">
                     <h2>Development Team Collaboration</h2>
-                    {requests_html}
-                </div>
+""")
+        
+        for req in development_requests:
+            status_class = "success" if req["status"] == "success" else "error"
+            buf.write(f"""
+            <div class="request-card {status_class}">
+                <h4>Idea {req['idea_id']}</h4>
+                <p><strong>Status:</strong> {req['status']}</p>
+                <p><strong>Response Time:</strong> {req['response_time']}</p>
+                {f"<p><strong>Error:</strong> {req.get('error', '')}</p>" if req['status'] != 'success' else ''}
+            </div>
+            """.encode("utf-8"))
+        
+        buf.write(b"""                </div>
                 
                 <div class="timestamp">
                     Report generated by CampfireValley Marketing Team Demo
@@ -523,10 +571,16 @@ class MarketingTeamDemo:
             </div>
         </body>
         </html>
-        """
+        """)
+        return buf.getvalue()
     
-    async def run_demo(self):
-        """Run the complete marketing team demo."""
+    async def run_demo(self, dev_team_ready: Optional[asyncio.Event] = None):
+        """Run the complete marketing team demo.
+        
+        Args:
+            dev_team_ready: Optional event set once the development team is up;
+                idea generation runs immediately and only sending waits for it.
+        """
         try:
             self.logger.info("Starting CampfireValley Marketing Team Demo...")
             
@@ -537,6 +591,8 @@ class MarketingTeamDemo:
             website_ideas = await self.generate_website_ideas()
             
             # Send ideas to development team
+            if dev_team_ready is not None:
+                await dev_team_ready.wait()
             development_results = await self.send_ideas_to_development_team(website_ideas)
             
             # Generate report
@@ -550,7 +606,7 @@ class MarketingTeamDemo:
                 "website_ideas": len(website_ideas),
                 "development_requests": len(development_results),
                 "report_path": report_path,
-                "results": self.demo_results
+                "results": self._report_results()
             }
             
         except Exception as e:
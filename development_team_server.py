@@ -12,28 +12,52 @@ The server provides endpoints for:
 """
 
 import asyncio
+import atexit
+import hashlib
+import itertools
 import json
 import logging
 import os
-import traceback
-from datetime import datetime
-from typing import Dict, List, Any, Optional
+import queue
+import random
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import AsyncIterator, Dict, List, Any, Optional, Set, Tuple
 
 import uvicorn
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from campfirevalley.valley import Valley
 from campfirevalley.config_manager import ConfigManager
 from campfirevalley.models import Torch
 
 
-# Configure logging
+# Configure logging; records are handed to a background listener thread so
+# stream I/O never blocks the event loop. QueueHandler renders each message
+# before queuing it, so later changes to its arguments are not logged.
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
+_log_listener = QueueListener(_log_queue, _log_stream_handler, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
@@ -49,11 +73,19 @@ class DevelopmentRequest(BaseModel):
     source_team: str
 
 
+class DevelopmentBatchRequest(BaseModel):
+    """Model for several development requests sent in one call."""
+    requests: List[DevelopmentRequest]
+
+
+DEFAULT_RESPONSE_CLASS = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+
 # Create FastAPI app
 app = FastAPI(
     title="CampfireValley Development Team",
     description="Development team server for processing website ideas",
-    version="1.1.0"
+    version="1.1.0",
+    default_response_class=DEFAULT_RESPONSE_CLASS
 )
 
 # Add CORS middleware
@@ -65,9 +97,263 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+class ConcurrencyLimitMiddleware:
+    """Reject requests with 429 once too many are already in flight.
+    
+    Bounds memory under bursts, since every development request holds several
+    LLM calls and their large prompt/response strings. Health probes bypass the
+    limit so a saturated server is not restarted as unhealthy.
+    
+    Written as plain ASGI middleware so a slot is held until the response body
+    has been sent, including the streamed /api/develop_website/stream events.
+    """
+    
+    def __init__(self, app, max_concurrent: int = 64, exempt_paths: Optional[set] = None):
+        self.app = app
+        self.sem = asyncio.Semaphore(max_concurrent)
+        self.exempt_paths = exempt_paths or {"/health"}
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+        if self.sem.locked():
+            response = JSONResponse(
+                status_code=429,
+                content={"error": "busy", "detail": "Too many concurrent requests"}
+            )
+            await response(scope, receive, send)
+            return
+        async with self.sem:
+            await self.app(scope, receive, send)
+
+
+app.add_middleware(
+    ConcurrencyLimitMiddleware,
+    max_concurrent=int(os.getenv("MAX_CONCURRENT_REQUESTS", "64"))
+)
+
 # Global valley instance
 valley = None
 
+# Set once the valley is provisioned and warmed up; gates traffic with 503s until then
+valley_ready = asyncio.Event()
+VALLEY_READY_TIMEOUT_SECONDS = float(os.getenv("VALLEY_READY_TIMEOUT_SECONDS", "5"))
+WARMUP_CAMPFIRES = os.getenv("WARMUP_CAMPFIRES", "false").lower() in {"true", "1", "yes", "on"}
+
+# Cap in-flight LLM campfire calls to stay under the provider's rate limit
+MAX_INFLIGHT_LLM = int(os.getenv("MAX_INFLIGHT_LLM", "16"))
+LLM_RETRY_ATTEMPTS = int(os.getenv("LLM_RETRY_ATTEMPTS", "4"))
+LLM_RETRY_MAX_DELAY_SECONDS = 30.0
+llm_sem = asyncio.Semaphore(MAX_INFLIGHT_LLM)
+
+# Monotonic suffix keeping torch IDs unique within the same second
+_torch_counter = itertools.count()
+
+# Completed development plans keyed by a hash of the request requirements
+RESULT_CACHE_TTL_SECONDS = float(os.getenv("RESULT_CACHE_TTL_SECONDS", "3600"))
+RESULT_CACHE_MAX_ENTRIES = int(os.getenv("RESULT_CACHE_MAX_ENTRIES", "256"))
+_RESULT_CACHE: Dict[str, Dict[str, Any]] = {}
+
+
+def _request_cache_key(request: "DevelopmentRequest") -> str:
+    """Hash the fields that determine a development plan."""
+    normalized = json.dumps({
+        "category": request.category,
+        "strategic_requirements": request.strategic_requirements,
+        "creative_requirements": request.creative_requirements,
+        "ux_requirements": request.ux_requirements
+    }, sort_keys=True)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def _get_cached_result(key: str) -> Optional[Dict[str, Any]]:
+    """Return a cached development plan if it has not expired."""
+    entry = _RESULT_CACHE.get(key)
+    if entry is None:
+        return None
+    if (time.time() - entry["ts"]) >= RESULT_CACHE_TTL_SECONDS:
+        _RESULT_CACHE.pop(key, None)
+        return None
+    return entry["result"]
+
+
+def _is_cacheable_result(result: Dict[str, Any]) -> bool:
+    """Only complete plans that belong to a single idea may be cached under its key."""
+    if result.get("status") != "completed":
+        return False
+    summary = result.get("summary", {})
+    # Campfires that raised are missing and ones that gave up return None
+    analyses = result.get("development_analysis") or {}
+    if len(analyses) != summary.get("expected_analyses"):
+        return False
+    return all(analysis is not None for analysis in analyses.values())
+
+
+def _set_cached_result(key: str, result: Dict[str, Any]) -> None:
+    """Store a development plan, evicting the oldest entry when full."""
+    if key not in _RESULT_CACHE and len(_RESULT_CACHE) >= RESULT_CACHE_MAX_ENTRIES:
+        _RESULT_CACHE.pop(next(iter(_RESULT_CACHE)))
+    _RESULT_CACHE[key] = {"ts": time.time(), "result": result}
+
+
+# Optional semantic (embedding similarity) cache layered behind the exact-hash cache
+ENABLE_SEMANTIC_CACHE = os.getenv("ENABLE_SEMANTIC_CACHE", "false").lower() in {"true", "1", "yes", "on"}
+
+
+class SemanticResultCache:
+    """
+    Redis-backed cache returning development plans for near-duplicate requirements.
+    
+    Entries are stored in a Redis hash as JSON (embedding + result) so they
+    survive restarts and can be shared between workers. Embeddings are mirrored
+    in memory as one numpy matrix and matched by cosine similarity with a
+    single matrix-vector product, which keeps lookups working on plain Redis
+    without the RediSearch module.
+    """
+    
+    def __init__(self, redis_url: str, threshold: float = 0.95,
+                 model_name: str = "all-MiniLM-L6-v2",
+                 hash_key: str = "devteam:semantic_cache",
+                 ttl_seconds: int = 3600, max_entries: int = 1000):
+        self.redis_url = redis_url
+        self.threshold = threshold
+        self.model_name = model_name
+        self.hash_key = hash_key
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._redis = None
+        self._model = None
+        self._embeddings: Dict[str, List[float]] = {}
+        # Row-aligned (keys, matrix) view of _embeddings, rebuilt after changes
+        self._np = None
+        self._keys: List[str] = []
+        self._matrix = None
+        self._ready: Optional[bool] = None
+        self._init_lock = asyncio.Lock()
+    
+    async def _ensure_ready(self) -> bool:
+        """Lazily load the embedding model and hydrate embeddings from Redis."""
+        if self._ready is not None:
+            return self._ready
+        async with self._init_lock:
+            if self._ready is not None:
+                return self._ready
+            try:
+                import numpy as np
+                import redis.asyncio as redis
+                from sentence_transformers import SentenceTransformer
+                
+                self._np = np
+                self._model = await asyncio.to_thread(SentenceTransformer, self.model_name)
+                self._redis = redis.from_url(self.redis_url, decode_responses=True)
+                for key, raw in (await self._redis.hgetall(self.hash_key)).items():
+                    self._embeddings[key] = json.loads(raw)["embedding"]
+                self._ready = True
+                logger.info(f"Semantic cache ready with {len(self._embeddings)} entries")
+            except Exception as e:
+                logger.warning(f"Semantic cache disabled: {e}")
+                self._ready = False
+        return self._ready
+    
+    async def embed(self, text: str) -> Optional[List[float]]:
+        """Embed text off the event loop; returns None when the cache is unavailable."""
+        if not await self._ensure_ready():
+            return None
+        vector = await asyncio.to_thread(self._model.encode, text, normalize_embeddings=True)
+        return vector.tolist()
+    
+    async def lookup(self, embedding: List[float]) -> Optional[Dict[str, Any]]:
+        """Return the stored result of the most similar entry above the threshold."""
+        if not self._embeddings:
+            return None
+        if self._matrix is None:
+            self._keys = list(self._embeddings)
+            self._matrix = self._np.asarray([self._embeddings[k] for k in self._keys], dtype=self._np.float32)
+        # Embeddings are normalized, so the dot products are the cosine similarities
+        scores = self._matrix @ self._np.asarray(embedding, dtype=self._np.float32)
+        best = int(scores.argmax())
+        if scores[best] < self.threshold:
+            return None
+        best_key = self._keys[best]
+        try:
+            raw = await self._redis.hget(self.hash_key, best_key)
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+            return None
+        if raw is None:
+            self._embeddings.pop(best_key, None)
+            self._matrix = None
+            return None
+        return json.loads(raw)["result"]
+    
+    async def store(self, key: str, embedding: List[float], result: Dict[str, Any]) -> None:
+        """Persist a result and its embedding."""
+        if len(self._embeddings) >= self.max_entries and key not in self._embeddings:
+            return
+        try:
+            value = json.dumps({"embedding": embedding, "result": jsonable_encoder(result)})
+            await self._redis.hset(self.hash_key, key, value)
+            await self._redis.expire(self.hash_key, self.ttl_seconds)
+            self._embeddings[key] = embedding
+            self._matrix = None
+        except Exception as e:
+            logger.warning(f"Semantic cache store failed: {e}")
+
+
+_semantic_cache: Optional[SemanticResultCache] = None
+if ENABLE_SEMANTIC_CACHE:
+    _semantic_cache = SemanticResultCache(
+        redis_url=os.getenv("REDIS_URL", "redis://localhost:6379"),
+        threshold=1.0 - float(os.getenv("SEMANTIC_CACHE_DISTANCE", "0.05")),
+        model_name=os.getenv("SEMANTIC_CACHE_MODEL", "all-MiniLM-L6-v2"),
+        ttl_seconds=int(RESULT_CACHE_TTL_SECONDS)
+    )
+
+
+def _request_semantic_text(request: "DevelopmentRequest") -> str:
+    """Concatenate the free-text requirements used for similarity matching."""
+    return "\n".join((
+        request.category,
+        request.strategic_requirements,
+        request.creative_requirements,
+        request.ux_requirements
+    ))
+
+
+# Optional micro-batching of concurrent development requests
+ENABLE_REQUEST_BATCHING = os.getenv("ENABLE_REQUEST_BATCHING", "false").lower() in {"true", "1", "yes", "on"}
+BATCH_WINDOW_SECONDS = float(os.getenv("BATCH_WINDOW_SECONDS", "0.05"))
+MAX_BATCH = int(os.getenv("MAX_BATCH", "8"))
+_batch_queue: Optional[asyncio.Queue] = None
+
+# Strong references to the batch worker and in-flight batches; the event loop
+# only keeps weak ones, so an unreferenced task could be collected mid-batch
+_batch_tasks: Set[asyncio.Task] = set()
+
+
+def _spawn_batch_task(coro) -> asyncio.Task:
+    """Start a batching task and keep it referenced until it finishes."""
+    task = asyncio.create_task(coro)
+    _batch_tasks.add(task)
+    task.add_done_callback(_batch_tasks.discard)
+    return task
+
+
+# Developer campfires as (name, primary channel, temperature); the rest of the
+# LLM configuration is shared
+CAMPFIRE_SPECS = [
+    ("backend_developer", "dev-backend", 0.3),
+    ("frontend_developer", "dev-frontend", 0.4),
+    ("ux_developer", "dev-ux", 0.5),
+]
+LLM_CONFIG_TEMPLATE = {
+    "provider": "openrouter",
+    "model": "anthropic/claude-3.5-sonnet",
+    "max_tokens": 4000
+}
+
 
 async def initialize_valley():
     """Initialize the CampfireValley system."""
@@ -79,82 +365,164 @@ async def initialize_valley():
         valley = Valley("development-team")
         await valley.start()
         
-        # Provision required developer campfires
+        # Provision required developer campfires concurrently
         from campfirevalley.config import CampfireConfig
         
-        # Backend developer campfire
-        backend_config = CampfireConfig(
-            name="backend_developer",
-            type="LLMCampfire",
-            channels=["dev-backend", "dev-team", "auditor-review"],
-            config={
-                "llm": {
-                    "provider": "openrouter",
-                    "model": "anthropic/claude-3.5-sonnet",
-                    "temperature": 0.3,
-                    "max_tokens": 4000
-                }
-            }
-        )
-        await valley.provision_campfire(backend_config)
-        
-        # Frontend developer campfire
-        frontend_config = CampfireConfig(
-            name="frontend_developer",
-            type="LLMCampfire",
-            channels=["dev-frontend", "dev-team", "auditor-review"],
-            config={
-                "llm": {
-                    "provider": "openrouter",
-                    "model": "anthropic/claude-3.5-sonnet",
-                    "temperature": 0.4,
-                    "max_tokens": 4000
-                }
-            }
-        )
-        await valley.provision_campfire(frontend_config)
-        
-        # UX developer campfire
-        ux_config = CampfireConfig(
-            name="ux_developer",
-            type="LLMCampfire",
-            channels=["dev-ux", "dev-team", "auditor-review"],
-            config={
-                "llm": {
-                    "provider": "openrouter",
-                    "model": "anthropic/claude-3.5-sonnet",
-                    "temperature": 0.5,
-                    "max_tokens": 4000
-                }
-            }
-        )
-        await valley.provision_campfire(ux_config)
+        configs = [
+            CampfireConfig(
+                name=name,
+                type="LLMCampfire",
+                channels=[primary_channel, "dev-team", "auditor-review"],
+                config={"llm": {**LLM_CONFIG_TEMPLATE, "temperature": temperature}}
+            )
+            for name, primary_channel, temperature in CAMPFIRE_SPECS
+        ]
+        await asyncio.gather(*(valley.provision_campfire(c) for c in configs))
+        
+        if WARMUP_CAMPFIRES:
+            await warmup_campfires()
         
         logger.info("CampfireValley Development Team initialized successfully")
         logger.info(f"Provisioned campfires: {list(valley.get_campfires().keys())}")
+        valley_ready.set()
         return True
         
     except Exception as e:
-        logger.error(f"Failed to initialize valley: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Failed to initialize valley: %s", e)
         return False
 
 
+def _is_rate_limit_error(error: Exception) -> bool:
+    """Best-effort detection of provider rate-limit (HTTP 429) failures."""
+    status = getattr(error, "status_code", None) or getattr(error, "status", None)
+    if status == 429:
+        return True
+    message = str(error).lower()
+    return "429" in message or "rate limit" in message or "too many requests" in message
+
+
+async def process_torch_limited(torch: Torch) -> Any:
+    """Run a torch through the valley under the LLM concurrency cap.
+    
+    Rate-limited calls are retried with jittered exponential backoff; the
+    semaphore is released while waiting so other requests can proceed.
+    LLMCampfire swallows provider errors (including 429s) and answers None,
+    so an empty result is retried the same way and returned once attempts
+    run out.
+    """
+    result = None
+    for attempt in range(LLM_RETRY_ATTEMPTS):
+        async with llm_sem:
+            try:
+                result = await valley.process_torch(torch)
+            except Exception as e:
+                if attempt == LLM_RETRY_ATTEMPTS - 1 or not _is_rate_limit_error(e):
+                    raise
+                reason = "Rate limited"
+            else:
+                if result is not None or attempt == LLM_RETRY_ATTEMPTS - 1:
+                    return result
+                reason = "No response"
+        delay = random.uniform(1.0, min(LLM_RETRY_MAX_DELAY_SECONDS, 2.0 ** (attempt + 1)))
+        logger.warning(f"{reason} on torch {torch.torch_id}; retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+    return result
+
+
+async def warmup_campfires():
+    """Send a tiny torch through each campfire so LLM client connections are open before traffic."""
+    campfire_names = list(valley.get_campfires().keys())
+    warmup_torches = [
+        Torch(
+            claim="warmup",
+            source_campfire="development-team-server",
+            channel="development-requests",
+            torch_id=f"torch_warmup_{name}_{next(_torch_counter)}",
+            sender_valley="development-team",
+            target_address=f"valley:development-team/campfire:{name}",
+            signature="development_team_signature",
+            source="development-team-server",
+            destination=name,
+            data={"message": "ping"},
+            metadata={"warmup": True}
+        )
+        for name in campfire_names
+    ]
+    results = await asyncio.gather(
+        *(process_torch_limited(torch) for torch in warmup_torches),
+        return_exceptions=True
+    )
+    for name, result in zip(campfire_names, results):
+        if isinstance(result, BaseException):
+            logger.warning(f"Warmup failed for campfire {name}: {result}")
+
+
+async def wait_for_valley_ready():
+    """Wait briefly for startup to finish, raising 503 if the valley is still not ready."""
+    if valley_ready.is_set():
+        return
+    try:
+        await asyncio.wait_for(valley_ready.wait(), timeout=VALLEY_READY_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=503,
+            detail="Development team valley not ready"
+        )
+
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize the valley on startup."""
+    global _batch_queue
     await initialize_valley()
+    
+    if ENABLE_REQUEST_BATCHING:
+        _batch_queue = asyncio.Queue()
+        _spawn_batch_task(_batch_worker())
+        logger.info(f"Request batching enabled (window={BATCH_WINDOW_SECONDS}s, max_batch={MAX_BATCH})")
 
 
-@app.get("/health")
-def health_check():
-    """Health check endpoint for Docker health checks."""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "service": "development-team",
-        "valley_status": "initialized" if valley else "not_initialized"
-    }
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the micro-batcher; callers still waiting on it get an error instead of hanging."""
+    global _batch_queue
+    queue_, _batch_queue = _batch_queue, None
+    tasks = list(_batch_tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    
+    while queue_ is not None and not queue_.empty():
+        _, future = queue_.get_nowait()
+        if not future.done():
+            future.set_exception(RuntimeError("Development team server is shutting down"))
+
+
+# Static parts of the health payload; only the timestamp changes per probe
+_HEALTH_READY_BODY = {
+    "status": "healthy",
+    "service": "development-team",
+    "valley_status": "initialized"
+}
+_HEALTH_STARTING_BODY = {
+    "status": "starting",
+    "service": "development-team",
+    "valley_status": "not_initialized"
+}
+
+
+@app.api_route("/health", methods=["GET", "HEAD"])
+async def health_check(request: Request):
+    """Health check endpoint for Docker health checks; returns 503 until the valley is ready.
+    
+    HEAD gets the status code alone, so probes need not read or parse a body.
+    """
+    if request.method == "HEAD":
+        return Response(status_code=200 if valley_ready.is_set() else 503)
+    timestamp = datetime.now(timezone.utc).isoformat()
+    if valley_ready.is_set():
+        return DEFAULT_RESPONSE_CLASS({**_HEALTH_READY_BODY, "timestamp": timestamp})
+    return DEFAULT_RESPONSE_CLASS({**_HEALTH_STARTING_BODY, "timestamp": timestamp}, status_code=503)
 
 
 @app.get("/")
@@ -163,186 +531,478 @@ async def root():
     return {
         "message": "CampfireValley Development Team Server",
         "status": "running",
-        "endpoints": ["/health", "/api/develop_website"]
+        "endpoints": ["/health", "/api/develop_website", "/api/develop_website/batch", "/api/develop_website/stream"]
     }
 
 
 @app.post("/api/develop_website")
-async def develop_website(request: DevelopmentRequest):
+async def develop_website(request: DevelopmentRequest, response: Response):
     """Process website development requests."""
+    await wait_for_valley_ready()
+    
     try:
-        logger.info(f"Received development request for idea: {request.idea_id}")
+        logger.info("Received development request for idea: %s", request.idea_id)
         
-        if not valley:
-            raise HTTPException(
-                status_code=500, 
-                detail="Development team valley not initialized"
-            )
+        # Identical requirements produce the same plan, so serve repeats from cache
+        now_iso = datetime.now(timezone.utc).isoformat()
+        cache_key = _request_cache_key(request)
+        cached = _get_cached_result(cache_key)
+        if cached is not None:
+            response.headers["X-Cache"] = "HIT"
+            logger.info("Serving cached development plan for idea: %s", request.idea_id)
+            return {**cached, "idea_id": request.idea_id, "timestamp": now_iso}
+        
+        # Fall back to near-duplicate matching when the semantic cache is enabled
+        embedding = None
+        if _semantic_cache is not None:
+            embedding = await _semantic_cache.embed(_request_semantic_text(request))
+            if embedding is not None:
+                cached = await _semantic_cache.lookup(embedding)
+                if cached is not None:
+                    _set_cached_result(cache_key, cached)
+                    response.headers["X-Cache"] = "SEMANTIC-HIT"
+                    logger.info("Serving semantically cached development plan for idea: %s", request.idea_id)
+                    return {**cached, "idea_id": request.idea_id, "timestamp": now_iso}
         
         # Process the development request
-        result = await process_development_request(request)
+        result = await submit_development_request(request)
+        if _is_cacheable_result(result):
+            _set_cached_result(cache_key, result)
+            if embedding is not None:
+                await _semantic_cache.store(cache_key, embedding, result)
+        response.headers["X-Cache"] = "MISS"
         
-        logger.info(f"Successfully processed idea: {request.idea_id}")
+        logger.info("Successfully processed idea: %s", request.idea_id)
         return result
         
     except Exception as e:
-        logger.error(f"Development processing failed: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Development processing failed: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Development processing failed: {str(e)}"
         )
 
 
+@app.post("/api/develop_website/batch")
+async def develop_website_batch(batch: DevelopmentBatchRequest, response: Response):
+    """Process several website development requests in one call.
+    
+    Cache hits are answered directly; the misses share one torch per campfire
+    via process_development_batch. Results are returned in request order.
+    """
+    await wait_for_valley_ready()
+    
+    try:
+        logger.info("Received development batch of %d requests", len(batch.requests))
+        
+        now_iso = datetime.now(timezone.utc).isoformat()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(batch.requests)
+        misses: List[Tuple[int, DevelopmentRequest, str]] = []
+        for index, request in enumerate(batch.requests):
+            cache_key = _request_cache_key(request)
+            cached = _get_cached_result(cache_key)
+            if cached is not None:
+                results[index] = {**cached, "idea_id": request.idea_id, "timestamp": now_iso}
+            else:
+                misses.append((index, request, cache_key))
+        
+        if misses:
+            miss_requests = [request for _, request, _ in misses]
+            if len(miss_requests) == 1:
+                processed = [await process_development_request(miss_requests[0])]
+            else:
+                processed = await process_development_batch(miss_requests)
+            for (index, _, cache_key), result in zip(misses, processed):
+                if _is_cacheable_result(result):
+                    _set_cached_result(cache_key, result)
+                results[index] = result
+        
+        response.headers["X-Cache-Hits"] = str(len(batch.requests) - len(misses))
+        return {"results": results}
+        
+    except Exception as e:
+        logger.exception("Development batch processing failed: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Development batch processing failed: {str(e)}"
+        )
+
+
+def _sse_event(payload: Dict[str, Any]) -> str:
+    """Format a payload as a Server-Sent Events data frame."""
+    encoded = jsonable_encoder(payload)
+    body = orjson.dumps(encoded).decode("utf-8") if ORJSON_AVAILABLE else json.dumps(encoded)
+    return f"data: {body}\n\n"
+
+
+async def _stream_development_request(request: DevelopmentRequest) -> AsyncIterator[str]:
+    """Yield each campfire's analysis as soon as it completes, then a completion event."""
+    start_time = time.perf_counter()
+    _, pairs = _build_development_torches(request)
+    
+    async def run(name: str, torch: Torch) -> Tuple[str, Any]:
+        try:
+            return name, await process_torch_limited(torch)
+        except Exception as e:
+            logger.error(f"Campfire {name} failed for idea {request.idea_id}: {e}")
+            return name, e
+    
+    campfires_used = []
+    for next_result in asyncio.as_completed([run(name, torch) for name, torch in pairs]):
+        name, result = await next_result
+        if isinstance(result, Exception):
+            yield _sse_event({"campfire": name, "status": "error", "error": str(result)})
+            continue
+        campfires_used.append(name)
+        yield _sse_event({"campfire": name, "status": "completed", "result": result})
+    
+    yield _sse_event({
+        "idea_id": request.idea_id,
+        "status": "completed",
+        "processing_time_seconds": time.perf_counter() - start_time,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "summary": {
+            "total_analyses": len(campfires_used),
+            "campfires_used": campfires_used
+        }
+    })
+
+
+@app.post("/api/develop_website/stream")
+async def develop_website_stream(request: DevelopmentRequest):
+    """Process a website development request, streaming each campfire result via SSE."""
+    await wait_for_valley_ready()
+    logger.info("Received streaming development request for idea: %s", request.idea_id)
+    
+    return StreamingResponse(
+        _stream_development_request(request),
+        media_type="text/event-stream"
+    )
+
+
+def _build_development_torches(request: DevelopmentRequest) -> Tuple[Torch, List[Tuple[str, Torch]]]:
+    """Build the base development torch and one (result_key, torch) pair per available developer campfire."""
+    now = datetime.now(timezone.utc)
+    ts = int(now.timestamp())
+    
+    # Create a comprehensive development torch with all required fields
+    development_torch = Torch(
+        claim="website_development_request",
+        source_campfire="development-team-server",
+        channel="development-requests",
+        torch_id=f"torch_dev_{request.idea_id}_{ts}_{next(_torch_counter)}",
+        sender_valley="development-team",
+        target_address="valley:development-team/campfire:backend_developer",
+        signature="development_team_signature",
+        source="development-team-server",
+        destination="backend_developer",
+        data={
+            "idea_id": request.idea_id,
+            "category": request.category,
+            "source_team": request.source_team,
+            "strategic_requirements": request.strategic_requirements,
+            "creative_requirements": request.creative_requirements,
+            "ux_requirements": request.ux_requirements,
+            "request_timestamp": request.timestamp
+        },
+        metadata={
+            "idea_id": request.idea_id,
+            "category": request.category,
+            "source_team": request.source_team,
+            "request_timestamp": request.timestamp,
+            "processing_timestamp": now.isoformat()
+        }
+    )
+    
+    # Get available campfires
+    available_campfires = valley.get_campfires()
+    
+    # Build one torch per available developer campfire
+    pairs = []
+    
+    # Backend development analysis
+    if "backend_developer" in available_campfires:
+        pairs.append(("backend_analysis", development_torch))
+    
+    # Frontend development analysis
+    if "frontend_developer" in available_campfires:
+        # Retarget a deep copy of the base torch for frontend; model_copy skips re-validation
+        # and deep=True gives it its own data/metadata/attachments, which campfires write into.
+        frontend_torch = development_torch.model_copy(deep=True, update={
+            "torch_id": f"torch_frontend_{request.idea_id}_{ts}_{next(_torch_counter)}",
+            "target_address": "valley:development-team/campfire:frontend_developer",
+            "destination": "frontend_developer"
+        })
+        pairs.append(("frontend_analysis", frontend_torch))
+    
+    # UX development analysis
+    if "ux_developer" in available_campfires:
+        # Retarget a deep copy of the base torch for UX
+        ux_torch = development_torch.model_copy(deep=True, update={
+            "torch_id": f"torch_ux_{request.idea_id}_{ts}_{next(_torch_counter)}",
+            "target_address": "valley:development-team/campfire:ux_developer",
+            "destination": "ux_developer"
+        })
+        pairs.append(("ux_analysis", ux_torch))
+    
+    return development_torch, pairs
+
+
 async def process_development_request(request: DevelopmentRequest) -> Dict[str, Any]:
     """Process a development request using the valley campfires."""
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     
     try:
-        # Create a comprehensive development torch with all required fields
-        development_torch = Torch(
-            claim="website_development_request",
-            source_campfire="development-team-server",
-            channel="development-requests",
-            torch_id=f"torch_dev_{request.idea_id}_{int(datetime.now().timestamp())}",
-            sender_valley="development-team",
-            target_address="valley:development-team/campfire:backend_developer",
-            signature="development_team_signature",
-            source="development-team-server",
-            destination="backend_developer",
-            content=f"""
-            Website Development Request
-            ==========================
-            
-            Idea ID: {request.idea_id}
-            Category: {request.category}
-            Source: {request.source_team}
-            Timestamp: {request.timestamp}
-            
-            Strategic Requirements:
-            {request.strategic_requirements}
-            
-            Creative Requirements:
-            {request.creative_requirements}
-            
-            UX Requirements:
-            {request.ux_requirements}
-            
-            Please provide a comprehensive development plan including:
-            1. Technical architecture
-            2. Technology stack recommendations
-            3. Implementation roadmap
-            4. Resource requirements
-            5. Timeline estimates
-            """,
-            data={
-                "idea_id": request.idea_id,
-                "category": request.category,
-                "source_team": request.source_team,
-                "strategic_requirements": request.strategic_requirements,
-                "creative_requirements": request.creative_requirements,
-                "ux_requirements": request.ux_requirements,
-                "request_timestamp": request.timestamp
-            },
-            metadata={
-                "idea_id": request.idea_id,
-                "category": request.category,
-                "source_team": request.source_team,
-                "request_timestamp": request.timestamp,
-                "processing_timestamp": datetime.now().isoformat()
-            }
-        )
+        development_torch, pairs = _build_development_torches(request)
         
         # Process through different development campfires
         results = {}
         
-        # Get available campfires
-        available_campfires = valley.get_campfires()
-        
-        # Backend development analysis
-        if "backend_developer" in available_campfires:
-            backend_result = await valley.process_torch(development_torch)
-            results["backend_analysis"] = backend_result
+        # Run the campfires concurrently; one failure must not cancel the others
+        results_list = await asyncio.gather(
+            *(process_torch_limited(torch) for _, torch in pairs),
+            return_exceptions=True
+        )
+        for (name, _), result in zip(pairs, results_list):
+            if isinstance(result, BaseException):
+                logger.error(f"Campfire {name} failed for idea {request.idea_id}: {result}")
+                continue
+            results[name] = result
         
-        # Frontend development analysis  
-        if "frontend_developer" in available_campfires:
-            # Update target for frontend
-            frontend_torch = Torch(
-                claim="website_development_request",
-                source_campfire="development-team-server",
-                channel="development-requests",
-                torch_id=f"torch_frontend_{request.idea_id}_{int(datetime.now().timestamp())}",
-                sender_valley="development-team",
-                target_address="valley:development-team/campfire:frontend_developer",
-                signature="development_team_signature",
-                source="development-team-server",
-                destination="frontend_developer",
-                data=development_torch.data,
-                metadata=development_torch.metadata
-            )
-            frontend_result = await valley.process_torch(frontend_torch)
-            results["frontend_analysis"] = frontend_result
-        
-        # UX development analysis
-        if "ux_developer" in available_campfires:
-            # Update target for UX
-            ux_torch = Torch(
-                claim="website_development_request",
-                source_campfire="development-team-server",
-                channel="development-requests",
-                torch_id=f"torch_ux_{request.idea_id}_{int(datetime.now().timestamp())}",
-                sender_valley="development-team",
-                target_address="valley:development-team/campfire:ux_developer",
-                signature="development_team_signature",
-                source="development-team-server",
-                destination="ux_developer",
-                data=development_torch.data,
-                metadata=development_torch.metadata
-            )
-            ux_result = await valley.process_torch(ux_torch)
-            results["ux_analysis"] = ux_result
+        expected_analyses = len(pairs)
         
         # If no specific campfires, use general processing
         if not results:
-            general_result = await valley.process_torch(development_torch)
+            general_result = await process_torch_limited(development_torch)
             results["general_analysis"] = general_result
+            expected_analyses = 1
         
         # Calculate processing time
-        processing_time = (datetime.now() - start_time).total_seconds()
+        processing_time = time.perf_counter() - start_time
         
         # Prepare response
         response = {
             "idea_id": request.idea_id,
             "status": "completed",
             "processing_time_seconds": processing_time,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "development_analysis": results,
             "summary": {
                 "total_analyses": len(results),
+                "expected_analyses": expected_analyses,
                 "campfires_used": list(results.keys()),
                 "recommendation": "Development plan generated successfully"
             }
         }
         
         # Log the successful processing
-        logger.info(f"Development request {request.idea_id} processed in {processing_time:.2f}s")
+        logger.info("Development request %s processed in %.2fs", request.idea_id, processing_time)
         
         return response
         
     except Exception as e:
-        logger.error(f"Error processing development request: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error processing development request: %s", e)
         
         # Return error response
         return {
             "idea_id": request.idea_id,
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.now().isoformat(),
-            "processing_time_seconds": (datetime.now() - start_time).total_seconds()
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "processing_time_seconds": time.perf_counter() - start_time
         }
 
 
+async def submit_development_request(request: DevelopmentRequest) -> Dict[str, Any]:
+    """Process a request directly, or via the micro-batcher when batching is enabled."""
+    if _batch_queue is None:
+        return await process_development_request(request)
+    
+    future = asyncio.get_running_loop().create_future()
+    await _batch_queue.put((request, future))
+    return await future
+
+
+async def _batch_worker():
+    """Collect requests arriving within the batch window and process them together."""
+    queue_ = _batch_queue
+    while True:
+        batch = [await queue_.get()]
+        try:
+            await asyncio.sleep(BATCH_WINDOW_SECONDS)
+        except asyncio.CancelledError:
+            # Requests already taken off the queue would otherwise wait forever
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("Development team server is shutting down"))
+            raise
+        while len(batch) < MAX_BATCH and not queue_.empty():
+            batch.append(queue_.get_nowait())
+        _spawn_batch_task(_run_batch(batch))
+
+
+async def _run_batch(batch: List[Tuple[DevelopmentRequest, asyncio.Future]]):
+    """Resolve each waiting caller's future with its share of the batch result."""
+    requests = [request for request, _ in batch]
+    try:
+        if len(requests) == 1:
+            results = [await process_development_request(requests[0])]
+        else:
+            results = await process_development_batch(requests)
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+    except Exception as e:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(e)
+    except asyncio.CancelledError:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(RuntimeError("Development team server is shutting down"))
+        raise
+
+
+def _split_batch_result(result: Any, idea_ids: List[str]) -> Optional[Dict[str, Any]]:
+    """Demultiplex a campfire's batched answer into per-idea results.
+    
+    The batch prompt asks for a JSON object keyed by idea_id, which LLMCampfire
+    stores in torch.data["llm_response"] (possibly inside a ```json fence).
+    Returns None when the campfire did not honour that format.
+    """
+    data = getattr(result, "data", None) or {}
+    answer = data.get("llm_response") if isinstance(data, dict) else None
+    if isinstance(answer, str):
+        text = answer.strip()
+        if text.startswith("```"):
+            text = text.split("\n", 1)[1] if "\n" in text else ""
+            text = text.rsplit("```", 1)[0]
+        try:
+            answer = json.loads(text)
+        except ValueError:
+            answer = None
+    if isinstance(answer, dict) and all(idea_id in answer for idea_id in idea_ids):
+        return {idea_id: answer[idea_id] for idea_id in idea_ids}
+    return None
+
+
+async def _process_individually(requests: List[DevelopmentRequest]) -> List[Dict[str, Any]]:
+    """Process each request on its own torches, keeping request order."""
+    return list(await asyncio.gather(*(process_development_request(request) for request in requests)))
+
+
+async def process_development_batch(requests: List[DevelopmentRequest]) -> List[Dict[str, Any]]:
+    """Process several development requests with one torch per campfire.
+    
+    The requests may come from different callers, so an answer that cannot be
+    split per idea is never shared between them: the whole batch is then
+    processed again one request at a time.
+    """
+    start_time = time.perf_counter()
+    now = datetime.now(timezone.utc)
+    ts = int(now.timestamp())
+    idea_ids = [request.idea_id for request in requests]
+    
+    # Answers are keyed by idea_id, so repeated ids could not be told apart
+    if len(set(idea_ids)) != len(idea_ids):
+        return await _process_individually(requests)
+    
+    try:
+        available_campfires = valley.get_campfires()
+        targets = [
+            (name, campfire) for name, campfire in (
+                ("backend_analysis", "backend_developer"),
+                ("frontend_analysis", "frontend_developer"),
+                ("ux_analysis", "ux_developer")
+            ) if campfire in available_campfires
+        ]
+        
+        ideas = [{
+            "idea_id": request.idea_id,
+            "category": request.category,
+            "source_team": request.source_team,
+            "strategic_requirements": request.strategic_requirements,
+            "creative_requirements": request.creative_requirements,
+            "ux_requirements": request.ux_requirements,
+            "request_timestamp": request.timestamp
+        } for request in requests]
+        
+        torches = [
+            Torch(
+                claim="website_development_batch_request",
+                source_campfire="development-team-server",
+                channel="development-requests",
+                torch_id=f"torch_batch_{campfire}_{ts}_{next(_torch_counter)}",
+                sender_valley="development-team",
+                target_address=f"valley:development-team/campfire:{campfire}",
+                signature="development_team_signature",
+                source="development-team-server",
+                destination=campfire,
+                data={
+                    "ideas": ideas,
+                    "response_format": "Return a JSON object keyed by idea_id with one development plan per idea"
+                },
+                metadata={
+                    "idea_ids": idea_ids,
+                    "batch_size": len(requests),
+                    "processing_timestamp": now.isoformat()
+                }
+            )
+            for _, campfire in targets
+        ]
+        
+        results_list = await asyncio.gather(
+            *(process_torch_limited(torch) for torch in torches),
+            return_exceptions=True
+        )
+        
+        per_idea: Dict[str, Dict[str, Any]] = {idea_id: {} for idea_id in idea_ids}
+        for (name, _), result in zip(targets, results_list):
+            if isinstance(result, BaseException):
+                logger.error(f"Campfire {name} failed for batch {idea_ids}: {result}")
+                continue
+            split = _split_batch_result(result, idea_ids)
+            if split is None:
+                # The answer mixes every caller's requirements; never hand it out
+                logger.warning("Campfire %s did not answer per idea for batch %s; processing individually",
+                               name, idea_ids)
+                return await _process_individually(requests)
+            for idea_id, idea_result in split.items():
+                per_idea[idea_id][name] = idea_result
+        
+        processing_time = time.perf_counter() - start_time
+        completed_iso = datetime.now(timezone.utc).isoformat()
+        logger.info("Development batch of %d requests processed in %.2fs", len(requests), processing_time)
+        
+        return [{
+            "idea_id": idea_id,
+            "status": "completed" if per_idea[idea_id] else "error",
+            "processing_time_seconds": processing_time,
+            "timestamp": completed_iso,
+            "development_analysis": per_idea[idea_id],
+            "summary": {
+                "total_analyses": len(per_idea[idea_id]),
+                "expected_analyses": len(targets),
+                "campfires_used": list(per_idea[idea_id].keys()),
+                "batch_size": len(requests),
+                "recommendation": "Development plan generated successfully"
+            }
+        } for idea_id in idea_ids]
+        
+    except Exception as e:
+        logger.exception("Error processing development batch: %s", e)
+        
+        failed_iso = datetime.now(timezone.utc).isoformat()
+        processing_time = time.perf_counter() - start_time
+        return [{
+            "idea_id": idea_id,
+            "status": "error",
+            "error": str(e),
+            "timestamp": failed_iso,
+            "processing_time_seconds": processing_time
+        } for idea_id in idea_ids]
+
+
 if __name__ == "__main__":
     logger.info("Starting CampfireValley Development Team Server...")
     
@@ -350,11 +1010,39 @@ if __name__ == "__main__":
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", "8080"))
     
-    # Run the server
+    # Each worker process runs its own valley (initialized in startup_event);
+    # the in-process result caches are per worker as well. Every worker also has
+    # its own LLM semaphore, so split the provider limit between them.
+    workers = int(os.getenv("WORKERS", "1"))
+    if workers > 1:
+        os.environ["MAX_INFLIGHT_LLM"] = str(max(1, MAX_INFLIGHT_LLM // workers))
+    
+    # Prefer the libuv loop and C HTTP parser when installed (uvicorn[standard])
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "auto"
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "auto"
+    
+    # Run the server; an import string is required for multiple workers.
+    # For process supervision across cores, the equivalent gunicorn launch is
+    # (MAX_INFLIGHT_LLM is then the per-worker limit):
+    #   gunicorn -k uvicorn.workers.UvicornWorker -w $WORKERS development_team_server:app
     uvicorn.run(
-        app,
+        "development_team_server:app",
         host=host,
         port=port,
+        workers=workers,
+        loop=loop,
+        http=http,
+        limit_concurrency=int(os.getenv("LIMIT_CONCURRENCY", "200")),
+        backlog=int(os.getenv("BACKLOG", "2048")),
+        timeout_keep_alive=int(os.getenv("TIMEOUT_KEEP_ALIVE", "30")),
         log_level="info",
-        access_log=True
-    )
\ No newline at end of file
+        access_log=False
+    )
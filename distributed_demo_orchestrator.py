@@ -15,212 +15,36 @@ Date: 2024
 import asyncio
 import logging
 import os
-import subprocess
-import time
+import shutil
+import string
 import json
+import aiofiles
 import aiohttp
-import requests
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 from demo_marketing_team import MarketingTeamDemo
 
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class DistributedDemoOrchestrator:
     """Orchestrates the distributed CampfireValley demo."""
     
-    def __init__(self, 
-                 docker_compose_path: str = "docker-compose.yml",
-                 dev_team_url: str = "http://localhost:8080",
-                 reports_dir: str = "reports"):
-        """
-        Initialize the distributed demo orchestrator.
-        
-        Args:
-            docker_compose_path: Path to the docker-compose.yml file
-            dev_team_url: URL of the dockerized development team
-            reports_dir: Directory to store reports
-        """
-        self.docker_compose_path = docker_compose_path
-        self.dev_team_url = dev_team_url
-        self.reports_dir = Path(reports_dir)
-        self.reports_dir.mkdir(exist_ok=True)
-        
-        # Setup logging
-        self.logger = logging.getLogger(__name__)
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        
-        # Demo state
-        self.demo_start_time = None
-        self.demo_end_time = None
-        self.marketing_results = {}
-        self.development_results = {}
-        self.docker_container_id = None
-        
-    async def start_docker_development_team(self) -> bool:
-        """Start the dockerized development team."""
-        self.logger.info("Starting dockerized development team...")
-        
-        try:
-            # Check if docker-compose file exists
-            if not os.path.exists(self.docker_compose_path):
-                self.logger.error(f"Docker compose file not found: {self.docker_compose_path}")
-                return False
-            
-            # Start the docker services
-            result = subprocess.run(
-                ["docker-compose", "up", "-d", "--build"],
-                cwd=os.path.dirname(os.path.abspath(self.docker_compose_path)),
-                capture_output=True,
-                text=True
-            )
-            
-            if result.returncode != 0:
-                self.logger.error(f"Failed to start docker services: {result.stderr}")
-                return False
-            
-            self.logger.info("Docker services started successfully")
-            
-            # Wait for the development team to be ready
-            return await self._wait_for_development_team_ready()
-            
-        except Exception as e:
-            self.logger.error(f"Error starting docker development team: {e}")
-            return False
-    
-    async def _wait_for_development_team_ready(self, max_wait_time: int = 120) -> bool:
-        """Wait for the development team to be ready."""
-        self.logger.info("Waiting for development team to be ready...")
-        
-        start_time = time.time()
-        while time.time() - start_time < max_wait_time:
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(f"{self.dev_team_url}/health", timeout=5) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            if data.get("status") == "healthy":
-                                self.logger.info("Development team is ready!")
-                                return True
-            except Exception as e:
-                self.logger.debug(f"Development team not ready yet: {e}")
-            
-            await asyncio.sleep(5)
-        
-        self.logger.error("Development team failed to become ready within timeout")
-        return False
-    
-    async def stop_docker_development_team(self):
-        """Stop the dockerized development team."""
-        self.logger.info("Stopping dockerized development team...")
-        
-        try:
-            result = subprocess.run(
-                ["docker-compose", "down"],
-                cwd=os.path.dirname(os.path.abspath(self.docker_compose_path)),
-                capture_output=True,
-                text=True
-            )
-            
-            if result.returncode == 0:
-                self.logger.info("Docker services stopped successfully")
-            else:
-                self.logger.warning(f"Docker stop had issues: {result.stderr}")
-                
-        except Exception as e:
-            self.logger.error(f"Error stopping docker development team: {e}")
-    
-    async def run_marketing_team_demo(self) -> Dict[str, Any]:
-        """Run the local marketing team demo."""
-        self.logger.info("Starting marketing team demo...")
-        
-        try:
-            marketing_demo = MarketingTeamDemo(
-                dev_team_url=self.dev_team_url,
-                reports_dir=str(self.reports_dir)
-            )
-            
-            # Run the marketing team demo
-            results = await marketing_demo.run_demo()
-            self.marketing_results = results
-            
-            self.logger.info(f"Marketing team demo completed: {results['status']}")
-            return results
-            
-        except Exception as e:
-            self.logger.error(f"Error running marketing team demo: {e}")
-            return {"status": "error", "error": str(e)}
-    
-    async def get_development_team_results(self) -> Dict[str, Any]:
-        """Get results from the development team."""
-        self.logger.info("Retrieving development team results...")
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.dev_team_url}/api/results") as response:
-                    if response.status == 200:
-                        results = await response.json()
-                        self.development_results = results
-                        return results
-                    else:
-                        error_msg = f"Failed to get development results: {response.status}"
-                        self.logger.error(error_msg)
-                        return {"status": "error", "error": error_msg}
-                        
-        except Exception as e:
-            self.logger.error(f"Error getting development team results: {e}")
-            return {"status": "error", "error": str(e)}
-    
-    async def generate_combined_report(self) -> str:
-        """Generate a comprehensive HTML report showing both teams' work."""
-        self.logger.info("Generating combined report...")
-        
-        try:
-            # Get development team's HTML report
-            dev_report_html = ""
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(f"{self.dev_team_url}/api/report") as response:
-                        if response.status == 200:
-                            dev_report_html = await response.text()
-                        else:
-                            dev_report_html = f"<p>Error retrieving development report: {response.status}</p>"
-            except Exception as e:
-                dev_report_html = f"<p>Error retrieving development report: {e}</p>"
-            
-            # Generate combined HTML
-            combined_html = self._generate_combined_html_report(dev_report_html)
-            
-            # Save the report
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            report_filename = f"distributed_demo_report_{timestamp}.html"
-            report_path = self.reports_dir / report_filename
-            
-            with open(report_path, 'w', encoding='utf-8') as f:
-                f.write(combined_html)
-            
-            self.logger.info(f"Combined report saved to: {report_path}")
-            return str(report_path)
-            
-        except Exception as e:
-            self.logger.error(f"Error generating combined report: {e}")
-            return ""
-    
-    def _generate_combined_html_report(self, dev_report_html: str) -> str:
-        """Generate the combined HTML report."""
-        demo_duration = ""
-        if self.demo_start_time and self.demo_end_time:
-            duration = self.demo_end_time - self.demo_start_time
-            demo_duration = f"{duration.total_seconds():.1f} seconds"
-        
-        marketing_ideas_count = len(self.marketing_results.get("results", {}).get("marketing_ideas", []))
-        dev_requests_count = len(self.marketing_results.get("results", {}).get("development_requests", []))
-        
-        return f"""
+    # Combined report markup, parsed once at class creation. The dev-team HTML is
+    # streamed between the head and tail so it is never concatenated in memory.
+    _REPORT_HEAD_TEMPLATE = string.Template("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -228,93 +52,93 @@ class DistributedDemoOrchestrator:
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Distributed CampfireValley Demo Report</title>
     <style>
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             line-height: 1.6;
             margin: 0;
             padding: 20px;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background: white;
             border-radius: 15px;
             box-shadow: 0 20px 40px rgba(0,0,0,0.1);
             overflow: hidden;
-        }}
-        .header {{
+        }
+        .header {
             background: linear-gradient(135deg, #ff6b6b, #ee5a24);
             color: white;
             padding: 40px;
             text-align: center;
-        }}
-        .header h1 {{
+        }
+        .header h1 {
             margin: 0;
             font-size: 2.5em;
             font-weight: 300;
-        }}
-        .header p {{
+        }
+        .header p {
             margin: 10px 0 0 0;
             font-size: 1.2em;
             opacity: 0.9;
-        }}
-        .overview {{
+        }
+        .overview {
             padding: 30px;
             background: #f8f9fa;
             border-bottom: 1px solid #e9ecef;
-        }}
-        .overview h2 {{
+        }
+        .overview h2 {
             color: #2c3e50;
             margin-bottom: 20px;
-        }}
-        .stats {{
+        }
+        .stats {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             margin-bottom: 20px;
-        }}
-        .stat-card {{
+        }
+        .stat-card {
             background: white;
             padding: 20px;
             border-radius: 10px;
             box-shadow: 0 5px 15px rgba(0,0,0,0.1);
             text-align: center;
-        }}
-        .stat-number {{
+        }
+        .stat-number {
             font-size: 2em;
             font-weight: bold;
             color: #3498db;
-        }}
-        .stat-label {{
+        }
+        .stat-label {
             color: #7f8c8d;
             margin-top: 5px;
-        }}
-        .team-section {{
+        }
+        .team-section {
             padding: 30px;
             border-bottom: 1px solid #e9ecef;
-        }}
-        .team-section h2 {{
+        }
+        .team-section h2 {
             color: #2c3e50;
             margin-bottom: 20px;
             padding-bottom: 10px;
             border-bottom: 3px solid #3498db;
-        }}
-        .team-section.marketing h2 {{
+        }
+        .team-section.marketing h2 {
             border-bottom-color: #e74c3c;
-        }}
-        .team-section.development h2 {{
+        }
+        .team-section.development h2 {
             border-bottom-color: #27ae60;
-        }}
-        .workflow-diagram {{
+        }
+        .workflow-diagram {
             background: #f8f9fa;
             padding: 20px;
             border-radius: 10px;
             margin: 20px 0;
             text-align: center;
-        }}
-        .workflow-step {{
+        }
+        .workflow-step {
             display: inline-block;
             background: white;
             padding: 15px 25px;
@@ -322,8 +146,8 @@ class DistributedDemoOrchestrator:
             border-radius: 25px;
             box-shadow: 0 3px 10px rgba(0,0,0,0.1);
             position: relative;
-        }}
-        .workflow-step:not(:last-child)::after {{
+        }
+        .workflow-step:not(:last-child)::after {
             content: '→';
             position: absolute;
             right: -25px;
@@ -331,17 +155,17 @@ class DistributedDemoOrchestrator:
             transform: translateY(-50%);
             font-size: 1.5em;
             color: #3498db;
-        }}
-        .footer {{
+        }
+        .footer {
             padding: 30px;
             text-align: center;
             background: #2c3e50;
             color: white;
-        }}
-        .timestamp {{
+        }
+        .timestamp {
             color: #95a5a6;
             font-size: 0.9em;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -355,15 +179,15 @@ class DistributedDemoOrchestrator:
             <h2>Demo Overview</h2>
             <div class="stats">
                 <div class="stat-card">
-                    <div class="stat-number">{marketing_ideas_count}</div>
+                    <div class="stat-number">$marketing_ideas_count</div>
                     <div class="stat-label">Website Ideas Generated</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-number">{dev_requests_count}</div>
+                    <div class="stat-number">$dev_requests_count</div>
                     <div class="stat-label">Development Requests</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-number">{demo_duration}</div>
+                    <div class="stat-number">$demo_duration</div>
                     <div class="stat-label">Demo Duration</div>
                 </div>
                 <div class="stat-card">
@@ -384,24 +208,321 @@ class DistributedDemoOrchestrator:
         
         <div class="team-section marketing">
             <h2>🎯 Marketing Team (Local)</h2>
-            <p><strong>Status:</strong> {self.marketing_results.get('status', 'Unknown')}</p>
-            <p><strong>Report:</strong> {self.marketing_results.get('report_path', 'Not available')}</p>
+            <p><strong>Status:</strong> $marketing_status</p>
+            <p><strong>Report:</strong> $marketing_report_path</p>
             <p>The local marketing team consisting of Marketing Strategist, Creative Director, and UX Researcher collaborated to generate innovative website ideas and sent them to the development team for implementation.</p>
         </div>
         
         <div class="team-section development">
             <h2>💻 Development Team (Dockerized)</h2>
-            {dev_report_html}
+            """)
+    _REPORT_TAIL_TEMPLATE = string.Template("""
         </div>
         
         <div class="footer">
             <p>Generated by CampfireValley Distributed Demo Orchestrator</p>
-            <p class="timestamp">Report generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+            <p class="timestamp">Report generated on $generated_at</p>
         </div>
     </div>
 </body>
 </html>
+""")
+    
+    def __init__(self, 
+                 docker_compose_path: str = "docker-compose.yml",
+                 dev_team_url: str = "http://localhost:8080",
+                 reports_dir: str = "reports"):
+        """
+        Initialize the distributed demo orchestrator.
+        
+        Args:
+            docker_compose_path: Path to the docker-compose.yml file
+            dev_team_url: URL of the dockerized development team
+            reports_dir: Directory to store reports
+        """
+        self.docker_compose_path = docker_compose_path
+        self._compose_cwd = os.path.dirname(os.path.abspath(docker_compose_path))
+        
+        # Resolve the compose CLI once: the standalone binary, else the docker plugin
+        compose_bin = shutil.which("docker-compose")
+        docker_bin = shutil.which("docker")
+        if compose_bin:
+            self._compose_cmd: Optional[List[str]] = [compose_bin]
+        elif docker_bin:
+            self._compose_cmd = [docker_bin, "compose"]
+        else:
+            self._compose_cmd = None
+        self.dev_team_url = dev_team_url
+        self.reports_dir = Path(reports_dir)
+        self.reports_dir.mkdir(exist_ok=True)
+        
+        self.logger = logging.getLogger(__name__)
+        
+        # Demo state
+        self.demo_start_time = None
+        self.demo_end_time = None
+        self._now_str = ""
+        self.marketing_results = {}
+        self._ideas_count = 0
+        self._dev_requests_count = 0
+        self.development_results = {}
+        self._dev_results_raw = b""
+        self.docker_container_id = None
+        
+        # Shared HTTP session, created lazily inside the running event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._health_head_ok = True
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the long-lived HTTP session used for all dev-team calls."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=75, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=30),
+                # gzip bodies are inflated while read, so read() yields bytes for orjson
+                auto_decompress=True
+            )
+        return self._session
+    
+    async def aclose(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        
+    async def start_docker_development_team(self) -> bool:
+        """Start the dockerized development team."""
+        self.logger.info("Starting dockerized development team...")
+        
+        try:
+            # Check if docker-compose file exists
+            if not os.path.exists(self.docker_compose_path):
+                self.logger.error(f"Docker compose file not found: {self.docker_compose_path}")
+                return False
+            if self._compose_cmd is None:
+                self.logger.error("Neither docker-compose nor docker found on PATH")
+                return False
+            
+            # Start the docker services without blocking the event loop
+            proc = await asyncio.create_subprocess_exec(
+                *self._compose_cmd, "up", "-d", "--build",
+                cwd=self._compose_cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            _, stderr = await proc.communicate()
+            
+            if proc.returncode != 0:
+                self.logger.error(f"Failed to start docker services: {stderr.decode(errors='replace')}")
+                return False
+            
+            self.logger.info("Docker services started successfully")
+            
+            # Wait for the development team to be ready
+            return await self._wait_for_development_team_ready()
+            
+        except Exception as e:
+            self.logger.error(f"Error starting docker development team: {e}")
+            return False
+    
+    async def _wait_for_development_team_ready(self, max_wait_time: int = 120) -> bool:
+        """Wait for the development team to be ready.
+        
+        Probes /health with exponential backoff (100 ms up to 2 s).
+        """
+        self.logger.info("Waiting for development team to be ready...")
+        
+        async def poll_until_ready():
+            delay = 0.1
+            while True:
+                try:
+                    if await self._probe_health():
+                        self.logger.info("Development team is ready!")
+                        return
+                except Exception as e:
+                    self.logger.debug("Development team not ready yet: %s", e)
+                
+                await asyncio.sleep(delay)
+                delay = min(delay * 1.6, 2.0)
+        
+        try:
+            # One overall deadline; an in-flight probe is cancelled when it expires
+            await asyncio.wait_for(poll_until_ready(), timeout=max_wait_time)
+            return True
+        
+        except asyncio.TimeoutError:
+            self.logger.error("Development team failed to become ready within timeout")
+            return False
+    
+    async def _probe_health(self) -> bool:
+        """Probe /health with a bodiless HEAD, falling back to GET + JSON if HEAD is refused."""
+        session = self._get_session()
+        if self._health_head_ok:
+            async with session.head(f"{self.dev_team_url}/health", timeout=5) as response:
+                if response.status not in (404, 405):
+                    return response.status == 200
+            self._health_head_ok = False
+        
+        async with session.get(f"{self.dev_team_url}/health", timeout=5) as response:
+            if response.status == 200:
+                data = _json_loads(await response.read())
+                return data.get("status") == "healthy"
+        return False
+    
+    async def stop_docker_development_team(self):
+        """Stop the dockerized development team."""
+        self.logger.info("Stopping dockerized development team...")
+        
+        if self._compose_cmd is None:
+            self.logger.warning("Neither docker-compose nor docker found on PATH; nothing to stop")
+            return
+        
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *self._compose_cmd, "down",
+                cwd=self._compose_cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            _, stderr = await proc.communicate()
+            
+            if proc.returncode == 0:
+                self.logger.info("Docker services stopped successfully")
+            else:
+                self.logger.warning(f"Docker stop had issues: {stderr.decode(errors='replace')}")
+                
+        except Exception as e:
+            self.logger.error(f"Error stopping docker development team: {e}")
+    
+    async def _start_and_signal(self, ready_evt: asyncio.Event) -> bool:
+        """Start the development team and set ready_evt once it is healthy."""
+        ready = await self.start_docker_development_team()
+        if ready:
+            ready_evt.set()
+        return ready
+    
+    async def run_marketing_team_demo(self, dev_team_ready: Optional[asyncio.Event] = None) -> Dict[str, Any]:
+        """Run the local marketing team demo."""
+        self.logger.info("Starting marketing team demo...")
+        
+        try:
+            marketing_demo = MarketingTeamDemo(
+                dev_team_url=self.dev_team_url,
+                reports_dir=str(self.reports_dir)
+            )
+            
+            # Run the marketing team demo
+            results = await marketing_demo.run_demo(dev_team_ready)
+            self.marketing_results = results
+            r = results.get("results", {})
+            self._ideas_count = len(r.get("marketing_ideas", []))
+            self._dev_requests_count = len(r.get("development_requests", []))
+            
+            self.logger.info(f"Marketing team demo completed: {results['status']}")
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Error running marketing team demo: {e}")
+            return {"status": "error", "error": str(e)}
+    
+    async def get_development_team_results(self) -> Dict[str, Any]:
+        """Get results from the development team."""
+        self.logger.info("Retrieving development team results...")
+        
+        try:
+            session = self._get_session()
+            async with session.get(f"{self.dev_team_url}/api/results") as response:
+                if response.status == 200:
+                    raw = await response.read()
+                    self._dev_results_raw = raw
+                    results = _json_loads(raw)
+                    self.development_results = results
+                    return results
+                else:
+                    error_msg = f"Failed to get development results: {response.status}"
+                    self.logger.error(error_msg)
+                    return {"status": "error", "error": error_msg}
+                        
+        except Exception as e:
+            self.logger.error(f"Error getting development team results: {e}")
+            return {"status": "error", "error": str(e)}
+    
+    async def _stream_dev_report(self, out):
+        """Stream the development team's HTML report into an open binary file."""
+        try:
+            session = self._get_session()
+            async with session.get(f"{self.dev_team_url}/api/report") as response:
+                if response.status == 200:
+                    async for chunk in response.content.iter_chunked(1 << 16):
+                        await out.write(chunk)
+                    return
+                await out.write(f"<p>Error retrieving development report: {response.status}</p>".encode('utf-8'))
+        except Exception as e:
+            await out.write(f"<p>Error retrieving development report: {e}</p>".encode('utf-8'))
+    
+    async def generate_combined_report(self, dev_report_html: Optional[str] = None,
+                                       dev_report_done: Optional[asyncio.Event] = None) -> str:
+        """Generate a comprehensive HTML report showing both teams' work.
+        
+        Unless dev_report_html is supplied, the development team's report is
+        streamed from /api/report straight into the file in 64 KB chunks.
+        dev_report_done, if given, is set once the dev team is no longer needed.
         """
+        self.logger.info("Generating combined report...")
+        
+        try:
+            # Save the report, streaming the static parts around the dev-team HTML
+            now = self.demo_end_time or datetime.now()
+            self._now_str = now.strftime('%Y-%m-%d %H:%M:%S')
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
+            report_filename = f"distributed_demo_report_{timestamp}.html"
+            report_path = self.reports_dir / report_filename
+            
+            head, tail = self._render_report_parts()
+            async with aiofiles.open(report_path, 'wb') as f:
+                await f.write(head.encode('utf-8'))
+                if dev_report_html is None:
+                    await self._stream_dev_report(f)
+                    if dev_report_done:
+                        dev_report_done.set()
+                else:
+                    await f.write(dev_report_html.encode('utf-8'))
+                await f.write(tail.encode('utf-8'))
+            
+            self.logger.info(f"Combined report saved to: {report_path}")
+            return str(report_path)
+            
+        except Exception as e:
+            self.logger.error(f"Error generating combined report: {e}")
+            return ""
+        
+        finally:
+            if dev_report_done:
+                dev_report_done.set()
+    
+    def _render_report_parts(self) -> Tuple[str, str]:
+        """Render the report markup before and after the embedded dev-team HTML."""
+        demo_duration = ""
+        if self.demo_start_time and self.demo_end_time:
+            duration = self.demo_end_time - self.demo_start_time
+            demo_duration = f"{duration.total_seconds():.1f} seconds"
+        
+        head = self._REPORT_HEAD_TEMPLATE.substitute(
+            marketing_ideas_count=self._ideas_count,
+            dev_requests_count=self._dev_requests_count,
+            demo_duration=demo_duration,
+            marketing_status=self.marketing_results.get('status', 'Unknown'),
+            marketing_report_path=self.marketing_results.get('report_path', 'Not available')
+        )
+        tail = self._REPORT_TAIL_TEMPLATE.substitute(
+            generated_at=self._now_str or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        )
+        return head, tail
+    
+    def _generate_combined_html_report(self, dev_report_html: str) -> str:
+        """Generate the combined HTML report."""
+        head, tail = self._render_report_parts()
+        return head + dev_report_html + tail
     
     async def run_distributed_demo(self) -> Dict[str, Any]:
         """Run the complete distributed demo."""
@@ -409,15 +530,21 @@ class DistributedDemoOrchestrator:
         self.demo_start_time = datetime.now()
         
         try:
-            # Step 1: Start the dockerized development team
-            if not await self.start_docker_development_team():
+            # Steps 1 & 2: Start the dockerized development team while the marketing
+            # team generates ideas; ideas are only sent once the dev team is ready
+            ready_evt = asyncio.Event()
+            docker_task = asyncio.create_task(self._start_and_signal(ready_evt))
+            marketing_task = asyncio.create_task(self.run_marketing_team_demo(ready_evt))
+            
+            if not await docker_task:
+                marketing_task.cancel()
+                await asyncio.gather(marketing_task, return_exceptions=True)
                 return {
                     "status": "error",
                     "error": "Failed to start dockerized development team"
                 }
             
-            # Step 2: Run the marketing team demo
-            marketing_results = await self.run_marketing_team_demo()
+            marketing_results = await marketing_task
             if marketing_results.get("status") != "success":
                 await self.stop_docker_development_team()
                 return {
@@ -425,15 +552,22 @@ class DistributedDemoOrchestrator:
                     "error": f"Marketing team demo failed: {marketing_results.get('error', 'Unknown error')}"
                 }
             
-            # Step 3: Get development team results
-            dev_results = await self.get_development_team_results()
-            
-            # Step 4: Generate combined report
+            # Steps 3-5: Get development team results while the combined report
+            # streams the dev team's HTML report to disk; the dev team is stopped
+            # as soon as both have been received, overlapping the rest of the write
             self.demo_end_time = datetime.now()
-            report_path = await self.generate_combined_report()
+            dev_report_done = asyncio.Event()
+            results_task = asyncio.create_task(self.get_development_team_results())
             
-            # Step 5: Stop the dockerized development team
-            await self.stop_docker_development_team()
+            async def stop_when_fetched():
+                await asyncio.gather(results_task, dev_report_done.wait(), return_exceptions=True)
+                await self.stop_docker_development_team()
+            
+            dev_results, report_path, _ = await asyncio.gather(
+                results_task,
+                self.generate_combined_report(dev_report_done=dev_report_done),
+                stop_when_fetched()
+            )
             
             return {
                 "status": "success",
@@ -442,8 +576,8 @@ class DistributedDemoOrchestrator:
                 "development_results": dev_results,
                 "combined_report_path": report_path,
                 "summary": {
-                    "ideas_generated": len(marketing_results.get("results", {}).get("marketing_ideas", [])),
-                    "development_requests": len(marketing_results.get("results", {}).get("development_requests", [])),
+                    "ideas_generated": self._ideas_count,
+                    "development_requests": self._dev_requests_count,
                     "teams_involved": 2
                 }
             }
@@ -455,6 +589,9 @@ class DistributedDemoOrchestrator:
                 "status": "error",
                 "error": str(e)
             }
+        
+        finally:
+            await self.aclose()
 
 
 async def main():
@@ -482,4 +619,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop speeds up the socket-heavy probe/results/report traffic when installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(main())
\ No newline at end of file
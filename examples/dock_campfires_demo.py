@@ -11,10 +11,15 @@ comprehensive valley dock functionality.
 """
 
 import asyncio
+import hashlib
 import logging
 import json
-from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from collections import Counter
+from contextlib import AsyncExitStack
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, List, Tuple
+
+import redis.asyncio as aioredis
 
 from campfirevalley.models import Torch, CampfireConfig
 from campfirevalley.mcp import RedisMCPBroker
@@ -23,6 +28,14 @@ from campfirevalley.campfires import (
     SanitizationLevel, ViolationType, SanctionType, PolicyRule
 )
 
+try:
+    import orjson
+    _json_dumps_bytes = orjson.dumps
+except ImportError:
+    orjson = None
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -30,6 +43,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Max torches buffered between integrated pipeline stages
+PIPELINE_QUEUE_SIZE = 8
+
+# Section separators for log and console output
+_RULE = "=" * 60
+_BANNER = "\n" + _RULE
+
+# Large fixture values, built once and shared by every demo instance
+_SPAM_MESSAGE = "spam " * 1000
+_BIG_RECORDS = list(range(1000))
+
+
+class _LengthWriter:
+    """File-like sink that only counts what is written to it."""
+    
+    def __init__(self):
+        self.n = 0
+    
+    def write(self, s: str):
+        # json.dump escapes non-ASCII by default, so characters equal UTF-8 bytes
+        self.n += len(s)
+
 
 class DockCampfiresDemo:
     """
@@ -39,10 +74,14 @@ class DockCampfiresDemo:
     def __init__(self):
         """Initialize the demo with MCP broker and campfires."""
         self.mcp_broker = None
+        self.redis_pool = None
         self.dockmaster = None
         self.sanitizer = None
         self.justice = None
         
+        # Serialized payloads keyed by id(payload); the payload is held so its id is not reused
+        self._payload_bytes_cache: Dict[int, Tuple[Any, bytes]] = {}
+        
         # Demo data
         self.demo_torches = []
         self.demo_results = {
@@ -51,50 +90,59 @@ class DockCampfiresDemo:
             'justice': []
         }
     
-    async def setup(self):
-        """Set up the demo environment."""
+    async def setup(self, stack: AsyncExitStack):
+        """
+        Set up the demo environment.
+        
+        Each resource registers its own teardown on stack as soon as it exists,
+        so closing the stack releases exactly what was set up, in reverse order.
+        """
         logger.info("Setting up Dock Campfires Demo...")
+        stack.callback(logger.info, "Cleanup completed!")
+        
+        # One bounded pool shared by all three campfires through the broker
+        self.redis_pool = aioredis.BlockingConnectionPool.from_url(
+            'redis://localhost:6379',
+            max_connections=64,
+            encoding='utf-8',
+            decode_responses=True
+        )
+        stack.push_async_callback(self.redis_pool.disconnect, inuse_connections=True)
         
-        # Initialize MCP broker
+        # Initialize MCP broker; concurrent campfire publishes share pipelined round trips
         self.mcp_broker = RedisMCPBroker(
-            host='localhost',
-            port=6379,
-            valley_name='DemoValley'
+            connection_string='redis://localhost:6379',
+            valley_name='DemoValley',
+            transport='pipelined',
+            serializer=orjson.dumps if orjson else None,
+            connection_pool=self.redis_pool
         )
         await self.mcp_broker.connect()
+        stack.push_async_callback(self.mcp_broker.disconnect)
         
         # Initialize campfires
         self.dockmaster = DockmasterCampfire(self.mcp_broker)
         self.sanitizer = SanitizerCampfire(self.mcp_broker)
         self.justice = JusticeCampfire(self.mcp_broker)
         
-        # Start all campfires
-        await self.dockmaster.start()
-        await self.sanitizer.start()
-        await self.justice.start()
+        # Start all campfires concurrently; they are stopped together on exit
+        await asyncio.gather(self.dockmaster.start(), self.sanitizer.start(), self.justice.start())
+        stack.push_async_callback(self._stop_campfires)
         
         # Create demo torches
         self._create_demo_torches()
         
         logger.info("Demo setup completed!")
     
-    async def cleanup(self):
-        """Clean up demo resources."""
+    async def _stop_campfires(self):
+        """Stop all campfires concurrently."""
         logger.info("Cleaning up demo resources...")
-        
-        if self.dockmaster:
-            await self.dockmaster.stop()
-        if self.sanitizer:
-            await self.sanitizer.stop()
-        if self.justice:
-            await self.justice.stop()
-        if self.mcp_broker:
-            await self.mcp_broker.disconnect()
-        
-        logger.info("Cleanup completed!")
+        await asyncio.gather(*(c.stop() for c in (self.dockmaster, self.sanitizer, self.justice) if c))
     
     def _create_demo_torches(self):
         """Create various demo torches for testing."""
+        # All fixtures are created "at setup time"; take the clock once
+        now = datetime.now(timezone.utc)
         self.demo_torches = [
             # Clean torch
             Torch(
@@ -109,7 +157,7 @@ class DockCampfiresDemo:
                 },
                 attachments=[],
                 signature="valid_signature_123",
-                timestamp=datetime.utcnow()
+                timestamp=now
             ),
             
             # Torch with potential security issues
@@ -125,7 +173,7 @@ class DockCampfiresDemo:
                 },
                 attachments=[],
                 signature="",
-                timestamp=datetime.utcnow()
+                timestamp=now
             ),
             
             # Torch with policy violations
@@ -135,13 +183,13 @@ class DockCampfiresDemo:
                 target_address="TechValley/general",
                 payload={
                     "type": "spam_content",
-                    "message": "spam " * 1000,  # Very long spam message
+                    "message": _SPAM_MESSAGE,  # Very long spam message
                     "inappropriate": "This contains inappropriate content",
                     "priority": "urgent"
                 },
                 attachments=[],
                 signature="invalid_signature",
-                timestamp=datetime.utcnow()
+                timestamp=now
             ),
             
             # Large torch for testing routing
@@ -152,138 +200,166 @@ class DockCampfiresDemo:
                 payload={
                     "type": "data_transfer",
                     "message": "Large dataset transfer",
-                    "data": {"records": list(range(1000))},  # Large payload
+                    "data": {"records": _BIG_RECORDS},  # Large payload
                     "priority": "low"
                 },
                 attachments=["large_dataset.csv", "analysis_report.pdf"],
                 signature="valid_signature_456",
-                timestamp=datetime.utcnow()
+                timestamp=now
             )
         ]
     
-    async def demo_dockmaster_campfire(self):
-        """Demonstrate Dockmaster campfire functionality."""
-        logger.info("\n" + "="*60)
-        logger.info("DOCKMASTER CAMPFIRE DEMO")
-        logger.info("="*60)
-        
-        logger.info("Dockmaster handles torch loading, routing, and packing...")
+    def _payload_bytes(self, torch: Torch) -> bytes:
+        """Serialized torch payload, serializing each payload object only once."""
+        entry = self._payload_bytes_cache.get(id(torch.payload))
+        if entry is None or entry[0] is not torch.payload:
+            entry = (torch.payload, _json_dumps_bytes(torch.payload))
+            self._payload_bytes_cache[id(torch.payload)] = entry
+        return entry[1]
+    
+    def _payload_len(self, torch: Torch) -> int:
+        """Serialized size of a torch payload.
+        
+        Without orjson, an uncached payload is measured by streaming json.dump into a
+        counter rather than materializing the whole document.
+        """
+        entry = self._payload_bytes_cache.get(id(torch.payload))
+        if orjson is None and (entry is None or entry[0] is not torch.payload):
+            writer = _LengthWriter()
+            json.dump(torch.payload, writer)
+            return writer.n
+        return len(self._payload_bytes(torch))
+    
+    def _payload_digest(self, torch: Torch, fresh: bool = False) -> bytes:
+        """Short content digest of a torch payload, for cheap before/after comparisons.
         
-        for torch in self.demo_torches:
-            logger.info(f"\nProcessing torch {torch.id} through Dockmaster...")
+        fresh=True re-serializes the payload, for payloads that may have been mutated in place.
+        """
+        data = _json_dumps_bytes(torch.payload) if fresh else self._payload_bytes(torch)
+        return hashlib.blake2b(data, digest_size=8).digest()
+    
+    def _record_dockmaster(self, torch: Torch, processed_torch: Any, log_details: bool):
+        """Log and record one torch's Dockmaster outcome (a torch, None, or an exception)."""
+        if isinstance(processed_torch, Exception):
+            logger.error("❌ Error processing torch %s: %s", torch.id, processed_torch)
+            self.demo_results['dockmaster'].append({
+                'torch_id': torch.id,
+                'status': 'error',
+                'error': str(processed_torch)
+            })
+            return
+        
+        if processed_torch:
+            result = {
+                'torch_id': torch.id,
+                'status': 'processed',
+                'original_size': self._payload_len(torch),
+                'processed_size': self._payload_len(processed_torch),
+                'routing_info': {
+                    'sender': torch.sender_valley,
+                    'target': torch.target_address,
+                    'attachments': len(torch.attachments)
+                }
+            }
             
-            try:
-                # Process torch through dockmaster
-                processed_torch = await self.dockmaster.process_torch(torch)
-                
-                if processed_torch:
-                    result = {
-                        'torch_id': torch.id,
-                        'status': 'processed',
-                        'original_size': len(json.dumps(torch.payload)),
-                        'processed_size': len(json.dumps(processed_torch.payload)),
-                        'routing_info': {
-                            'sender': torch.sender_valley,
-                            'target': torch.target_address,
-                            'attachments': len(torch.attachments)
-                        }
-                    }
-                    
-                    logger.info(f"✅ Torch {torch.id} successfully processed by Dockmaster")
-                    logger.info(f"   Original size: {result['original_size']} bytes")
-                    logger.info(f"   Processed size: {result['processed_size']} bytes")
-                    logger.info(f"   Route: {torch.sender_valley} → {torch.target_address}")
-                    
-                else:
-                    result = {
-                        'torch_id': torch.id,
-                        'status': 'failed',
-                        'reason': 'Processing failed'
-                    }
-                    logger.warning(f"❌ Torch {torch.id} failed processing by Dockmaster")
-                
-                self.demo_results['dockmaster'].append(result)
-                
-            except Exception as e:
-                logger.error(f"❌ Error processing torch {torch.id}: {e}")
-                self.demo_results['dockmaster'].append({
-                    'torch_id': torch.id,
-                    'status': 'error',
-                    'error': str(e)
-                })
-        
-        # Show dockmaster campers info
-        campers = self.dockmaster.get_campers()
-        logger.info(f"\nDockmaster active campers: {list(campers.keys())}")
-        
-        logger.info("\nDockmaster demo completed!")
+            # The result is always recorded; only the log lines are skipped when filtered
+            if log_details:
+                logger.info("✅ Torch %s successfully processed by Dockmaster", torch.id)
+                logger.info("   Original size: %s bytes", result['original_size'])
+                logger.info("   Processed size: %s bytes", result['processed_size'])
+                logger.info("   Route: %s → %s", torch.sender_valley, torch.target_address)
+            
+        else:
+            result = {
+                'torch_id': torch.id,
+                'status': 'failed',
+                'reason': 'Processing failed'
+            }
+            logger.warning("❌ Torch %s failed processing by Dockmaster", torch.id)
+        
+        self.demo_results['dockmaster'].append(result)
     
-    async def demo_sanitizer_campfire(self):
-        """Demonstrate Sanitizer campfire functionality."""
-        logger.info("\n" + "="*60)
-        logger.info("SANITIZER CAMPFIRE DEMO")
-        logger.info("="*60)
-        
-        logger.info("Sanitizer handles content security, filtering, and quarantine...")
-        
-        for torch in self.demo_torches:
-            logger.info(f"\nProcessing torch {torch.id} through Sanitizer...")
+    def _record_sanitizer(self, torch: Torch, processed_torch: Any, pre_digest: bytes):
+        """Log and record one torch's Sanitizer outcome (a torch, None, or an exception)."""
+        if isinstance(processed_torch, Exception):
+            logger.error(f"❌ Error sanitizing torch {torch.id}: {processed_torch}")
+            self.demo_results['sanitizer'].append({
+                'torch_id': torch.id,
+                'status': 'error',
+                'error': str(processed_torch)
+            })
+            return
+        
+        if processed_torch:
+            result = {
+                'torch_id': torch.id,
+                'status': 'sanitized',
+                'content_modified': self._payload_digest(processed_torch, fresh=True) != pre_digest,
+                'security_check': 'passed'
+            }
             
-            try:
-                # Process torch through sanitizer
-                processed_torch = await self.sanitizer.process_torch(torch)
-                
-                if processed_torch:
-                    result = {
-                        'torch_id': torch.id,
-                        'status': 'sanitized',
-                        'content_modified': processed_torch.payload != torch.payload,
-                        'security_check': 'passed'
-                    }
-                    
-                    logger.info(f"✅ Torch {torch.id} passed sanitization")
-                    if result['content_modified']:
-                        logger.info(f"   Content was sanitized for security")
-                    else:
-                        logger.info(f"   Content was clean, no changes needed")
-                    
-                elif processed_torch is None:
-                    result = {
-                        'torch_id': torch.id,
-                        'status': 'quarantined',
-                        'reason': 'Security threat detected'
-                    }
-                    logger.warning(f"🔒 Torch {torch.id} quarantined due to security threats")
-                
-                self.demo_results['sanitizer'].append(result)
-                
-            except Exception as e:
-                logger.error(f"❌ Error sanitizing torch {torch.id}: {e}")
-                self.demo_results['sanitizer'].append({
-                    'torch_id': torch.id,
-                    'status': 'error',
-                    'error': str(e)
-                })
-        
-        # Show sanitizer statistics
-        quarantine_stats = await self.sanitizer.get_quarantine_stats()
-        logger.info(f"\nQuarantine statistics: {quarantine_stats}")
-        
-        # Show sanitizer campers info
-        campers = self.sanitizer.get_campers()
-        logger.info(f"Sanitizer active campers: {list(campers.keys())}")
-        
-        logger.info("\nSanitizer demo completed!")
+            logger.info(f"✅ Torch {torch.id} passed sanitization")
+            if result['content_modified']:
+                logger.info(f"   Content was sanitized for security")
+            else:
+                logger.info(f"   Content was clean, no changes needed")
+            
+        else:
+            result = {
+                'torch_id': torch.id,
+                'status': 'quarantined',
+                'reason': 'Security threat detected'
+            }
+            logger.warning(f"🔒 Torch {torch.id} quarantined due to security threats")
+        
+        self.demo_results['sanitizer'].append(result)
     
-    async def demo_justice_campfire(self):
-        """Demonstrate Justice campfire functionality."""
-        logger.info("\n" + "="*60)
-        logger.info("JUSTICE CAMPFIRE DEMO")
-        logger.info("="*60)
-        
-        logger.info("Justice handles governance, compliance, and violation management...")
-        
-        # Add a custom policy rule for demo
+    def _record_justice(self, torch: Torch, processed_torch: Any,
+                        violations: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], SanctionType, timedelta]]:
+        """Log and record one torch's Justice outcome; returns the sanctions it calls for."""
+        if isinstance(processed_torch, Exception):
+            logger.error(f"❌ Error processing torch {torch.id} through justice: {processed_torch}")
+            self.demo_results['justice'].append({
+                'torch_id': torch.id,
+                'status': 'error',
+                'error': str(processed_torch)
+            })
+            return []
+        
+        if processed_torch:
+            result = {
+                'torch_id': torch.id,
+                'status': 'approved',
+                'governance_check': 'passed'
+            }
+            
+            logger.info(f"✅ Torch {torch.id} passed governance checks")
+            
+        else:
+            result = {
+                'torch_id': torch.id,
+                'status': 'blocked',
+                'reason': 'Policy violation detected'
+            }
+            logger.warning(f"🚫 Torch {torch.id} blocked due to policy violations")
+        
+        sanctions = []
+        if violations:
+            result['violations'] = len(violations)
+            logger.info(f"   Detected {len(violations)} policy violations")
+            
+            # Collect sanctions for high-severity violations
+            sanctions = [
+                (violation, SanctionType.TEMPORARY_RESTRICTION, timedelta(hours=1))
+                for violation in violations
+                if violation.get('severity', 0) >= 7
+            ]
+        
+        self.demo_results['justice'].append(result)
+        return sanctions
+    
+    async def _add_demo_policy_rule(self):
+        """Add a custom policy rule for demo."""
         custom_rule = PolicyRule(
             id="demo_policy_001",
             name="Demo Content Policy",
@@ -295,148 +371,161 @@ class DockCampfiresDemo:
         )
         await self.justice.add_policy_rule(custom_rule)
         logger.info(f"Added custom policy rule: {custom_rule.name}")
-        
-        for torch in self.demo_torches:
-            logger.info(f"\nProcessing torch {torch.id} through Justice...")
-            
-            try:
-                # Process torch through justice
-                processed_torch = await self.justice.process_torch(torch)
-                
-                if processed_torch:
-                    result = {
-                        'torch_id': torch.id,
-                        'status': 'approved',
-                        'governance_check': 'passed'
-                    }
-                    
-                    logger.info(f"✅ Torch {torch.id} passed governance checks")
-                    
-                elif processed_torch is None:
-                    result = {
-                        'torch_id': torch.id,
-                        'status': 'blocked',
-                        'reason': 'Policy violation detected'
-                    }
-                    logger.warning(f"🚫 Torch {torch.id} blocked due to policy violations")
-                
-                # Detect violations for demonstration
-                violations = await self.justice.detect_violations(torch.payload)
-                if violations:
-                    result['violations'] = len(violations)
-                    logger.info(f"   Detected {len(violations)} policy violations")
-                    
-                    # Apply sanctions for high-severity violations
-                    for violation in violations:
-                        if violation.get('severity', 0) >= 7:
-                            sanction_result = await self.justice.apply_sanction(
-                                violation, 
-                                SanctionType.TEMPORARY_RESTRICTION,
-                                timedelta(hours=1)
-                            )
-                            logger.info(f"   Applied sanction: {sanction_result['sanction_type']}")
-                
-                self.demo_results['justice'].append(result)
-                
-            except Exception as e:
-                logger.error(f"❌ Error processing torch {torch.id} through justice: {e}")
-                self.demo_results['justice'].append({
-                    'torch_id': torch.id,
-                    'status': 'error',
-                    'error': str(e)
-                })
-        
-        # Show governance report
-        governance_report = await self.justice.get_governance_report()
-        logger.info(f"\nGovernance report: {governance_report}")
-        
-        # Show justice campers info
-        campers = self.justice.get_campers()
-        logger.info(f"Justice active campers: {list(campers.keys())}")
-        
-        logger.info("\nJustice demo completed!")
     
-    async def demo_integrated_pipeline(self):
-        """Demonstrate integrated pipeline with all three campfires."""
-        logger.info("\n" + "="*60)
-        logger.info("INTEGRATED PIPELINE DEMO")
-        logger.info("="*60)
-        
-        logger.info("Processing torches through complete dock pipeline...")
-        logger.info("Pipeline: Dockmaster → Sanitizer → Justice")
-        
-        for torch in self.demo_torches:
-            logger.info(f"\nProcessing torch {torch.id} through integrated pipeline...")
-            
-            try:
-                current_torch = torch
-                pipeline_results = []
-                
-                # Step 1: Dockmaster
-                logger.info(f"  Step 1: Dockmaster processing...")
-                current_torch = await self.dockmaster.process_torch(current_torch)
-                if current_torch:
-                    pipeline_results.append("dockmaster_passed")
-                    logger.info(f"    ✅ Dockmaster: PASSED")
-                else:
-                    pipeline_results.append("dockmaster_failed")
-                    logger.info(f"    ❌ Dockmaster: FAILED")
+    async def _apply_pending_sanctions(self, pending_sanctions: List[Tuple[Dict[str, Any], SanctionType, timedelta]]):
+        """Apply collected sanctions in one batch."""
+        if not pending_sanctions:
+            return
+        try:
+            for sanction_result in await self.justice.apply_sanctions_batch(pending_sanctions):
+                logger.info(f"   Applied sanction: {sanction_result['sanction_type']}")
+        except Exception as e:
+            logger.error(f"❌ Error applying sanctions: {e}")
+    
+    async def _process_all(self, campfire) -> List[Any]:
+        """Run every demo torch through one campfire at once; outcomes come back in torch order."""
+        return await asyncio.gather(
+            *(campfire.process_torch(t) for t in self.demo_torches),
+            return_exceptions=True
+        )
+    
+    async def _detect_all_violations(self) -> List[List[Dict[str, Any]]]:
+        """Detect violations for every demo torch in one batched call."""
+        try:
+            return await self.justice.detect_violations_batch(
+                [t.payload for t in self.demo_torches]
+            )
+        except Exception as e:
+            logger.error(f"❌ Error detecting violations: {e}")
+            return [[] for _ in self.demo_torches]
+    
+    async def _run_integrated_pipeline(self, docked: List[Any]):
+        """
+        Take the Dockmaster outcomes on through Sanitizer and Justice.
+        
+        One worker per remaining stage joined by bounded queues, so each stage works
+        on the next torch while the following stage handles the previous one.
+        """
+        q_san: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        q_jus: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        pipeline_results: Dict[str, List[str]] = {t.id: [] for t in self.demo_torches}
+        
+        async def producer():
+            # The Dockmaster demo's output doubles as step 1 of the pipeline
+            for torch, docked_torch in zip(self.demo_torches, docked):
+                logger.info(f"\nProcessing torch {torch.id} through integrated pipeline...")
+                if isinstance(docked_torch, Exception):
+                    logger.error(f"❌ Pipeline error for torch {torch.id}: {docked_torch}")
                     continue
-                
-                # Step 2: Sanitizer
-                logger.info(f"  Step 2: Sanitizer processing...")
-                current_torch = await self.sanitizer.process_torch(current_torch)
-                if current_torch:
-                    pipeline_results.append("sanitizer_passed")
-                    logger.info(f"    ✅ Sanitizer: PASSED")
-                else:
-                    pipeline_results.append("sanitizer_quarantined")
-                    logger.info(f"    🔒 Sanitizer: QUARANTINED")
+                if not docked_torch:
+                    pipeline_results[torch.id].append("dockmaster_failed")
+                    logger.info(f"    ❌ Dockmaster: FAILED ({torch.id})")
                     continue
-                
-                # Step 3: Justice
-                logger.info(f"  Step 3: Justice processing...")
-                current_torch = await self.justice.process_torch(current_torch)
-                if current_torch:
-                    pipeline_results.append("justice_approved")
-                    logger.info(f"    ✅ Justice: APPROVED")
-                else:
-                    pipeline_results.append("justice_blocked")
-                    logger.info(f"    🚫 Justice: BLOCKED")
+                pipeline_results[torch.id].append("dockmaster_passed")
+                logger.info(f"    ✅ Dockmaster: PASSED ({torch.id})")
+                await q_san.put((torch.id, docked_torch))
+            await q_san.put(None)
+        
+        async def stage_worker(campfire, q_in, q_out, passed, failed, passed_label, failed_label):
+            while True:
+                item = await q_in.get()
+                if item is None:
+                    if q_out is not None:
+                        await q_out.put(None)
+                    return
+                torch_id, current_torch = item
+                try:
+                    current_torch = await campfire.process_torch(current_torch)
+                except Exception as e:
+                    logger.error(f"❌ Pipeline error for torch {torch_id}: {e}")
                     continue
                 
-                # Final result
-                if current_torch:
-                    logger.info(f"  🎉 Torch {torch.id} successfully completed the pipeline!")
-                    logger.info(f"     Pipeline steps: {' → '.join(pipeline_results)}")
+                if not current_torch:
+                    pipeline_results[torch_id].append(failed)
+                    logger.info(f"    {failed_label} ({torch_id})")
+                    continue
                 
-            except Exception as e:
-                logger.error(f"❌ Pipeline error for torch {torch.id}: {e}")
+                pipeline_results[torch_id].append(passed)
+                logger.info(f"    {passed_label} ({torch_id})")
+                if q_out is not None:
+                    await q_out.put((torch_id, current_torch))
+                else:
+                    logger.info(f"  🎉 Torch {torch_id} successfully completed the pipeline!")
+                    logger.info(f"     Pipeline steps: {' → '.join(pipeline_results[torch_id])}")
+        
+        await asyncio.gather(
+            producer(),
+            stage_worker(self.sanitizer, q_san, q_jus,
+                         "sanitizer_passed", "sanitizer_quarantined",
+                         "✅ Sanitizer: PASSED", "🔒 Sanitizer: QUARANTINED"),
+            stage_worker(self.justice, q_jus, None,
+                         "justice_approved", "justice_blocked",
+                         "✅ Justice: APPROVED", "🚫 Justice: BLOCKED")
+        )
+    
+    async def run_all_demos(self):
+        """
+        Run every campfire demo and the integrated pipeline in one pass over the torches.
+        
+        Each campfire stage handles all torches concurrently; stages still run in
+        Dockmaster → Sanitizer → Justice order, as in the standalone demos.
+        """
+        logger.info(_BANNER)
+        logger.info("DOCK CAMPFIRES DEMO: Dockmaster, Sanitizer, Justice and integrated pipeline")
+        logger.info(_RULE)
+        
+        await self._add_demo_policy_rule()
         
-        logger.info("\nIntegrated pipeline demo completed!")
+        docked = await self._process_all(self.dockmaster)
+        
+        # Digest payloads before sanitization, which may rewrite them
+        pre_digests = [self._payload_digest(t) for t in self.demo_torches]
+        sanitized = await self._process_all(self.sanitizer)
+        
+        judged, all_violations = await asyncio.gather(
+            self._process_all(self.justice), self._detect_all_violations()
+        )
+        
+        log_details = logger.isEnabledFor(logging.INFO)
+        pending_sanctions = []
+        for torch, docked_torch, sanitized_torch, pre_digest, judged_torch, violations in zip(
+            self.demo_torches, docked, sanitized, pre_digests, judged, all_violations
+        ):
+            logger.info(f"\nProcessing torch {torch.id} through all dock campfires...")
+            self._record_dockmaster(torch, docked_torch, log_details)
+            self._record_sanitizer(torch, sanitized_torch, pre_digest)
+            pending_sanctions.extend(self._record_justice(torch, judged_torch, violations))
+        
+        await self._apply_pending_sanctions(pending_sanctions)
+        
+        # Integrated pipeline: Dockmaster → Sanitizer → Justice
+        await self._run_integrated_pipeline(docked)
+        
+        quarantine_stats = await self.sanitizer.get_quarantine_stats()
+        logger.info(f"\nQuarantine statistics: {quarantine_stats}")
+        governance_report = await self.justice.get_governance_report()
+        logger.info(f"Governance report: {governance_report}")
+        for name, campfire in (("Dockmaster", self.dockmaster), ("Sanitizer", self.sanitizer), ("Justice", self.justice)):
+            logger.info(f"{name} active campers: {list(campfire.get_campers())}")
+        
+        logger.info("\nDock campfires demo completed!")
     
     def print_demo_summary(self):
         """Print a summary of all demo results."""
-        logger.info("\n" + "="*60)
+        logger.info(_BANNER)
         logger.info("DEMO SUMMARY")
-        logger.info("="*60)
+        logger.info(_RULE)
         
-        # Dockmaster summary
+        # One pass per campfire to tally result statuses
         dockmaster_results = self.demo_results['dockmaster']
-        dockmaster_processed = len([r for r in dockmaster_results if r['status'] == 'processed'])
-        logger.info(f"Dockmaster: {dockmaster_processed}/{len(dockmaster_results)} torches processed")
+        dockmaster_counts = Counter(r['status'] for r in dockmaster_results)
+        logger.info(f"Dockmaster: {dockmaster_counts['processed']}/{len(dockmaster_results)} torches processed")
         
-        # Sanitizer summary
-        sanitizer_results = self.demo_results['sanitizer']
-        sanitizer_passed = len([r for r in sanitizer_results if r['status'] == 'sanitized'])
-        sanitizer_quarantined = len([r for r in sanitizer_results if r['status'] == 'quarantined'])
-        logger.info(f"Sanitizer: {sanitizer_passed} passed, {sanitizer_quarantined} quarantined")
+        sanitizer_counts = Counter(r['status'] for r in self.demo_results['sanitizer'])
+        logger.info(f"Sanitizer: {sanitizer_counts['sanitized']} passed, {sanitizer_counts['quarantined']} quarantined")
         
-        # Justice summary
-        justice_results = self.demo_results['justice']
-        justice_approved = len([r for r in justice_results if r['status'] == 'approved'])
-        justice_blocked = len([r for r in justice_results if r['status'] == 'blocked'])
-        logger.info(f"Justice: {justice_approved} approved, {justice_blocked} blocked")
+        justice_counts = Counter(r['status'] for r in self.demo_results['justice'])
+        logger.info(f"Justice: {justice_counts['approved']} approved, {justice_counts['blocked']} blocked")
         
         logger.info("\nDemo completed successfully! 🎉")
         logger.info("The default dock campfires are working together to provide:")
@@ -450,33 +539,34 @@ async def main():
     demo = DockCampfiresDemo()
     
     try:
-        await demo.setup()
-        
-        # Run individual campfire demos
-        await demo.demo_dockmaster_campfire()
-        await demo.demo_sanitizer_campfire()
-        await demo.demo_justice_campfire()
-        
-        # Run integrated pipeline demo
-        await demo.demo_integrated_pipeline()
-        
-        # Print summary
-        demo.print_demo_summary()
+        async with AsyncExitStack() as stack:
+            await demo.setup(stack)
+            
+            # Run the campfire demos and the integrated pipeline in one pass over the torches
+            await demo.run_all_demos()
+            
+            # Print summary
+            demo.print_demo_summary()
         
     except Exception as e:
         logger.error(f"Demo failed: {e}")
         raise
-    finally:
-        await demo.cleanup()
 
 
 if __name__ == "__main__":
     print("🔥 CampfireValley - Default Dock Campfires Demo 🔥")
-    print("=" * 60)
+    print(_RULE)
     print("This demo showcases the three default dock campfires:")
     print("1. DockmasterCampfire - Torch processing and routing")
     print("2. SanitizerCampfire - Content security and sanitization")
     print("3. JusticeCampfire - Governance and compliance")
-    print("=" * 60)
+    print(_RULE)
+    
+    # The demo is bound on Redis round trips; uvloop schedules them with less overhead
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     
     asyncio.run(main())
\ No newline at end of file
@@ -20,8 +20,15 @@ The demo shows:
 import asyncio
 import logging
 import json
+import queue
+import signal
+from dataclasses import dataclass
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Dict, List
+
+import redis.asyncio as aioredis
 
 from campfirevalley.valley import Valley
 from campfirevalley.dock import Dock
@@ -29,20 +36,95 @@ from campfirevalley.federation import FederationManager
 from campfirevalley.mcp import RedisMCPBroker
 from campfirevalley.models import Torch, TorchContent
 
-# Configure logging
+# Configure logging; records are handed to a background listener thread (started
+# in main) so stream I/O never blocks the event loop. QueueHandler renders each
+# message before queuing it, so later changes to its arguments are not logged.
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
+_log_listener = QueueListener(_log_queue, _log_stream_handler, respect_handler_level=True)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    _json_dumps_bytes = orjson.dumps
+except ImportError:
+    def _json_dumps_bytes(obj):
+        return json.dumps(obj).encode("utf-8")
+
+# Static broadcast payloads, encoded once at import rather than on every publish
+_ANNOUNCEMENT_BYTES = _json_dumps_bytes({
+    "type": "federation_announcement",
+    "title": "Quarterly Innovation Summit",
+    "description": "Join us for our quarterly innovation summit to share progress and plan future collaborations",
+    "date": "2024-03-15",
+    "location": "Virtual - All Valleys",
+    "agenda": [
+        "Project status updates",
+        "New collaboration opportunities", 
+        "Resource sharing initiatives",
+        "Technology roadmap discussion"
+    ]
+})
+
+_EMERGENCY_BYTES = _json_dumps_bytes({
+    "type": "emergency_announcement",
+    "title": "Security Alert",
+    "description": "Critical security update required for all valleys",
+    "severity": "high",
+    "action_required": "Update all systems within 24 hours",
+    "contact": "security@innovationfederation.org"
+})
+
+_RESOURCE_SHARE_BYTES = _json_dumps_bytes({
+    "type": "resource_share",
+    "resource_type": "component",
+    "name": "Authentication Service",
+    "description": "Reusable authentication microservice with OAuth2 support",
+    "technologies": ["Node.js", "JWT", "OAuth2"],
+    "documentation": "https://techvalley.internal/docs/auth-service",
+    "contact": "backend-team@techvalley.org",
+    "license": "MIT"
+})
+
+_DESIGN_ASSETS_BYTES = _json_dumps_bytes({
+    "type": "resource_share",
+    "resource_type": "design_assets",
+    "name": "UI Component Library",
+    "description": "Comprehensive UI component library with design tokens",
+    "components": ["buttons", "forms", "navigation", "cards", "modals"],
+    "formats": ["Figma", "Sketch", "Adobe XD"],
+    "documentation": "https://creativevalley.internal/design-system",
+    "contact": "design-team@creativevalley.org"
+})
+
+@dataclass
+class FederationNode:
+    """One valley in the demo federation together with its dock and broker."""
+    __slots__ = ("name", "valley", "dock", "broker")
+    
+    name: str
+    valley: Valley
+    dock: Dock
+    broker: RedisMCPBroker
+
+
 class FederationDemo:
     """Demonstrates multi-valley federation capabilities."""
     
     def __init__(self):
-        self.valleys = {}
-        self.docks = {}
-        self.brokers = {}
+        self.nodes: List[FederationNode] = []
+        self._nodes_by_name: Dict[str, FederationNode] = {}
+        self.redis_pool = None
+        # Set by a driving harness to end the monitoring phase early
+        self.shutdown_event = asyncio.Event()
         
     async def setup_valleys(self):
         """Setup three valleys for the federation demo."""
@@ -66,6 +148,14 @@ class FederationDemo:
             }
         }
         
+        # One connection pool shared by every valley's broker
+        self.redis_pool = aioredis.BlockingConnectionPool.from_url(
+            "redis://localhost:6379",
+            max_connections=32,
+            encoding="utf-8",
+            decode_responses=True
+        )
+        
         # Create valleys and their infrastructure
         for valley_name, config in valley_configs.items():
             logger.info(f"Setting up {valley_name}...")
@@ -77,10 +167,13 @@ class FederationDemo:
                 config_path=f"config/federation/{valley_name.lower()}.yaml"
             )
             
-            # Create MCP broker for inter-valley communication
+            # Create MCP broker for inter-valley communication; writes issued in
+            # the same event-loop tick are auto-pipelined into one round trip
             broker = RedisMCPBroker(
                 connection_string="redis://localhost:6379",
-                valley_name=valley_name
+                valley_name=valley_name,
+                transport="pipelined",
+                connection_pool=self.redis_pool
             )
             
             # Create dock for federation management
@@ -91,14 +184,14 @@ class FederationDemo:
             )
             
             # Store references
-            self.valleys[valley_name] = valley
-            self.brokers[valley_name] = broker
-            self.docks[valley_name] = dock
-            
-            # Connect to Redis
-            await broker.connect()
-            
-            logger.info(f"{valley_name} setup complete")
+            node = FederationNode(name=valley_name, valley=valley, dock=dock, broker=broker)
+            self.nodes.append(node)
+            self._nodes_by_name[valley_name] = node
+        
+        # Connect every broker to Redis concurrently
+        await asyncio.gather(*(node.broker.connect() for node in self.nodes))
+        for node in self.nodes:
+            logger.info(f"{node.name} setup complete")
     
     async def establish_federation(self):
         """Establish federation between the valleys."""
@@ -108,7 +201,7 @@ class FederationDemo:
         federation_config = {
             "name": "InnovationFederation",
             "description": "A federation for collaborative innovation projects",
-            "members": list(self.valleys.keys()),
+            "members": [node.name for node in self.nodes],
             "shared_capabilities": ["project_management", "communication", "resource_sharing"],
             "governance": {
                 "consensus_required": True,
@@ -116,9 +209,9 @@ class FederationDemo:
             }
         }
         
-        # Setup federation for each valley
-        for valley_name, dock in self.docks.items():
-            federation_manager = dock.federation_manager
+        # Setup federation for each valley; valleys join concurrently
+        async def join(node):
+            federation_manager = node.dock.federation_manager
             
             # Join the federation
             await federation_manager.join_federation(
@@ -126,16 +219,17 @@ class FederationDemo:
                 federation_config=federation_config
             )
             
-            # Subscribe to federation-wide communications
-            await self.brokers[valley_name].subscribe_to_federation(
+            # Subscribe to federation-wide communications; returns once Redis
+            # has confirmed the subscription, so later broadcasts are not missed
+            await node.broker.subscribe_to_federation(
                 federation_name=federation_config["name"],
-                callback=self._handle_federation_message
+                callback=self._handle_federation_message,
+                confirm=True
             )
             
-            logger.info(f"{valley_name} joined InnovationFederation")
+            logger.info(f"{node.name} joined InnovationFederation")
         
-        # Allow time for federation discovery
-        await asyncio.sleep(2)
+        await asyncio.gather(*(join(node) for node in self.nodes))
         logger.info("Federation establishment complete")
     
     async def _handle_federation_message(self, channel: str, message: dict):
@@ -167,11 +261,6 @@ class FederationDemo:
         )
         
         # BusinessValley initiates the project
-        business_dock = self.docks["BusinessValley"]
-        await business_dock.send_torch(project_torch)
-        
-        await asyncio.sleep(1)
-        
         # CreativeValley responds with design proposal
         design_torch = Torch(
             content=TorchContent(
@@ -189,11 +278,6 @@ class FederationDemo:
             priority="normal"
         )
         
-        creative_dock = self.docks["CreativeValley"]
-        await creative_dock.send_torch(design_torch)
-        
-        await asyncio.sleep(1)
-        
         # TechValley responds with technical architecture
         tech_torch = Torch(
             content=TorchContent(
@@ -212,53 +296,46 @@ class FederationDemo:
             priority="normal"
         )
         
-        tech_dock = self.docks["TechValley"]
-        await tech_dock.send_torch(tech_torch)
+        # Each valley sends its torch to every recipient in one batch; the three
+        # valleys send concurrently instead of waiting on each other
+        await asyncio.gather(*(
+            self._nodes_by_name[valley_name].dock.send_torches_batch(
+                [(recipient, torch) for recipient in torch.recipients],
+                confirm=False
+            )
+            for valley_name, torch in (
+                ("BusinessValley", project_torch),
+                ("CreativeValley", design_torch),
+                ("TechValley", tech_torch)
+            )
+        ))
         
         logger.info("Cross-valley collaboration demo complete")
     
+    async def _publish_batches(self, batches: dict, priority: str = "normal"):
+        """Publish each valley's pre-encoded messages as one pipeline, all valleys concurrently.
+        
+        Demo broadcasts need no delivery confirmation, so they are fire-and-forget.
+        """
+        await asyncio.gather(*(
+            self._nodes_by_name[valley_name].broker.publish_many_to_federation(
+                federation_name="InnovationFederation",
+                messages=messages,
+                priority=priority,
+                confirm=False,
+                raw=True
+            )
+            for valley_name, messages in batches.items()
+        ))
+    
     async def demo_federation_announcements(self):
         """Demonstrate federation-wide announcements."""
         logger.info("Demonstrating federation announcements...")
         
-        # Federation-wide announcement
-        announcement = {
-            "type": "federation_announcement",
-            "title": "Quarterly Innovation Summit",
-            "description": "Join us for our quarterly innovation summit to share progress and plan future collaborations",
-            "date": "2024-03-15",
-            "location": "Virtual - All Valleys",
-            "agenda": [
-                "Project status updates",
-                "New collaboration opportunities", 
-                "Resource sharing initiatives",
-                "Technology roadmap discussion"
-            ]
-        }
-        
-        # Broadcast from BusinessValley
-        await self.brokers["BusinessValley"].publish_to_federation(
-            federation_name="InnovationFederation",
-            message=announcement,
-            priority="high"
-        )
-        
-        await asyncio.sleep(1)
-        
-        # Emergency announcement
-        emergency = {
-            "type": "emergency_announcement",
-            "title": "Security Alert",
-            "description": "Critical security update required for all valleys",
-            "severity": "high",
-            "action_required": "Update all systems within 24 hours",
-            "contact": "security@innovationfederation.org"
-        }
-        
-        # Broadcast emergency from TechValley
-        await self.brokers["TechValley"].publish_to_federation(
-            federation_name="InnovationFederation",
-            message=emergency,
+        # Broadcast the announcement from BusinessValley and the emergency from
+        # TechValley; each sender flushes its batch in one pipelined round trip
+        await self._publish_batches(
+            {"BusinessValley": [_ANNOUNCEMENT_BYTES], "TechValley": [_EMERGENCY_BYTES]},
             priority="high"
         )
         
@@ -268,41 +345,9 @@ class FederationDemo:
         """Demonstrate resource sharing between valleys."""
         logger.info("Demonstrating resource sharing...")
         
-        # TechValley shares a reusable component
-        resource_share = {
-            "type": "resource_share",
-            "resource_type": "component",
-            "name": "Authentication Service",
-            "description": "Reusable authentication microservice with OAuth2 support",
-            "technologies": ["Node.js", "JWT", "OAuth2"],
-            "documentation": "https://techvalley.internal/docs/auth-service",
-            "contact": "backend-team@techvalley.org",
-            "license": "MIT"
-        }
-        
-        await self.brokers["TechValley"].publish_to_federation(
-            federation_name="InnovationFederation",
-            message=resource_share,
-            priority="normal"
-        )
-        
-        await asyncio.sleep(1)
-        
-        # CreativeValley shares design assets
-        design_assets = {
-            "type": "resource_share",
-            "resource_type": "design_assets",
-            "name": "UI Component Library",
-            "description": "Comprehensive UI component library with design tokens",
-            "components": ["buttons", "forms", "navigation", "cards", "modals"],
-            "formats": ["Figma", "Sketch", "Adobe XD"],
-            "documentation": "https://creativevalley.internal/design-system",
-            "contact": "design-team@creativevalley.org"
-        }
-        
-        await self.brokers["CreativeValley"].publish_to_federation(
-            federation_name="InnovationFederation",
-            message=design_assets,
+        # TechValley shares a reusable component, CreativeValley its design assets
+        await self._publish_batches(
+            {"TechValley": [_RESOURCE_SHARE_BYTES], "CreativeValley": [_DESIGN_ASSETS_BYTES]},
             priority="normal"
         )
         
@@ -313,9 +358,9 @@ class FederationDemo:
         logger.info("Federation Statistics:")
         logger.info("=" * 50)
         
-        for valley_name, broker in self.brokers.items():
-            stats = await broker.get_message_stats()
-            logger.info(f"\n{valley_name}:")
+        for node in self.nodes:
+            stats = await node.broker.get_message_stats()
+            logger.info(f"\n{node.name}:")
             logger.info(f"  Connected: {stats['connected']}")
             logger.info(f"  Messages Sent: {stats['message_stats']['sent']}")
             logger.info(f"  Messages Received: {stats['message_stats']['received']}")
@@ -331,27 +376,42 @@ class FederationDemo:
         """Clean up demo resources."""
         logger.info("Cleaning up demo resources...")
         
-        # Stop all docks
-        for valley_name, dock in self.docks.items():
+        async def stop_dock(node):
             try:
-                await dock.stop_gateway()
-                logger.info(f"Stopped {valley_name} dock")
+                await node.dock.stop_gateway()
+                logger.info(f"Stopped {node.name} dock")
             except Exception as e:
-                logger.error(f"Error stopping {valley_name} dock: {e}")
+                logger.error(f"Error stopping {node.name} dock: {e}")
         
-        # Disconnect all brokers
-        for valley_name, broker in self.brokers.items():
+        async def disconnect_broker(node):
             try:
-                await broker.disconnect()
-                logger.info(f"Disconnected {valley_name} broker")
+                await node.broker.disconnect()
+                logger.info(f"Disconnected {node.name} broker")
             except Exception as e:
-                logger.error(f"Error disconnecting {valley_name} broker: {e}")
+                logger.error(f"Error disconnecting {node.name} broker: {e}")
+        
+        # Stop all docks, then disconnect all brokers; valleys tear down concurrently
+        await asyncio.gather(*(stop_dock(node) for node in self.nodes))
+        await asyncio.gather(*(disconnect_broker(node) for node in self.nodes))
+        
+        if self.redis_pool:
+            await self.redis_pool.disconnect(inuse_connections=True)
         
         logger.info("Demo cleanup complete")
 
 async def main():
     """Run the federation demo."""
     demo = FederationDemo()
+    _log_listener.start()
+    
+    # Signals cancel main() in whatever phase it is in; the finally block still cleans up
+    main_task = asyncio.current_task()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, main_task.cancel)
+        except (NotImplementedError, RuntimeError):
+            pass  # Not supported on this platform; Ctrl+C still raises KeyboardInterrupt
     
     try:
         logger.info("Starting CampfireValley Federation Demo")
@@ -363,13 +423,8 @@ async def main():
         
         # Demo scenarios
         await demo.demo_cross_valley_collaboration()
-        await asyncio.sleep(2)
-        
         await demo.demo_federation_announcements()
-        await asyncio.sleep(2)
-        
         await demo.demo_resource_sharing()
-        await asyncio.sleep(2)
         
         # Display results
         await demo.display_federation_stats()
@@ -379,14 +434,27 @@ async def main():
         
         # Keep running for a bit to show ongoing federation activity
         logger.info("Monitoring federation activity for 30 seconds...")
-        await asyncio.sleep(30)
+        try:
+            await asyncio.wait_for(demo.shutdown_event.wait(), timeout=30)
+            logger.info("Shutdown requested, ending monitoring early")
+        except asyncio.TimeoutError:
+            pass
         
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         logger.info("Demo interrupted by user")
     except Exception as e:
         logger.error(f"Demo error: {e}")
     finally:
         await demo.cleanup()
+        # Flush queued records and join the listener thread
+        _log_listener.stop()
 
 if __name__ == "__main__":
+    # The demo is dominated by small Redis awaits; uvloop schedules them with less overhead
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(main())
\ No newline at end of file
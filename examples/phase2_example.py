@@ -27,7 +27,7 @@ from campfirevalley import (
     # Advanced Routing
     AdvancedRoutingEngine, SmartLoadBalancer, LoadBalancingAlgorithm,
     # Monitoring
-    MonitoringSystem, get_monitoring_system, record_metric, send_alert,
+    MonitoringSystem, get_monitoring_system, record_metrics_batch, send_alert,
     # Configuration Management
     get_config_manager, ConfigEnvironment,
     # Hierarchical Storage
@@ -221,10 +221,12 @@ async def demonstrate_monitoring():
     # Get monitoring system
     monitoring = get_monitoring_system()
     
-    # Record some metrics
-    await record_metric("torch_processed", 1, {"campfire": "test"})
-    await record_metric("processing_time", 150.5, {"operation": "sanitize"})
-    await record_metric("memory_usage", 85.2, {"component": "valley"})
+    # Record some metrics in one batch
+    await record_metrics_batch([
+        ("torch_processed", 1, {"campfire": "test"}),
+        ("processing_time", 150.5, {"operation": "sanitize"}),
+        ("memory_usage", 85.2, {"component": "valley"})
+    ])
     
     # Send alerts
     await send_alert(
@@ -308,23 +310,17 @@ async def demonstrate_hierarchical_storage():
         doc_data = b"Important document content" * 100  # ~2.7KB
         image_data = b"Binary image data" * 500  # ~8.5KB
         
-        doc_id = await party_box.store_attachment(
-            torch.id, "document.txt", doc_data
-        )
-        image_id = await party_box.store_attachment(
-            torch.id, "image.jpg", image_data
+        doc_id, image_id = await party_box.store_attachments_batch(
+            torch.id, [("document.txt", doc_data), ("image.jpg", image_data)]
         )
         
         print(f"Stored document: {doc_id}")
         print(f"Stored image: {image_id}")
         
-        # List attachments
-        attachments = await party_box.list_attachments(torch.id)
-        print(f"Total attachments: {len(attachments)}")
-        
-        # Get storage statistics
-        stats = await party_box.get_storage_stats()
-        print(f"Storage stats: {stats}")
+        # List attachments and get storage statistics together
+        all_stats = await party_box.get_all_stats(torch.id)
+        print(f"Total attachments: {len(all_stats['attachments'])}")
+        print(f"Storage stats: {all_stats['storage_stats']}")
         
         # Optimize storage
         optimization_stats = await party_box.optimize_storage()
@@ -410,4 +406,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Use the libuv-based event loop when it is installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(main())
\ No newline at end of file
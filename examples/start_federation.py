@@ -14,9 +14,10 @@ import signal
 import sys
 import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import redis
+import redis.asyncio as aioredis
 import yaml
 from rich.console import Console
 from rich.live import Live
@@ -32,6 +33,21 @@ from campfirevalley.valley import Valley
 from campfirevalley.config_manager import ConfigManager
 from campfirevalley.mcp import RedisMCPBroker
 
+# libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Priority queues RedisMCPBroker keeps for its critical channels; they are shared by every valley
+PRIORITY_QUEUES = ("torch.routing.priority", "federation.discovery.priority", "valley.emergency.priority")
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+    _json_loads = json.loads
+
 console = Console()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -41,16 +57,38 @@ class FederationDemoManager:
     
     def __init__(self):
         self.valleys: Dict[str, Valley] = {}
-        self.redis_client: Optional[redis.Redis] = None
+        # One pool for the manager's lifetime so every check reuses a live connection
+        self.redis_pool = aioredis.ConnectionPool(
+            host='localhost', port=6379, decode_responses=True, max_connections=32
+        )
+        self.redis_client: Optional[aioredis.Redis] = None
+        # (name, valley, port, campfire count) per valley; these never change after startup
+        self._static_rows: List[Tuple[str, Valley, str, str]] = []
+        # Refreshed once per monitor tick by _refresh_redis_stats
+        self._redis_online = False
+        self._queue_depths: Dict[str, int] = {}
         self.running = False
+        # Scales the "visual effect" pauses; DEMO_FAST=1 skips them for CI and benchmark runs
+        self.pace = 0.0 if os.getenv('DEMO_FAST') else 1.0
+        # Set by SIGINT/SIGTERM so run() can stop monitoring and still clean up
+        self.shutdown_event = asyncio.Event()
+        # True while run() waits on shutdown_event; other phases are cancelled instead
+        self.monitoring = False
+        # Scenario label -> demo coroutine, run in this order by run_demo_scenarios
+        self._scenarios = [
+            ("Cross-valley project collaboration", self.demo_collaboration),
+            ("Federation-wide announcements", self.demo_announcements),
+            ("Resource sharing demonstration", self.demo_resource_sharing),
+            ("Security and governance showcase", self.demo_security)
+        ]
         self.demo_dir = Path(__file__).parent
         self.config_dir = self.demo_dir / "config" / "federation"
         
     async def check_redis_connection(self) -> bool:
         """Check if Redis is available."""
         try:
-            self.redis_client = redis.Redis(host='localhost', port=6379, decode_responses=True)
-            self.redis_client.ping()
+            self.redis_client = aioredis.Redis(connection_pool=self.redis_pool)
+            await self.redis_client.ping()
             return True
         except redis.ConnectionError:
             return False
@@ -65,18 +103,52 @@ class FederationDemoManager:
             "businessvalley.yaml"
         ]
         
-        for config_file in config_files:
-            config_path = self.config_dir / config_file
-            if config_path.exists():
-                with open(config_path, 'r') as f:
-                    config = yaml.safe_load(f)
-                    valley_name = config['valley']['name']
-                    configs[valley_name] = config
-            else:
+        # Parse the files concurrently off the event loop
+        loaded = await asyncio.gather(*(
+            asyncio.to_thread(self._load_config_file, config_file) for config_file in config_files
+        ))
+        
+        for config_file, config in zip(config_files, loaded):
+            if config is None:
                 console.print(f"[red]Warning: Config file {config_file} not found[/red]")
+                continue
+            valley_name = config['valley']['name']
+            configs[valley_name] = config
         
         return configs
     
+    def _load_config_file(self, config_file: str) -> Optional[dict]:
+        """Load one YAML config, via a JSON sidecar cache keyed by the file's mtime."""
+        config_path = self.config_dir / config_file
+        if not config_path.exists():
+            return None
+        
+        cache_prefix = f".{config_file}."
+        cache_path = self.config_dir / f"{cache_prefix}{config_path.stat().st_mtime_ns}.json"
+        if cache_path.exists():
+            try:
+                return _json_loads(cache_path.read_bytes())
+            except (OSError, ValueError):
+                pass  # Unreadable cache; fall back to the YAML
+        
+        with open(config_path, 'r') as f:
+            config = yaml.load(f, Loader=_YAML_LOADER)
+        
+        # Only cache configs that survive a JSON round trip unchanged (no dates, non-str keys)
+        try:
+            encoded = _json_dumps(config)
+            if _json_loads(encoded) == config:
+                tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+                tmp_path.write_bytes(encoded)
+                os.replace(tmp_path, cache_path)
+                for stale in self.config_dir.glob(f"{cache_prefix}*.json"):
+                    if stale != cache_path:
+                        stale.unlink(missing_ok=True)
+        except (TypeError, ValueError, OSError) as e:
+            logger.debug(f"Not caching {config_file}: {e}")
+        
+        return config
+    
     async def initialize_valley(self, name: str, config: dict) -> Valley:
         """Initialize a single valley."""
         try:
@@ -101,62 +173,114 @@ class FederationDemoManager:
             console=console
         ) as progress:
             
-            for valley_name, config in configs.items():
-                task = progress.add_task(f"Starting {valley_name}...", total=None)
-                
+            # One task for the whole batch, so Rich redraws once per finished valley
+            task = progress.add_task("Starting valleys...", total=len(configs))
+            
+            async def start(valley_name: str, config: dict) -> Valley:
                 try:
                     valley = await self.initialize_valley(valley_name, config)
-                    self.valleys[valley_name] = valley
-                    
-                    progress.update(task, description=f"✅ {valley_name} started")
-                    await asyncio.sleep(0.5)  # Brief pause for visual effect
+                    progress.update(task, advance=1, description=f"✅ {valley_name} started")
+                    return valley
                     
                 except Exception as e:
-                    progress.update(task, description=f"❌ {valley_name} failed: {e}")
+                    progress.update(task, advance=1, description=f"❌ {valley_name} failed: {e}")
                     raise
+            
+            # Initialize every valley concurrently; the shared task advances as each one finishes
+            results = await asyncio.gather(
+                *(start(valley_name, config) for valley_name, config in configs.items()),
+                return_exceptions=True
+            )
+            
+            for valley_name, result in zip(configs, results):
+                if not isinstance(result, BaseException):
+                    self.valleys[valley_name] = result
+            
+            self._static_rows = [self._static_row(name, valley) for name, valley in self.valleys.items()]
+            
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
     
     async def setup_federation(self) -> None:
         """Set up federation connections between valleys."""
         console.print("\n[bold blue]Setting up federation...[/bold blue]")
         
-        # Wait for all valleys to be ready
-        await asyncio.sleep(2)
+        # start_valleys has already awaited every valley's initialization,
+        # so they are ready to join without an extra delay
         
         # Establish federation connections
-        federation_tasks = []
-        for valley_name, valley in self.valleys.items():
-            task = asyncio.create_task(valley.join_federation("InnovationFederation"))
-            federation_tasks.append(task)
+        federation_tasks = {
+            valley_name: asyncio.create_task(valley.join_federation("InnovationFederation"))
+            for valley_name, valley in self.valleys.items()
+        }
+        
+        try:
+            results = await asyncio.gather(*federation_tasks.values())
+        except BaseException:
+            # As with a TaskGroup, one failed join cancels the ones still in flight
+            for task in federation_tasks.values():
+                task.cancel()
+            raise
         
-        await asyncio.gather(*federation_tasks)
+        failed = [name for name, joined in zip(federation_tasks, results) if not joined]
+        if failed:
+            console.print(f"[yellow]⚠️ Could not join federation: {', '.join(failed)}[/yellow]")
         console.print("[green]✅ Federation established[/green]")
     
+    @staticmethod
+    def _static_row(valley_name: str, valley: Valley) -> Tuple[str, Valley, str, str]:
+        """Read the columns of a valley's status row that are fixed once it is started."""
+        try:
+            port = str(valley.config_manager.get('dock.port', 'N/A'))
+            campfire_count = str(len(valley.config_manager.get('campfires', [])))
+        except Exception:
+            port, campfire_count = "N/A", "N/A"
+        return valley_name, valley, port, campfire_count
+    
+    async def _refresh_redis_stats(self) -> None:
+        """Fetch Redis liveness and the broker's priority queue depths in a single pipelined round trip."""
+        if not self.redis_client:
+            self._redis_online = False
+            return
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.ping()
+                for queue in PRIORITY_QUEUES:
+                    pipe.llen(queue)
+                results = await pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Failed to refresh Redis stats: {e}")
+            self._redis_online = False
+            return
+        self._redis_online = bool(results[0])
+        self._queue_depths = dict(zip(PRIORITY_QUEUES, results[1:]))
+    
+    def _redis_caption(self) -> str:
+        """Summarize Redis liveness and the shared priority queues under the status table."""
+        if not self._redis_online:
+            return "Redis: 🔴 Offline"
+        depths = ", ".join(f"{queue}={depth}" for queue, depth in self._queue_depths.items())
+        return f"Redis: 🟢 Online | Queued: {depths}"
+    
     def create_status_table(self) -> Table:
-        """Create a status table for monitoring."""
-        table = Table(title="Federation Status", show_header=True, header_style="bold magenta")
+        """Create a status table for monitoring; only the status column is re-read per tick."""
+        table = Table(title="Federation Status", show_header=True, header_style="bold magenta",
+                      caption=self._redis_caption())
         table.add_column("Valley", style="cyan", no_wrap=True)
         table.add_column("Status", style="green")
         table.add_column("Port", style="yellow")
         table.add_column("Campfires", style="blue")
-        table.add_column("Messages", style="white")
         
-        for valley_name, valley in self.valleys.items():
+        for valley_name, valley, port, campfire_count in self._static_rows:
             try:
                 # Get valley status
                 status = "🟢 Online" if valley.is_running else "🔴 Offline"
-                port = str(valley.config_manager.get('dock.port', 'N/A'))
-                
-                # Count campfires
-                campfires = valley.config_manager.get('campfires', [])
-                campfire_count = str(len(campfires))
-                
-                # Get message stats (mock for now)
-                message_count = "0"
                 
-                table.add_row(valley_name, status, port, campfire_count, message_count)
+                table.add_row(valley_name, status, port, campfire_count)
                 
             except Exception as e:
-                table.add_row(valley_name, "❌ Error", "N/A", "N/A", "N/A")
+                table.add_row(valley_name, "❌ Error", "N/A", "N/A")
         
         return table
     
@@ -164,79 +288,72 @@ class FederationDemoManager:
         """Run the demo scenarios."""
         console.print("\n[bold green]Running demo scenarios...[/bold green]")
         
-        scenarios = [
-            "Cross-valley project collaboration",
-            "Federation-wide announcements", 
-            "Resource sharing demonstration",
-            "Security and governance showcase"
-        ]
-        
-        for i, scenario in enumerate(scenarios, 1):
+        async def run_scenario(i: int, scenario: str, demo) -> None:
             console.print(f"\n[bold yellow]Scenario {i}: {scenario}[/bold yellow]")
             
             # Simulate scenario execution
-            await asyncio.sleep(2)
+            await asyncio.sleep(2 * self.pace)
             
-            # Add scenario-specific logic here
-            if "collaboration" in scenario:
-                await self.demo_collaboration()
-            elif "announcements" in scenario:
-                await self.demo_announcements()
-            elif "sharing" in scenario:
-                await self.demo_resource_sharing()
-            elif "security" in scenario:
-                await self.demo_security()
+            await demo(prefix=f"S{i} │")
             
             console.print(f"[green]✅ Scenario {i} completed[/green]")
+        
+        # The scenarios are independent, so run them side by side; each line
+        # carries its scenario number so the interleaved output stays readable
+        await asyncio.gather(
+            *(run_scenario(i, scenario, demo) for i, (scenario, demo) in enumerate(self._scenarios, 1))
+        )
     
-    async def demo_collaboration(self) -> None:
+    async def demo_collaboration(self, prefix: str = "") -> None:
         """Demonstrate cross-valley collaboration."""
-        console.print("  📱 BusinessValley initiating mobile app project...")
-        await asyncio.sleep(1)
+        console.print(f"  {prefix} 📱 BusinessValley initiating mobile app project...")
+        await asyncio.sleep(1 * self.pace)
         
-        console.print("  🎨 CreativeValley responding with design proposals...")
-        await asyncio.sleep(1)
+        console.print(f"  {prefix} 🎨 CreativeValley responding with design proposals...")
+        await asyncio.sleep(1 * self.pace)
         
-        console.print("  💻 TechValley providing technical architecture...")
-        await asyncio.sleep(1)
+        console.print(f"  {prefix} 💻 TechValley providing technical architecture...")
+        await asyncio.sleep(1 * self.pace)
     
-    async def demo_announcements(self) -> None:
+    async def demo_announcements(self, prefix: str = "") -> None:
         """Demonstrate federation announcements."""
-        console.print("  📢 Broadcasting quarterly innovation summit...")
-        await asyncio.sleep(1)
+        console.print(f"  {prefix} 📢 Broadcasting quarterly innovation summit...")
+        await asyncio.sleep(1 * self.pace)
         
-        console.print("  🔒 Sending security policy updates...")
-        await asyncio.sleep(1)
+        console.print(f"  {prefix} 🔒 Sending security policy updates...")
+        await asyncio.sleep(1 * self.pace)
     
-    async def demo_resource_sharing(self) -> None:
+    async def demo_resource_sharing(self, prefix: str = "") -> None:
         """Demonstrate resource sharing."""
-        console.print("  🔐 TechValley sharing authentication services...")
-        await asyncio.sleep(1)
+        console.print(f"  {prefix} 🔐 TechValley sharing authentication services...")
+        await asyncio.sleep(1 * self.pace)
         
-        console.print("  🧩 CreativeValley sharing UI components...")
-        await asyncio.sleep(1)
+        console.print(f"  {prefix} 🧩 CreativeValley sharing UI components...")
+        await asyncio.sleep(1 * self.pace)
         
-        console.print("  📊 BusinessValley sharing project templates...")
-        await asyncio.sleep(1)
+        console.print(f"  {prefix} 📊 BusinessValley sharing project templates...")
+        await asyncio.sleep(1 * self.pace)
     
-    async def demo_security(self) -> None:
+    async def demo_security(self, prefix: str = "") -> None:
         """Demonstrate security features."""
-        console.print("  🛡️ Verifying digital signatures...")
-        await asyncio.sleep(1)
+        console.print(f"  {prefix} 🛡️ Verifying digital signatures...")
+        await asyncio.sleep(1 * self.pace)
         
-        console.print("  🔑 Rotating federation keys...")
-        await asyncio.sleep(1)
+        console.print(f"  {prefix} 🔑 Rotating federation keys...")
+        await asyncio.sleep(1 * self.pace)
         
-        console.print("  ✅ Security audit completed...")
-        await asyncio.sleep(1)
+        console.print(f"  {prefix} ✅ Security audit completed...")
+        await asyncio.sleep(1 * self.pace)
     
     async def monitor_federation(self) -> None:
         """Monitor federation status in real-time."""
         console.print("\n[bold blue]Monitoring federation (Press Ctrl+C to stop)...[/bold blue]")
         
         try:
+            await self._refresh_redis_stats()
             with Live(self.create_status_table(), refresh_per_second=1, console=console) as live:
                 while self.running:
+                    await self._refresh_redis_stats()
                     live.update(self.create_status_table())
                     await asyncio.sleep(1)
         except KeyboardInterrupt:
@@ -256,7 +373,8 @@ class FederationDemoManager:
         
         # Close Redis connection
         if self.redis_client:
-            self.redis_client.close()
+            await self.redis_client.close()
+        await self.redis_pool.disconnect()
         
         console.print("[green]✅ Federation shutdown complete[/green]")
     
@@ -297,34 +415,60 @@ class FederationDemoManager:
             # Run demo scenarios
             await self.run_demo_scenarios()
             
-            # Start monitoring
-            await self.monitor_federation()
+            # Start monitoring until it ends or a shutdown signal arrives
+            self.monitoring = True
+            monitor_task = asyncio.create_task(self.monitor_federation())
+            shutdown_task = asyncio.create_task(self.shutdown_event.wait())
+            await asyncio.wait([monitor_task, shutdown_task], return_when=asyncio.FIRST_COMPLETED)
+            for task in (monitor_task, shutdown_task):
+                task.cancel()
+            # Let the Live display close before cleanup starts printing
+            await asyncio.gather(monitor_task, shutdown_task, return_exceptions=True)
+            if self.shutdown_event.is_set():
+                console.print("\n[yellow]Received shutdown signal[/yellow]")
             
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
             console.print("\n[yellow]Demo interrupted by user[/yellow]")
         except Exception as e:
             console.print(f"\n[red]❌ Demo failed: {e}[/red]")
             logger.exception("Demo failed")
         finally:
+            self.monitoring = False
             self.running = False
             await self.cleanup()
 
-def signal_handler(signum, frame):
-    """Handle shutdown signals."""
-    console.print("\n[yellow]Received shutdown signal[/yellow]")
-    sys.exit(0)
-
 async def main():
     """Main entry point."""
-    # Set up signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    demo_manager = FederationDemoManager()
+    
+    # Route shutdown signals through the loop so run() reaches cleanup(): the
+    # monitoring phase waits on shutdown_event, any earlier phase is cancelled
+    main_task = asyncio.current_task()
+    
+    def request_shutdown():
+        if demo_manager.monitoring:
+            demo_manager.shutdown_event.set()
+        else:
+            main_task.cancel()
+    
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, request_shutdown)
+        except (NotImplementedError, RuntimeError):
+            pass  # Not supported on this platform; Ctrl+C still raises KeyboardInterrupt
     
     # Run the demo
-    demo_manager = FederationDemoManager()
     await demo_manager.run()
 
 if __name__ == "__main__":
+    # Socket-heavy demo: uvloop cuts per-await overhead on the aiohttp and Redis traffic
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
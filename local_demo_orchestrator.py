@@ -5,6 +5,7 @@ Runs both marketing and development teams locally without Docker
 """
 
 import asyncio
+import html
 import json
 import logging
 import time
@@ -13,7 +14,8 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 import subprocess
 import signal
-import sys
+import string
+import aiofiles
 import aiohttp
 
 from demo_marketing_team import MarketingTeamDemo
@@ -25,9 +27,159 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+try:
+    import orjson
+    
+    def _json_dumps_indent(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    def _json_dumps_indent(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+
+def _json_block(obj: Any) -> str:
+    """Indented JSON for obj, escaped for embedding in the report's HTML."""
+    return html.escape(_json_dumps_indent(obj))
+
 class LocalDemoOrchestrator:
     """Orchestrates a local demo with both marketing and development teams."""
     
+    # Report markup, parsed once at class creation and written out piece by piece
+    _REPORT_HEAD_TEMPLATE = string.Template("""
+        <!DOCTYPE html>
+        <html lang="en">
+        <head>
+            <meta charset="UTF-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <title>CampfireValley Distributed Demo Report</title>
+            <style>
+                body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 0; padding: 20px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }
+                .container { max-width: 1200px; margin: 0 auto; background: white; border-radius: 15px; box-shadow: 0 20px 40px rgba(0,0,0,0.1); overflow: hidden; }
+                .header { background: linear-gradient(135deg, #ff6b6b 0%, #ee5a24 100%); color: white; padding: 40px; text-align: center; }
+                .header h1 { margin: 0; font-size: 2.5em; font-weight: 300; }
+                .header p { margin: 10px 0 0 0; opacity: 0.9; font-size: 1.1em; }
+                .section { padding: 30px; border-bottom: 1px solid #eee; }
+                .section:last-child { border-bottom: none; }
+                .section h2 { color: #2c3e50; margin-bottom: 20px; font-size: 1.8em; }
+                .metrics { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin: 20px 0; }
+                .metric { background: #f8f9fa; padding: 20px; border-radius: 10px; text-align: center; border-left: 4px solid #3498db; }
+                .metric h3 { margin: 0 0 10px 0; color: #2c3e50; }
+                .metric .value { font-size: 2em; font-weight: bold; color: #3498db; }
+                .idea-card { background: #f8f9fa; margin: 15px 0; padding: 20px; border-radius: 10px; border-left: 4px solid #e74c3c; }
+                .idea-card h4 { margin: 0 0 10px 0; color: #2c3e50; }
+                .team-section { background: #ecf0f1; margin: 20px 0; padding: 20px; border-radius: 10px; }
+                .status-success { color: #27ae60; font-weight: bold; }
+                .status-error { color: #e74c3c; font-weight: bold; }
+                .json-display { background: #2c3e50; color: #ecf0f1; padding: 15px; border-radius: 5px; font-family: 'Courier New', monospace; font-size: 0.9em; overflow-x: auto; }
+                .footer { background: #34495e; color: white; padding: 20px; text-align: center; }
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <div class="header">
+                    <h1>🔥 CampfireValley Local Demo Report</h1>
+                    <p>Comprehensive analysis of marketing and development team collaboration</p>
+                    <p>Generated: $timestamp</p>
+                </div>
+                
+                <div class="section">
+                    <h2>📊 Demo Overview</h2>
+                    <div class="metrics">
+                        <div class="metric">
+                            <h3>Marketing Ideas</h3>
+                            <div class="value">$idea_count</div>
+                        </div>
+                        <div class="metric">
+                            <h3>Development Requests</h3>
+                            <div class="value">$request_count</div>
+                        </div>
+                        <div class="metric">
+                            <h3>Teams Involved</h3>
+                            <div class="value">2</div>
+                        </div>
+                        <div class="metric">
+                            <h3>Communication Method</h3>
+                            <div class="value">Local</div>
+                        </div>
+                    </div>
+                </div>
+                
+                <div class="section">
+                    <h2>🎯 Marketing Team Results</h2>
+                    <div class="team-section">
+                        <h3>Generated Website Ideas</h3>
+        """)
+    _IDEA_CARD_TEMPLATE = string.Template("""
+                        <div class="idea-card">
+                            <h4>Idea $index: $category</h4>
+                            <p><strong>Strategic Analysis:</strong> $strategic_analysis...</p>
+                            <p><strong>Creative Concept:</strong> $creative_concept...</p>
+                            <p><strong>UX Analysis:</strong> $ux_analysis...</p>
+                        </div>
+            """)
+    _DEV_SECTION_HTML = """
+                    </div>
+                </div>
+                
+                <div class="section">
+                    <h2>⚙️ Development Team Results</h2>
+                    <div class="team-section">
+        """
+    _DEV_ERROR_TEMPLATE = string.Template("""
+                        <p class="status-error">❌ Development Team Status: Error</p>
+                        <p>Error: $error</p>
+            """)
+    _DEV_SUCCESS_TEMPLATE = string.Template("""
+                        <p class="status-success">✅ Development Team Status: Active</p>
+                        <div class="json-display">
+                            $dev_results_json
+                        </div>
+            """)
+    _COMMUNICATION_SECTION_HTML = """
+                    </div>
+                </div>
+                
+                <div class="section">
+                    <h2>🔄 Inter-Team Communication</h2>
+                    <div class="team-section">
+                        <h3>Development Requests Sent</h3>
+        """
+    _REQUEST_CARD_TEMPLATE = string.Template("""
+                        <div class="idea-card">
+                            <h4>Request $index: $idea_id</h4>
+                            <p><strong>Status:</strong> <span class="$status_class">$status</span></p>
+                            <p><strong>Category:</strong> $category</p>
+                            <p><strong>Processing Time:</strong> $processing_time seconds</p>
+                        </div>
+            """)
+    _REPORT_TAIL_TEMPLATE = string.Template("""
+                    </div>
+                </div>
+                
+                <div class="section">
+                    <h2>📈 Technical Details</h2>
+                    <div class="team-section">
+                        <h3>Marketing Team Configuration</h3>
+                        <div class="json-display">
+                            $team_info_json
+                        </div>
+                        
+                        <h3>Full Marketing Results</h3>
+                        <div class="json-display">
+                            $marketing_json
+                        </div>
+                    </div>
+                </div>
+                
+                <div class="footer">
+                    <p>🔥 Powered by CampfireValley - Distributed AI Team Collaboration Platform</p>
+                    <p>Report generated at $timestamp</p>
+                </div>
+            </div>
+        </body>
+        </html>
+        """)
+    
     def __init__(self, dev_team_port: int = 8080, reports_dir: str = "reports"):
         self.dev_team_port = dev_team_port
         self.dev_team_url = f"http://localhost:{dev_team_port}"
@@ -37,9 +189,19 @@ class LocalDemoOrchestrator:
         self.marketing_demo = MarketingTeamDemo(dev_team_url=self.dev_team_url)
         self.dev_team_server = None
         self.dev_server_task = None
+        self._session: Optional[aiohttp.ClientSession] = None
         
         self.logger = logging.getLogger(__name__)
     
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the long-lived HTTP session used for all dev-team calls."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=16, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._session
+    
     async def start_development_team(self) -> bool:
         """Start the development team server locally."""
         try:
@@ -78,6 +240,9 @@ class LocalDemoOrchestrator:
                     await self.dev_server_task
                 except asyncio.CancelledError:
                     pass
+            if self._session is not None and not self._session.closed:
+                await self._session.close()
+            self._session = None
             self.logger.info("Development team server stopped")
         except Exception as e:
             self.logger.error(f"Error stopping development team server: {e}")
@@ -85,21 +250,27 @@ class LocalDemoOrchestrator:
     async def _check_dev_team_health(self) -> bool:
         """Check if the development team server is healthy."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.dev_team_url}/health", timeout=5) as response:
-                    return response.status == 200
+            async with self._get_session().get(f"{self.dev_team_url}/health", timeout=5) as response:
+                return response.status == 200
         except Exception:
             return False
     
     async def wait_for_dev_team_ready(self, max_wait: int = 30) -> bool:
-        """Wait for the development team to be ready."""
+        """Wait for the development team to be ready, polling /health with exponential backoff."""
         self.logger.info("Waiting for development team to be ready...")
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_wait
         
-        for i in range(max_wait):
+        delay = 0.025
+        while True:
             if await self._check_dev_team_health():
                 self.logger.info("Development team is ready!")
                 return True
-            await asyncio.sleep(1)
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, 1.0)
         
         self.logger.error("Development team failed to become ready")
         return False
@@ -112,174 +283,87 @@ class LocalDemoOrchestrator:
     async def get_dev_team_results(self) -> Dict[str, Any]:
         """Get results from the development team."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.dev_team_url}/results") as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        return {"error": f"Failed to get results: {response.status}"}
+            async with self._get_session().get(f"{self.dev_team_url}/results") as response:
+                if response.status == 200:
+                    return await response.json()
+                else:
+                    return {"error": f"Failed to get results: {response.status}"}
         except Exception as e:
             return {"error": f"Failed to connect to development team: {e}"}
     
-    async def generate_comprehensive_report(self, marketing_results: Dict[str, Any], 
-                                          dev_results: Dict[str, Any]) -> str:
-        """Generate a comprehensive HTML report combining both teams."""
+    async def write_comprehensive_report(self, path: Path, marketing_results: Dict[str, Any],
+                                         dev_results: Dict[str, Any]) -> None:
+        """Write a comprehensive HTML report combining both teams to path, section by section."""
         timestamp = datetime.now().isoformat()
         
         # Extract key metrics
         marketing_ideas = marketing_results.get('demo_results', {}).get('marketing_ideas', [])
         dev_requests = marketing_results.get('demo_results', {}).get('development_requests', [])
         
-        html_content = f"""
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>CampfireValley Distributed Demo Report</title>
-            <style>
-                body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 0; padding: 20px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }}
-                .container {{ max-width: 1200px; margin: 0 auto; background: white; border-radius: 15px; box-shadow: 0 20px 40px rgba(0,0,0,0.1); overflow: hidden; }}
-                .header {{ background: linear-gradient(135deg, #ff6b6b 0%, #ee5a24 100%); color: white; padding: 40px; text-align: center; }}
-                .header h1 {{ margin: 0; font-size: 2.5em; font-weight: 300; }}
-                .header p {{ margin: 10px 0 0 0; opacity: 0.9; font-size: 1.1em; }}
-                .section {{ padding: 30px; border-bottom: 1px solid #eee; }}
-                .section:last-child {{ border-bottom: none; }}
-                .section h2 {{ color: #2c3e50; margin-bottom: 20px; font-size: 1.8em; }}
-                .metrics {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin: 20px 0; }}
-                .metric {{ background: #f8f9fa; padding: 20px; border-radius: 10px; text-align: center; border-left: 4px solid #3498db; }}
-                .metric h3 {{ margin: 0 0 10px 0; color: #2c3e50; }}
-                .metric .value {{ font-size: 2em; font-weight: bold; color: #3498db; }}
-                .idea-card {{ background: #f8f9fa; margin: 15px 0; padding: 20px; border-radius: 10px; border-left: 4px solid #e74c3c; }}
-                .idea-card h4 {{ margin: 0 0 10px 0; color: #2c3e50; }}
-                .team-section {{ background: #ecf0f1; margin: 20px 0; padding: 20px; border-radius: 10px; }}
-                .status-success {{ color: #27ae60; font-weight: bold; }}
-                .status-error {{ color: #e74c3c; font-weight: bold; }}
-                .json-display {{ background: #2c3e50; color: #ecf0f1; padding: 15px; border-radius: 5px; font-family: 'Courier New', monospace; font-size: 0.9em; overflow-x: auto; }}
-                .footer {{ background: #34495e; color: white; padding: 20px; text-align: center; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>🔥 CampfireValley Local Demo Report</h1>
-                    <p>Comprehensive analysis of marketing and development team collaboration</p>
-                    <p>Generated: {timestamp}</p>
-                </div>
-                
-                <div class="section">
-                    <h2>📊 Demo Overview</h2>
-                    <div class="metrics">
-                        <div class="metric">
-                            <h3>Marketing Ideas</h3>
-                            <div class="value">{len(marketing_ideas)}</div>
-                        </div>
-                        <div class="metric">
-                            <h3>Development Requests</h3>
-                            <div class="value">{len(dev_requests)}</div>
-                        </div>
-                        <div class="metric">
-                            <h3>Teams Involved</h3>
-                            <div class="value">2</div>
-                        </div>
-                        <div class="metric">
-                            <h3>Communication Method</h3>
-                            <div class="value">Local</div>
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="section">
-                    <h2>🎯 Marketing Team Results</h2>
-                    <div class="team-section">
-                        <h3>Generated Website Ideas</h3>
-        """
-        
-        # Add marketing ideas
-        for i, idea in enumerate(marketing_ideas, 1):
-            html_content += f"""
-                        <div class="idea-card">
-                            <h4>Idea {i}: {idea.get('category', 'Unknown Category')}</h4>
-                            <p><strong>Strategic Analysis:</strong> {idea.get('strategic_analysis', 'N/A')[:200]}...</p>
-                            <p><strong>Creative Concept:</strong> {idea.get('creative_concept', 'N/A')[:200]}...</p>
-                            <p><strong>UX Analysis:</strong> {idea.get('ux_analysis', 'N/A')[:200]}...</p>
-                        </div>
-            """
-        
-        html_content += """
-                    </div>
-                </div>
-                
-                <div class="section">
-                    <h2>⚙️ Development Team Results</h2>
-                    <div class="team-section">
-        """
-        
-        if 'error' in dev_results:
-            html_content += f"""
-                        <p class="status-error">❌ Development Team Status: Error</p>
-                        <p>Error: {dev_results['error']}</p>
-            """
-        else:
-            html_content += f"""
-                        <p class="status-success">✅ Development Team Status: Active</p>
-                        <div class="json-display">
-                            {json.dumps(dev_results, indent=2)}
-                        </div>
-            """
+        # Serialize each JSON block once up front, off the event loop
+        team_info_json, marketing_json = await asyncio.gather(
+            asyncio.to_thread(_json_block, marketing_results.get('team_info', {})),
+            asyncio.to_thread(_json_block, marketing_results),
+        )
+        dev_results_json = None
+        if 'error' not in dev_results:
+            dev_results_json = await asyncio.to_thread(_json_block, dev_results)
         
-        html_content += f"""
-                    </div>
-                </div>
-                
-                <div class="section">
-                    <h2>🔄 Inter-Team Communication</h2>
-                    <div class="team-section">
-                        <h3>Development Requests Sent</h3>
-        """
-        
-        # Add development requests
-        for i, request in enumerate(dev_requests, 1):
-            status = request.get('status', 'unknown')
-            status_class = 'status-success' if status == 'success' else 'status-error'
-            html_content += f"""
-                        <div class="idea-card">
-                            <h4>Request {i}: {request.get('idea_id', 'Unknown ID')}</h4>
-                            <p><strong>Status:</strong> <span class="{status_class}">{status}</span></p>
-                            <p><strong>Category:</strong> {request.get('category', 'N/A')}</p>
-                            <p><strong>Processing Time:</strong> {request.get('processing_time', 'N/A')} seconds</p>
-                        </div>
-            """
+        # Every field below is free text from the teams, so it is escaped exactly once here
+        esc = html.escape
         
-        html_content += f"""
-                    </div>
-                </div>
-                
-                <div class="section">
-                    <h2>📈 Technical Details</h2>
-                    <div class="team-section">
-                        <h3>Marketing Team Configuration</h3>
-                        <div class="json-display">
-                            {json.dumps(marketing_results.get('team_info', {}), indent=2)}
-                        </div>
-                        
-                        <h3>Full Marketing Results</h3>
-                        <div class="json-display">
-                            {json.dumps(marketing_results, indent=2)}
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="footer">
-                    <p>🔥 Powered by CampfireValley - Distributed AI Team Collaboration Platform</p>
-                    <p>Report generated at {timestamp}</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        
-        return html_content
+        async with aiofiles.open(path, 'w', encoding='utf-8') as f:
+            await f.write(self._REPORT_HEAD_TEMPLATE.substitute(
+                timestamp=timestamp,
+                idea_count=len(marketing_ideas),
+                request_count=len(dev_requests)
+            ))
+            
+            # Add marketing ideas
+            # Cards are rendered per section and written together, one aiofiles write per section
+            render_idea = self._IDEA_CARD_TEMPLATE.substitute
+            cards = []
+            for i, idea in enumerate(marketing_ideas, 1):
+                get = idea.get
+                cards.append(render_idea(
+                    index=i,
+                    category=esc(str(get('category') or 'Unknown Category')),
+                    strategic_analysis=esc(str(get('strategic_analysis') or 'N/A')[:200]),
+                    creative_concept=esc(str(get('creative_concept') or 'N/A')[:200]),
+                    ux_analysis=esc(str(get('ux_analysis') or 'N/A')[:200])
+                ))
+            await f.write(''.join(cards))
+            
+            await f.write(self._DEV_SECTION_HTML)
+            
+            if 'error' in dev_results:
+                await f.write(self._DEV_ERROR_TEMPLATE.substitute(error=esc(str(dev_results['error']))))
+            else:
+                await f.write(self._DEV_SUCCESS_TEMPLATE.substitute(dev_results_json=dev_results_json))
+            
+            await f.write(self._COMMUNICATION_SECTION_HTML)
+            
+            # Add development requests
+            render_request = self._REQUEST_CARD_TEMPLATE.substitute
+            cards = []
+            for i, request in enumerate(dev_requests, 1):
+                get = request.get
+                status = get('status') or 'unknown'
+                cards.append(render_request(
+                    index=i,
+                    idea_id=esc(str(get('idea_id') or 'Unknown ID')),
+                    status_class='status-success' if status == 'success' else 'status-error',
+                    status=esc(str(status)),
+                    category=esc(str(get('category') or 'N/A')),
+                    processing_time=esc(str(get('processing_time', 'N/A')))
+                ))
+            await f.write(''.join(cards))
+            
+            await f.write(self._REPORT_TAIL_TEMPLATE.substitute(
+                team_info_json=team_info_json,
+                marketing_json=marketing_json,
+                timestamp=timestamp
+            ))
     
     async def run_demo(self) -> Dict[str, Any]:
         """Run the complete local demo."""
@@ -311,13 +395,9 @@ class LocalDemoOrchestrator:
             # Get development team results
             dev_results = await self.get_dev_team_results()
             
-            # Generate comprehensive report
-            report_html = await self.generate_comprehensive_report(marketing_results, dev_results)
-            
-            # Save report
+            # Generate and save comprehensive report
             report_path = self.reports_dir / f"local_demo_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-            with open(report_path, 'w', encoding='utf-8') as f:
-                f.write(report_html)
+            await self.write_comprehensive_report(report_path, marketing_results, dev_results)
             
             duration = time.time() - start_time
             
@@ -347,17 +427,30 @@ async def main():
     """Main function to run the local demo."""
     orchestrator = LocalDemoOrchestrator()
     
-    # Handle graceful shutdown
-    def signal_handler(signum, frame):
-        print("\n🛑 Received interrupt signal. Shutting down gracefully...")
-        asyncio.create_task(orchestrator.stop_development_team())
-        sys.exit(0)
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    # Handle graceful shutdown: signals only set an event, and cancelling the demo
+    # task lets run_demo's finally block stop the development team
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except (NotImplementedError, RuntimeError):
+            pass  # Not supported on this platform; Ctrl+C still raises KeyboardInterrupt
     
     try:
-        results = await orchestrator.run_demo()
+        demo_task = asyncio.create_task(orchestrator.run_demo())
+        stop_task = asyncio.create_task(stop.wait())
+        await asyncio.wait([demo_task, stop_task], return_when=asyncio.FIRST_COMPLETED)
+        stop_task.cancel()
+        if not demo_task.done():
+            print("\n🛑 Received interrupt signal. Shutting down gracefully...")
+            demo_task.cancel()
+            try:
+                await demo_task
+            except asyncio.CancelledError:
+                pass
+            return
+        results = demo_task.result()
         
         print("\n" + "=" * 60)
         print("📊 Demo Results:")
@@ -378,4 +471,11 @@ async def main():
         print(f"\n❌ Demo failed: {e}")
 
 if __name__ == "__main__":
+    # Socket-heavy demo: uvloop cuts per-await overhead on the aiohttp and Redis traffic
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(main())
\ No newline at end of file
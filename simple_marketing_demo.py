@@ -10,11 +10,13 @@ and focuses on generating marketing ideas and sending them to the development te
 import asyncio
 import json
 import logging
+import os
 import time
-import requests
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+
+import aiohttp
 
 # Setup logging
 logging.basicConfig(
@@ -23,9 +25,75 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None).encode()
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _json_nested(obj: Any, depth: int) -> bytes:
+    """Indented JSON for obj, re-indented to sit depth levels deep in a larger document."""
+    # Encoded strings never contain a raw newline, so every newline is structural
+    return _json_dumps(obj, indent=True).replace(b"\n", b"\n" + b"  " * depth)
+
+# Predefined marketing team output, built once at import; each run only stamps the timestamp
+_MARKETING_IDEAS_TEMPLATE = (
+    {
+        "id": "idea_1",
+        "category": "E-commerce Innovation",
+        "strategic_analysis": {
+            "content": "Market analysis reveals a gap in sustainable e-commerce platforms. Opportunity exists for a marketplace that prioritizes eco-friendly products and carbon-neutral shipping. Target market: environmentally conscious consumers aged 25-45 with disposable income $50k+. Competitive advantage: integrated carbon offset tracking and sustainability scoring for all products."
+        },
+        "creative_concept": {
+            "content": "Brand concept: 'EcoMarket' - A clean, green-themed marketplace with earth tones and natural imagery. Key features: sustainability badges, carbon footprint calculator, eco-friendly packaging options. Visual identity emphasizes transparency and trust through clean typography and organic shapes."
+        },
+        "ux_research": {
+            "content": "User research indicates strong preference for sustainability information at point of purchase. Recommended features: prominent eco-ratings, simplified checkout with carbon offset options, educational content about environmental impact. Mobile-first design essential for target demographic."
+        }
+    },
+    {
+        "id": "idea_2", 
+        "category": "SaaS Solution",
+        "strategic_analysis": {
+            "content": "Small businesses struggle with project management and team collaboration. Market opportunity for simplified project management SaaS targeting teams of 5-50 people. Pricing strategy: freemium model with $10/user/month premium tier. Key differentiator: AI-powered task prioritization and deadline prediction."
+        },
+        "creative_concept": {
+            "content": "Brand concept: 'TeamFlow' - Modern, professional interface with intuitive drag-and-drop functionality. Color scheme: calming blues and energizing oranges. Focus on simplicity and clarity with minimal cognitive load. Dashboard-centric design with customizable widgets."
+        },
+        "ux_research": {
+            "content": "User testing shows preference for visual project timelines and real-time collaboration features. Critical requirements: mobile app parity, offline functionality, integration with popular tools (Slack, Google Workspace). Onboarding should be completed in under 5 minutes."
+        }
+    },
+    {
+        "id": "idea_3",
+        "category": "Community Platform", 
+        "strategic_analysis": {
+            "content": "Growing demand for niche community platforms focused on skill sharing and mentorship. Target market: professionals seeking career development and knowledge exchange. Monetization: premium memberships, sponsored content, and expert consultation fees. Market size: $2B+ professional development sector."
+        },
+        "creative_concept": {
+            "content": "Brand concept: 'SkillBridge' - Professional yet approachable design emphasizing connection and growth. Visual metaphors of bridges and pathways. Color palette: trustworthy navy blue with accent colors for different skill categories. Profile-centric design showcasing expertise and achievements."
+        },
+        "ux_research": {
+            "content": "Research indicates users want structured mentorship programs and skill verification systems. Key features: mentor matching algorithm, progress tracking, peer review system. Platform should facilitate both one-on-one and group learning experiences with integrated video calling and resource sharing."
+        }
+    }
+)
+
 class SimplifiedMarketingDemo:
     """Simplified marketing demo that bypasses MCP issues."""
     
+    # Upper bound on development requests in flight at once
+    MAX_CONCURRENT_REQUESTS = 8
+    
     def __init__(self, dev_team_url: str = "http://localhost:8080"):
         """Initialize the simplified marketing demo."""
         self.dev_team_url = dev_team_url
@@ -34,146 +102,131 @@ class SimplifiedMarketingDemo:
             "development_requests": [],
             "development_responses": []
         }
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the keep-alive HTTP session shared by every development team call."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._session
         
     async def generate_marketing_ideas(self) -> List[Dict[str, Any]]:
         """Generate marketing ideas without using campfires."""
         logger.info("Generating marketing ideas...")
         
         # Simulate marketing team collaboration with predefined ideas
-        marketing_ideas = [
-            {
-                "id": "idea_1",
-                "category": "E-commerce Innovation",
-                "timestamp": datetime.now().isoformat(),
-                "strategic_analysis": {
-                    "content": "Market analysis reveals a gap in sustainable e-commerce platforms. Opportunity exists for a marketplace that prioritizes eco-friendly products and carbon-neutral shipping. Target market: environmentally conscious consumers aged 25-45 with disposable income $50k+. Competitive advantage: integrated carbon offset tracking and sustainability scoring for all products."
-                },
-                "creative_concept": {
-                    "content": "Brand concept: 'EcoMarket' - A clean, green-themed marketplace with earth tones and natural imagery. Key features: sustainability badges, carbon footprint calculator, eco-friendly packaging options. Visual identity emphasizes transparency and trust through clean typography and organic shapes."
-                },
-                "ux_research": {
-                    "content": "User research indicates strong preference for sustainability information at point of purchase. Recommended features: prominent eco-ratings, simplified checkout with carbon offset options, educational content about environmental impact. Mobile-first design essential for target demographic."
-                }
-            },
-            {
-                "id": "idea_2", 
-                "category": "SaaS Solution",
-                "timestamp": datetime.now().isoformat(),
-                "strategic_analysis": {
-                    "content": "Small businesses struggle with project management and team collaboration. Market opportunity for simplified project management SaaS targeting teams of 5-50 people. Pricing strategy: freemium model with $10/user/month premium tier. Key differentiator: AI-powered task prioritization and deadline prediction."
-                },
-                "creative_concept": {
-                    "content": "Brand concept: 'TeamFlow' - Modern, professional interface with intuitive drag-and-drop functionality. Color scheme: calming blues and energizing oranges. Focus on simplicity and clarity with minimal cognitive load. Dashboard-centric design with customizable widgets."
-                },
-                "ux_research": {
-                    "content": "User testing shows preference for visual project timelines and real-time collaboration features. Critical requirements: mobile app parity, offline functionality, integration with popular tools (Slack, Google Workspace). Onboarding should be completed in under 5 minutes."
-                }
-            },
-            {
-                "id": "idea_3",
-                "category": "Community Platform", 
-                "timestamp": datetime.now().isoformat(),
-                "strategic_analysis": {
-                    "content": "Growing demand for niche community platforms focused on skill sharing and mentorship. Target market: professionals seeking career development and knowledge exchange. Monetization: premium memberships, sponsored content, and expert consultation fees. Market size: $2B+ professional development sector."
-                },
-                "creative_concept": {
-                    "content": "Brand concept: 'SkillBridge' - Professional yet approachable design emphasizing connection and growth. Visual metaphors of bridges and pathways. Color palette: trustworthy navy blue with accent colors for different skill categories. Profile-centric design showcasing expertise and achievements."
-                },
-                "ux_research": {
-                    "content": "Research indicates users want structured mentorship programs and skill verification systems. Key features: mentor matching algorithm, progress tracking, peer review system. Platform should facilitate both one-on-one and group learning experiences with integrated video calling and resource sharing."
-                }
-            }
-        ]
+        now = datetime.now().isoformat()
+        marketing_ideas = [{**idea, "timestamp": now} for idea in _MARKETING_IDEAS_TEMPLATE]
         
         self.demo_results["marketing_ideas"] = marketing_ideas
-        logger.info(f"Generated {len(marketing_ideas)} marketing ideas")
+        logger.info("Generated %s marketing ideas", len(marketing_ideas))
         return marketing_ideas
     
-    async def send_ideas_to_development_team(self, ideas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Send marketing ideas to the development team API."""
-        logger.info("Sending ideas to development team...")
-        
-        development_results = []
-        
-        for idea in ideas:
-            try:
-                # Prepare development request matching the expected DevelopmentRequest model
-                dev_request = {
-                    "idea_id": idea["id"],
-                    "category": idea["category"],
-                    "strategic_requirements": idea["strategic_analysis"]["content"],
-                    "creative_requirements": idea["creative_concept"]["content"], 
-                    "ux_requirements": idea["ux_research"]["content"],
-                    "timestamp": idea["timestamp"],
-                    "source_team": "marketing-team"
-                }
-                
-                logger.info(f"Sending request for {idea['category']}...")
-                
-                # Send to development team API using the correct endpoint
-                response = requests.post(
-                    f"{self.dev_team_url}/api/develop_website",
-                    json=dev_request,
-                    headers={"Content-Type": "application/json"},
-                    timeout=30
-                )
-                
-                if response.status_code == 200:
-                    dev_response = response.json()
-                    development_results.append({
+    @staticmethod
+    def _build_dev_request(idea: Dict[str, Any]) -> Dict[str, Any]:
+        """Prepare a development request matching the expected DevelopmentRequest model."""
+        return {
+            "idea_id": idea["id"],
+            "category": idea["category"],
+            "strategic_requirements": idea["strategic_analysis"]["content"],
+            "creative_requirements": idea["creative_concept"]["content"], 
+            "ux_requirements": idea["ux_research"]["content"],
+            "timestamp": idea["timestamp"],
+            "source_team": "marketing-team"
+        }
+    
+    async def _post_one(self, idea: Dict[str, Any], limit: asyncio.Semaphore) -> Dict[str, Any]:
+        """Send one marketing idea to the development team API and return its result record."""
+        dev_request = None
+        try:
+            dev_request = self._build_dev_request(idea)
+            
+            logger.info("Sending request for %s...", idea['category'])
+            
+            # Send to development team API using the correct endpoint
+            async with limit, self._get_session().post(
+                f"{self.dev_team_url}/api/develop_website",
+                data=_json_dumps(dev_request),
+                headers=_JSON_HEADERS
+            ) as response:
+                if response.status == 200:
+                    dev_response = _json_loads(await response.read())
+                    logger.info("Successfully received development analysis for %s", idea['category'])
+                    return {
                         "idea_id": idea["id"],
                         "request": dev_request,
                         "response": dev_response,
                         "status": "success"
-                    })
-                    logger.info(f"Successfully received development analysis for {idea['category']}")
-                else:
-                    logger.error(f"Development team API error: {response.status_code} - {response.text}")
-                    development_results.append({
-                        "idea_id": idea["id"],
-                        "request": dev_request,
-                        "response": None,
-                        "status": "error",
-                        "error": f"HTTP {response.status_code}: {response.text}"
-                    })
-                
-                # Brief pause between requests
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Error sending idea {idea['id']} to development team: {e}")
-                development_results.append({
+                    }
+                response_text = await response.text()
+                logger.error("Development team API error: %s - %s", response.status, response_text)
+                return {
                     "idea_id": idea["id"],
                     "request": dev_request,
                     "response": None,
                     "status": "error",
-                    "error": str(e)
-                })
+                    "error": f"HTTP {response.status}: {response_text}"
+                }
+            
+        except Exception as e:
+            logger.error("Error sending idea %s to development team: %s", idea['id'], e)
+            return {
+                "idea_id": idea["id"],
+                "request": dev_request,
+                "response": None,
+                "status": "error",
+                "error": str(e)
+            }
+    
+    async def send_ideas_to_development_team(self, ideas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send marketing ideas to the development team API concurrently."""
+        logger.info("Sending ideas to development team...")
         
-        self.demo_results["development_requests"] = [r["request"] for r in development_results]
+        # Every idea is in flight at once, bounded so the dev team API is not flooded;
+        # gather keeps the results in the same order as the ideas
+        limit = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        development_results = list(await asyncio.gather(*(self._post_one(idea, limit) for idea in ideas)))
+        
+        # Each response record already carries its full request; list only the ids here
+        self.demo_results["development_requests"] = [r["idea_id"] for r in development_results]
         self.demo_results["development_responses"] = development_results
         
-        logger.info(f"Completed {len(development_results)} development requests")
+        logger.info("Completed %s development requests", len(development_results))
         return development_results
     
     async def generate_report(self) -> str:
         """Generate a simple report of the demo results."""
-        report_path = f"simplified_marketing_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        # One clock read for both the file name and the report's timestamp
+        now = datetime.now()
+        report_path = f"simplified_marketing_report_{now.strftime('%Y%m%d_%H%M%S')}.json"
         
-        report_data = {
-            "demo_timestamp": datetime.now().isoformat(),
-            "summary": {
-                "ideas_generated": len(self.demo_results["marketing_ideas"]),
-                "development_requests_sent": len(self.demo_results["development_requests"]),
-                "successful_responses": len([r for r in self.demo_results["development_responses"] if r["status"] == "success"])
-            },
-            "results": self.demo_results
+        results = self.demo_results
+        responses = results["development_responses"]
+        summary = {
+            "ideas_generated": len(results["marketing_ideas"]),
+            "development_requests_sent": len(results["development_requests"]),
+            "successful_responses": sum(1 for r in responses if r["status"] == "success")
         }
         
-        with open(report_path, 'w') as f:
-            json.dump(report_data, f, indent=2)
+        # Written field by field, one response record at a time, so the whole
+        # report is never encoded in memory at once. It goes to a sibling temp
+        # file first and is renamed into place, so readers never see partial JSON.
+        tmp_path = Path(report_path + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(b'{\n  "demo_timestamp": ' + _json_dumps(now.isoformat()))
+            f.write(b',\n  "summary": ' + _json_nested(summary, 1))
+            f.write(b',\n  "results": {\n    "marketing_ideas": ' + _json_nested(results["marketing_ideas"], 2))
+            f.write(b',\n    "development_requests": ' + _json_nested(results["development_requests"], 2))
+            f.write(b',\n    "development_responses": [')
+            for i, record in enumerate(responses):
+                f.write((b',\n      ' if i else b'\n      ') + _json_nested(record, 3))
+            f.write(b'\n    ]\n  }\n}' if responses else b']\n  }\n}')
+        os.replace(tmp_path, report_path)
         
-        logger.info(f"Report generated: {report_path}")
+        logger.info("Report generated: %s", report_path)
         return report_path
     
     async def run_demo(self):
@@ -191,7 +244,7 @@ class SimplifiedMarketingDemo:
             report_path = await self.generate_report()
             
             logger.info("Simplified marketing demo completed successfully!")
-            logger.info(f"Report available at: {report_path}")
+            logger.info("Report available at: %s", report_path)
             
             return {
                 "status": "success",
@@ -202,8 +255,11 @@ class SimplifiedMarketingDemo:
             }
             
         except Exception as e:
-            logger.error(f"Demo failed: {e}")
+            logger.error("Demo failed: %s", e)
             raise
+        finally:
+            if self._session is not None and not self._session.closed:
+                await self._session.close()
 
 async def main():
     """Main entry point for the simplified marketing demo."""
@@ -220,4 +276,11 @@ async def main():
     print("="*60)
 
 if __name__ == "__main__":
+    # Network-bound workload; uvloop's libuv loop cuts per-event scheduling overhead
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(main())
\ No newline at end of file
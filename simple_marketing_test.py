@@ -12,6 +12,19 @@ import aiohttp
 import json
 from datetime import datetime
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+DEV_TEAM_URL = "http://localhost:8080"
+
 
 async def test_development_team():
     """Send a simple test request to the development team."""
@@ -36,9 +49,9 @@ async def test_development_team():
         # Check health first
         async with aiohttp.ClientSession() as session:
             print("\n🏥 Checking development team health...")
-            async with session.get("http://localhost:8080/health") as response:
+            async with session.get(f"{DEV_TEAM_URL}/health") as response:
                 if response.status == 200:
-                    health_data = await response.json()
+                    health_data = _json_loads(await response.read())
                     print(f"✅ Health check passed: {health_data['status']}")
                 else:
                     print(f"❌ Health check failed: {response.status}")
@@ -46,14 +59,16 @@ async def test_development_team():
             
             print("\n📤 Sending development request...")
             async with session.post(
-                "http://localhost:8080/api/develop_website",
-                json=test_request,
+                f"{DEV_TEAM_URL}/api/develop_website",
+                # Pre-encoded so aiohttp sends the bytes as-is instead of running its own encoder
+                data=_json_dumps(test_request),
+                headers={"Content-Type": "application/json"},
                 timeout=aiohttp.ClientTimeout(total=60)
             ) as response:
                 print(f"📊 Response status: {response.status}")
                 
                 if response.status == 200:
-                    result = await response.json()
+                    result = _json_loads(await response.read())
                     print("✅ Request successful!")
                     print(f"📋 Response: {json.dumps(result, indent=2)}")
                 else:
@@ -68,4 +83,11 @@ async def test_development_team():
 
 
 if __name__ == "__main__":
+    # Network-bound workload; uvloop's libuv loop cuts per-event scheduling overhead
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(test_development_team())
\ No newline at end of file
@@ -0,0 +1,191 @@
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("uvicorn")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import development_team_server as server
+from campfirevalley.llm_campfire import LLMCampfire
+from campfirevalley.models import CampfireConfig, Torch
+
+
+class _ScriptedCamper:
+    def __init__(self, replies):
+        self._replies = list(replies)
+        self.calls = 0
+
+    async def process_with_llm(self, prompt, model=None):
+        self.calls += 1
+        return self._replies.pop(0) if self._replies else None
+
+
+def _llm_campfire(camper):
+    campfire = LLMCampfire.__new__(LLMCampfire)
+    campfire.config = CampfireConfig(
+        name="backend_developer",
+        type="LLMCampfire",
+        config={"llm": {"provider": "ollama", "model": "gemma4:e4b"}},
+    )
+    campfire.llm_config = SimpleNamespace(default_model="gemma4:e4b")
+    campfire.vali_coordinator = None
+    campfire._llm_camper = camper
+
+    async def _return_response(torch, prompt, response, model=None):
+        return response
+
+    campfire._maybe_run_zeitgeist_tools = _return_response
+    campfire._prepare_context_prompt = lambda torch, prompt: prompt
+    return campfire
+
+
+def _batch_torch(idea_ids):
+    return Torch(
+        claim="website_development_batch_request",
+        source_campfire="development-team-server",
+        channel="development-requests",
+        sender_valley="development-team",
+        target_address="valley:development-team/campfire:backend_developer",
+        signature="development_team_signature",
+        data={"ideas": [{"idea_id": idea_id} for idea_id in idea_ids]},
+        metadata={"idea_ids": idea_ids},
+    )
+
+
+@pytest.mark.asyncio
+async def test_split_batch_result_reads_llm_response_from_llm_campfire_torch():
+    idea_ids = ["idea-1", "idea-2"]
+    plans = {"idea-1": {"stack": "django"}, "idea-2": {"stack": "rails"}}
+    reply = "```json\n" + json.dumps(plans) + "\n```"
+    campfire = _llm_campfire(_ScriptedCamper([reply]))
+
+    result = await LLMCampfire.process_torch_with_llm(campfire, _batch_torch(idea_ids), "plan these")
+
+    assert result.data["llm_response"] == reply
+    assert server._split_batch_result(result, idea_ids) == plans
+
+
+def test_split_batch_result_returns_none_when_not_keyed_by_idea():
+    idea_ids = ["idea-1", "idea-2"]
+    torch = _batch_torch(idea_ids)
+    torch.data["llm_response"] = "One combined plan for both ideas"
+
+    assert server._split_batch_result(torch, idea_ids) is None
+
+
+def _completed_result(analyses, expected, **summary):
+    return {
+        "status": "completed",
+        "development_analysis": analyses,
+        "summary": {"expected_analyses": expected, **summary},
+    }
+
+
+def test_complete_result_is_cacheable():
+    analyses = {"backend_analysis": {"stack": "django"}}
+
+    assert server._is_cacheable_result(_completed_result(analyses, 1))
+
+
+def test_partial_result_is_not_cacheable():
+    analyses = {"backend_analysis": {"stack": "django"}, "frontend_analysis": None}
+
+    assert not server._is_cacheable_result(_completed_result(analyses, 2))
+    assert not server._is_cacheable_result(_completed_result({"backend_analysis": {"stack": "django"}}, 2))
+
+
+class _FlakyValley:
+    def __init__(self, outcomes):
+        self._outcomes = list(outcomes)
+        self.calls = 0
+
+    async def process_torch(self, torch):
+        self.calls += 1
+        outcome = self._outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    async def _no_sleep(delay):
+        return None
+
+    monkeypatch.setattr(server.asyncio, "sleep", _no_sleep)
+
+
+@pytest.mark.asyncio
+async def test_process_torch_limited_retries_when_llm_campfire_returns_none(monkeypatch, no_backoff):
+    torch = _batch_torch(["idea-1"])
+    fake_valley = _FlakyValley([None, None, torch])
+    monkeypatch.setattr(server, "valley", fake_valley)
+
+    assert await server.process_torch_limited(torch) is torch
+    assert fake_valley.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_process_torch_limited_retries_rate_limit_errors(monkeypatch, no_backoff):
+    torch = _batch_torch(["idea-1"])
+    fake_valley = _FlakyValley([RuntimeError("HTTP 429 Too Many Requests"), torch])
+    monkeypatch.setattr(server, "valley", fake_valley)
+
+    assert await server.process_torch_limited(torch) is torch
+    assert fake_valley.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_process_torch_limited_gives_up_after_retry_budget(monkeypatch, no_backoff):
+    torch = _batch_torch(["idea-1"])
+    fake_valley = _FlakyValley([None] * server.LLM_RETRY_ATTEMPTS)
+    monkeypatch.setattr(server, "valley", fake_valley)
+
+    assert await server.process_torch_limited(torch) is None
+    assert fake_valley.calls == server.LLM_RETRY_ATTEMPTS
+
+
+def _development_request(idea_id, requirements):
+    return server.DevelopmentRequest(
+        idea_id=idea_id,
+        category="E-commerce",
+        strategic_requirements=requirements,
+        creative_requirements=requirements,
+        ux_requirements=requirements,
+        timestamp="2026-01-01T00:00:00",
+        source_team="marketing-team",
+    )
+
+
+@pytest.mark.asyncio
+async def test_unsplittable_batch_is_processed_per_request(monkeypatch):
+    class _Valley:
+        def get_campfires(self):
+            return {"backend_developer": object()}
+
+    async def _process_torch(torch):
+        if torch.claim == "website_development_batch_request":
+            torch.data["llm_response"] = "One combined plan for every caller"
+        else:
+            torch.data["llm_response"] = f"Plan for {torch.data['strategic_requirements']}"
+        return torch
+
+    monkeypatch.setattr(server, "valley", _Valley())
+    monkeypatch.setattr(server, "process_torch_limited", _process_torch)
+
+    results = await server.process_development_batch([
+        _development_request("idea-1", "caller one secret"),
+        _development_request("idea-2", "caller two secret"),
+    ])
+
+    first = results[0]["development_analysis"]["backend_analysis"].data
+    second = results[1]["development_analysis"]["backend_analysis"].data
+    assert first["llm_response"] == "Plan for caller one secret"
+    assert second["llm_response"] == "Plan for caller two secret"
+    assert "caller two secret" not in json.dumps(first)
+    assert "caller one secret" not in json.dumps(second)
@@ -308,6 +308,25 @@ class TestHierarchicalPartyBox:
             assert any(att["filename"] == "file1.txt" for att in attachments)
             assert any(att["filename"] == "file2.txt" for att in attachments)
     
+    @pytest.mark.asyncio
+    async def test_store_attachments_batch_and_get_all_stats(self):
+        """Test batch-storing attachments and fetching listing plus stats together."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            party_box = HierarchicalPartyBox(temp_dir)
+            
+            torch_id = "test_torch"
+            
+            # Store multiple attachments in one call
+            ids = await party_box.store_attachments_batch(
+                torch_id, [("file1.txt", b"data1"), ("file2.txt", b"data2")]
+            )
+            assert ids == [f"{torch_id}_file1.txt", f"{torch_id}_file2.txt"]
+            
+            all_stats = await party_box.get_all_stats(torch_id)
+            assert len(all_stats["attachments"]) == 2
+            assert {att["filename"] for att in all_stats["attachments"]} == {"file1.txt", "file2.txt"}
+            assert all_stats["storage_stats"]["total_objects"] == 2
+    
     @pytest.mark.asyncio
     async def test_delete_attachment(self):
         """Test deleting attachments."""
@@ -0,0 +1,234 @@
+"""
+Tests for RedisMCPBroker write coalescing, unconfirmed publishes and subscribe confirmation.
+
+The broker talks to an in-memory fake of the redis.asyncio client, so no Redis
+server is needed.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import campfirevalley.mcp as mcp
+from campfirevalley.mcp import RedisMCPBroker
+
+
+class FakeResponseError(Exception):
+    """Stand-in for redis.exceptions.ResponseError."""
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._commands = []
+
+    def publish(self, channel, message):
+        self._commands.append(("publish", channel, message))
+
+    def lpush(self, key, value):
+        self._commands.append(("lpush", key, value))
+
+    async def execute(self, raise_on_error=True):
+        self._client.pipelines.append(list(self._commands))
+        if self._client.execute_gate is not None:
+            await self._client.execute_gate.wait()
+        results = [self._client.apply(*command) for command in self._commands]
+        if raise_on_error:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return results
+
+
+class FakePubSub:
+    def __init__(self, client):
+        self._client = client
+        self._messages = []
+        self.channels = []
+
+    async def subscribe(self, channel):
+        self.channels.append(channel)
+        if self._client.confirm_subscriptions:
+            self._messages.append({"type": "subscribe", "channel": channel, "data": len(self.channels)})
+
+    async def get_message(self, timeout=None):
+        if self._messages:
+            return self._messages.pop(0)
+        await asyncio.sleep(0.01)
+        return None
+
+    async def close(self):
+        pass
+
+
+class FakeRedis:
+    def __init__(self):
+        self.pipelines = []
+        self.lists = {}
+        self.published = []
+        self.wrong_type_keys = set()
+        self.fail_publish = False
+        self.confirm_subscriptions = True
+        self.execute_gate = None
+
+    async def ping(self):
+        return True
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def apply(self, command, key, value):
+        if command == "lpush":
+            if key in self.wrong_type_keys:
+                return FakeResponseError("WRONGTYPE Operation against a key holding the wrong kind of value")
+            self.lists.setdefault(key, []).insert(0, value)
+            return len(self.lists[key])
+        self.published.append((key, value))
+        return 1
+
+    async def publish(self, channel, message):
+        if self.fail_publish:
+            raise ConnectionError("connection reset")
+        return self.apply("publish", channel, message)
+
+    async def lpush(self, key, value):
+        result = self.apply("lpush", key, value)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    client = FakeRedis()
+
+    async def _no_heartbeat(self):
+        return None
+
+    monkeypatch.setattr(mcp, "REDIS_AVAILABLE", True)
+    monkeypatch.setattr(mcp, "redis", SimpleNamespace(from_url=lambda url, **kwargs: client), raising=False)
+    monkeypatch.setattr(RedisMCPBroker, "_heartbeat_loop", _no_heartbeat)
+    return client
+
+
+async def _connected_broker(transport="direct"):
+    broker = RedisMCPBroker(valley_name="TestValley", transport=transport)
+    assert await broker.connect()
+    return broker
+
+
+class TestPipelinedTransport:
+    """Test cases for the pipelined write coalescer"""
+
+    @pytest.mark.asyncio
+    async def test_writes_in_one_tick_share_a_pipeline(self, fake_redis):
+        broker = await _connected_broker("pipelined")
+
+        results = await asyncio.gather(*(broker._write("lpush", "queue", f"m{i}") for i in range(3)))
+
+        assert results == [1, 2, 3]
+        assert len(fake_redis.pipelines) == 1
+        assert [command[2] for command in fake_redis.pipelines[0]] == ["m0", "m1", "m2"]
+        await broker.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_failing_command_only_fails_its_own_caller(self, fake_redis):
+        broker = await _connected_broker("pipelined")
+        fake_redis.wrong_type_keys.add("not-a-list")
+
+        results = await asyncio.gather(
+            broker._write("publish", "channel", "first"),
+            broker._write("lpush", "not-a-list", "bad"),
+            broker._write("publish", "channel", "second"),
+            return_exceptions=True,
+        )
+
+        assert results[0] == 1
+        assert isinstance(results[1], FakeResponseError)
+        assert results[2] == 1
+        assert fake_redis.published == [("channel", "first"), ("channel", "second")]
+        await broker.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_fails_queued_and_in_flight_writes(self, fake_redis):
+        broker = await _connected_broker("pipelined")
+        fake_redis.execute_gate = asyncio.Event()
+
+        in_flight = asyncio.create_task(broker._write("publish", "channel", "in-flight"))
+        await asyncio.sleep(0.01)
+        queued = [asyncio.create_task(broker._write("publish", "channel", f"queued{i}")) for i in range(2)]
+        await asyncio.sleep(0)
+
+        assert await broker.disconnect()
+        results = await asyncio.wait_for(
+            asyncio.gather(in_flight, *queued, return_exceptions=True), timeout=1
+        )
+
+        assert all(isinstance(result, ConnectionError) for result in results)
+
+
+class TestUnconfirmedPublish:
+    """Test cases for confirm=False publishes"""
+
+    @pytest.mark.asyncio
+    async def test_failed_unconfirmed_publish_moves_to_errors(self, fake_redis):
+        broker = await _connected_broker()
+        fake_redis.fail_publish = True
+
+        assert await broker.publish("channel", {"hello": "world"}, confirm=False)
+        assert broker._message_stats["sent"] == 1
+
+        await asyncio.gather(*broker._unconfirmed_writes, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert broker._message_stats["sent"] == 0
+        assert broker._message_stats["errors"] == 1
+        assert not broker._unconfirmed_writes
+        await broker.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_publish_many_sends_one_pipeline(self, fake_redis):
+        broker = await _connected_broker()
+
+        assert await broker.publish_many("channel", [{"n": 1}, {"n": 2}])
+
+        assert len(fake_redis.pipelines) == 1
+        assert len(fake_redis.published) == 2
+        assert broker._message_stats["sent"] == 2
+        await broker.disconnect()
+
+
+class TestSubscribeConfirmation:
+    """Test cases for subscribe(confirm=True)"""
+
+    @pytest.mark.asyncio
+    async def test_waiter_resolves_on_subscribe_message(self, fake_redis):
+        broker = await _connected_broker()
+
+        async def callback(channel, data):
+            pass
+
+        assert await asyncio.wait_for(broker.subscribe("updates", callback, confirm=True), timeout=1)
+        assert "updates" in broker._subscriptions
+        assert not broker._subscribe_waiters
+        await broker.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_waiter_times_out_without_confirmation(self, fake_redis):
+        broker = await _connected_broker()
+        broker.SUBSCRIBE_CONFIRM_TIMEOUT = 0.05
+        fake_redis.confirm_subscriptions = False
+
+        async def callback(channel, data):
+            pass
+
+        assert not await broker.subscribe("updates", callback, confirm=True)
+        assert not broker._subscribe_waiters
+        await broker.disconnect()
@@ -138,6 +138,18 @@ class TestInMemoryMetricsCollector:
         assert len(self.collector.metrics) == 1
         assert self.collector.metrics[0] == metric
     
+    @pytest.mark.asyncio
+    async def test_record_metrics(self):
+        """Test recording a batch of metrics"""
+        metrics = [
+            Metric(name="metric1", value=10, metric_type=MetricType.GAUGE),
+            Metric(name="metric2", value=20, metric_type=MetricType.COUNTER)
+        ]
+        
+        await self.collector.record_metrics(metrics)
+        
+        assert self.collector.metrics == metrics
+    
     @pytest.mark.asyncio
     async def test_get_metrics(self):
         """Test getting metrics"""
@@ -553,6 +565,24 @@ class TestMonitoringSystem:
             assert metric.metric_type == MetricType.GAUGE
             assert metric.tags == {"env": "test"}
     
+    @pytest.mark.asyncio
+    async def test_record_metrics_batch(self):
+        """Test recording several metrics in one batch"""
+        await self.monitoring_system.initialize()
+        
+        with patch.object(self.monitoring_system.metrics_collector, 'record_metrics') as mock_record:
+            await self.monitoring_system.record_metrics_batch([
+                ("metric1", 1, {"env": "test"}),
+                ("metric2", 2.5, None)
+            ])
+            
+            mock_record.assert_called_once()
+            metrics = mock_record.call_args[0][0]
+            assert [m.name for m in metrics] == ["metric1", "metric2"]
+            assert [m.value for m in metrics] == [1, 2.5]
+            assert all(m.metric_type == MetricType.GAUGE for m in metrics)
+            assert metrics[1].tags == {}
+    
     @pytest.mark.asyncio
     async def test_send_alert(self):
         """Test sending alerts"""
@@ -11,9 +11,12 @@ Perfect for Docker deployment and demonstration purposes.
 """
 
 import asyncio
+import atexit
 import logging
 import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 # Add the project root to Python path
@@ -25,13 +28,21 @@ from campfirevalley.valley import Valley
 from campfirevalley.models import CampfireConfig
 from campfirevalley.web.api import run_web_server
 
-# Configure logging
+# Configure logging; records are handed to a background listener thread so
+# stream I/O never blocks the event loop. QueueHandler renders each message
+# before queuing it, so later changes to its arguments are not logged.
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_log_stream_handler = logging.StreamHandler(sys.stdout)
+_log_stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
+_log_listener = QueueListener(_log_queue, _log_stream_handler, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
@@ -54,15 +65,17 @@ async def create_demo_valley():
         CampfireConfig(name="DevOps Team", description="Infrastructure and deployment"),
     ]
     
-    # Provision campfires in valley
-    for config in configs:
+    # Provision campfires in valley concurrently; a failure only skips that campfire
+    async def provision(config: CampfireConfig) -> None:
         try:
             await valley.provision_campfire(config)
-            logger.info(f"Provisioned campfire: {config.name}")
+            logger.info("Provisioned campfire: %s", config.name)
         except Exception as e:
-            logger.warning(f"Failed to provision campfire {config.name}: {e}")
+            logger.warning("Failed to provision campfire %s: %s", config.name, e)
     
-    logger.info(f"Demo valley created with {len(valley.campfires)} campfires")
+    await asyncio.gather(*(provision(config) for config in configs))
+    
+    logger.info("Demo valley created with %s campfires", len(valley.campfires))
     return valley
 
 
@@ -78,14 +91,14 @@ async def main():
         host = os.getenv("CAMPFIRE_VALLEY_HOST", "0.0.0.0")
         port = int(os.getenv("CAMPFIRE_VALLEY_PORT", "8080"))
         
-        logger.info(f"Starting web server on {host}:{port}")
-        logger.info(f"Web interface will be available at: http://{host}:{port}")
+        logger.info("Starting web server on %s:%s", host, port)
+        logger.info("Web interface will be available at: http://%s:%s", host, port)
         
         # Start the web server with the valley
         await run_web_server(valley, host=host, port=port)
         
     except Exception as e:
-        logger.error(f"Error starting valley with web server: {e}")
+        logger.error("Error starting valley with web server: %s", e)
         raise
 
 
@@ -93,5 +106,12 @@ if __name__ == "__main__":
     # Ensure log directory exists
     os.makedirs("/app/logs", exist_ok=True)
     
+    # Network-bound workload; uvloop's libuv loop cuts per-event scheduling overhead
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     # Run the main function
     asyncio.run(main())
\ No newline at end of file